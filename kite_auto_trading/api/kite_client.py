@@ -23,7 +23,10 @@ from kiteconnect.exceptions import (
 )
 
 from kite_auto_trading.api.base import TradingAPIClient, MarketDataAPIClient
-from kite_auto_trading.models.base import Order, Position, OrderStatus, TransactionType, OrderType
+from kite_auto_trading.models.base import (
+    Order, Position, OrderStatus, TransactionType, OrderType,
+    PRICED_ORDER_TYPES, TRIGGER_ORDER_TYPES,
+)
 from kite_auto_trading.config.models import APIConfig
 
 
@@ -126,7 +129,8 @@ class KiteAPIClient(TradingAPIClient, MarketDataAPIClient):
                 status_forcelist=[429, 500, 502, 503, 504],
             )
             
-            adapter = HTTPAdapter(max_retries=retry_strategy)
+            # Pool sized for concurrent calls such as OrderManager.cancel_orders
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=32)
             self.kite.reqsession.mount("http://", adapter)
             self.kite.reqsession.mount("https://", adapter)
             self.kite.reqsession.timeout = self.config.timeout
@@ -355,13 +359,13 @@ class KiteAPIClient(TradingAPIClient, MarketDataAPIClient):
             }
             
             # Add price for limit orders
-            if order.order_type in [OrderType.LIMIT, OrderType.SL]:
+            if order.order_type in PRICED_ORDER_TYPES:
                 if order.price is None:
                     raise ValueError("Price is required for LIMIT and SL orders")
                 order_params['price'] = order.price
             
             # Add trigger price for stop-loss orders
-            if order.order_type in [OrderType.SL, OrderType.SL_M]:
+            if order.order_type in TRIGGER_ORDER_TYPES:
                 if order.trigger_price is None:
                     raise ValueError("Trigger price is required for SL and SL-M orders")
                 order_params['trigger_price'] = order.trigger_price
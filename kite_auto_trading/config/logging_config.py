@@ -2,19 +2,82 @@
 Logging configuration for Kite Auto Trading application.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from .constants import DEFAULT_LOG_PATH, LOG_LEVEL_INFO
 
 
+# Listener draining the root logger's queue when background logging is on
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that snapshots records on the calling thread.
+    
+    Plain messages are formatted exactly as the stock QueueHandler does.
+    Structured dict messages are deep-copied instead, so JSONFormatter can
+    still serialize them on the listener thread without seeing later
+    changes the caller makes to the dict or its values.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if not isinstance(record.msg, dict):
+            return super().prepare(record)
+        
+        message = record.msg
+        try:
+            message = copy.deepcopy(message)
+        except Exception:
+            # Values that cannot be copied are still shared; keys are not
+            message = dict(message)
+        
+        record = copy.copy(record)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+def start_queue_listener(
+    logger: logging.Logger,
+    handlers: List[logging.Handler]
+) -> logging.handlers.QueueListener:
+    """
+    Route a logger's records to its handlers through a background listener.
+    
+    Args:
+        logger: Logger that only enqueues records
+        handlers: Handlers run on the listener thread
+        
+    Returns:
+        Started listener; the caller is responsible for stopping it
+    """
+    record_queue = queue.SimpleQueue()
+    logger.addHandler(_RecordQueueHandler(record_queue))
+    listener = logging.handlers.QueueListener(
+        record_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
 def setup_logging(config: Dict[str, Any] = None) -> None:
     """
     Set up logging configuration for the application.
     
+    With ``background`` enabled (the default) the console and file handlers
+    run on a QueueListener thread, so callers only enqueue the record and
+    never block on formatting or file I/O.
+    
     Args:
         config: Logging configuration dictionary
     """
@@ -36,6 +99,8 @@ def setup_logging(config: Dict[str, Any] = None) -> None:
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
+    _stop_queue_listener()
+    handlers = []
     
     # Add console handler if enabled
     if config.get('console_output', True):
@@ -43,7 +108,7 @@ def setup_logging(config: Dict[str, Any] = None) -> None:
         console_handler.setLevel(getattr(logging, config.get('level', LOG_LEVEL_INFO)))
         console_formatter = logging.Formatter(config.get('format'))
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Add file handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -55,7 +120,14 @@ def setup_logging(config: Dict[str, Any] = None) -> None:
     file_handler.setLevel(getattr(logging, config.get('level', LOG_LEVEL_INFO)))
     file_formatter = logging.Formatter(config.get('format'))
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
+    
+    if config.get('background', True):
+        global _queue_listener
+        _queue_listener = start_queue_listener(root_logger, handlers)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
     
     # Set specific logger levels
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -75,10 +147,25 @@ def get_default_logging_config() -> Dict[str, Any]:
         'file_path': DEFAULT_LOG_PATH,
         'max_file_size': '10MB',
         'backup_count': 5,
-        'console_output': True
+        'console_output': True,
+        'background': True
     }
 
 
+def _stop_queue_listener() -> None:
+    """Stop the background listener, writing out any records still queued."""
+    global _queue_listener
+    if _queue_listener is not None:
+        # stop() drains the queue before joining the listener thread
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def _parse_file_size(size_str: str) -> int:
     """
     Parse file size string to bytes.
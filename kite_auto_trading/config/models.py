@@ -54,6 +54,8 @@ class MarketDataConfig:
     reconnect_interval: int = 10
     max_reconnect_attempts: int = 5
     timeout: int = 30
+    batch_size: int = 64
+    batch_ms: float = 1.0
 
 
 @dataclass
@@ -107,6 +109,7 @@ class MonitoringConfig:
     """Monitoring and alerting configuration."""
     performance_metrics_interval: int = 300  # seconds
     health_check_interval: int = 60  # seconds
+    status_cache_ttl: float = 0.25  # seconds, 0 disables caching
     alert_thresholds: AlertThresholds = field(default_factory=AlertThresholds)
 
 
@@ -170,12 +173,18 @@ class TradingConfig:
             errors.append("Market data buffer_size must be positive")
         if self.market_data.reconnect_interval <= 0:
             errors.append("Market data reconnect_interval must be positive")
+        if self.market_data.batch_size <= 0:
+            errors.append("Market data batch_size must be positive")
+        if self.market_data.batch_ms < 0:
+            errors.append("Market data batch_ms must be non-negative")
         
         # Validate monitoring
         if self.monitoring.performance_metrics_interval <= 0:
             errors.append("Monitoring performance_metrics_interval must be positive")
         if self.monitoring.health_check_interval <= 0:
             errors.append("Monitoring health_check_interval must be positive")
+        if self.monitoring.status_cache_ttl < 0:
+            errors.append("Monitoring status_cache_ttl must be non-negative")
         
         return errors
 
@@ -8,8 +8,9 @@ import signal
 import argparse
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 # Add the project root to Python path
@@ -37,6 +38,7 @@ class KiteAutoTradingApp:
     def __init__(self, config_path: str = "config.yaml", dry_run: bool = False, log_level: str = "INFO"):
         """Initialize the application."""
         self.config_path = config_path
+        self._config_path = Path(config_path)
         self.dry_run = dry_run
         self.log_level = log_level
         self.logger: Optional[logging.Logger] = None
@@ -59,6 +61,10 @@ class KiteAutoTradingApp:
         self._config_watch_thread: Optional[threading.Thread] = None
         self._config_reload_event = threading.Event()
         
+        # Status snapshot cache: (monotonic timestamp, status)
+        self._status_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        self._status_cache_ttl = 0.25
+        
         # Configuration hot-reload
         self._config_last_modified = None
         self._config_watch_enabled = False
@@ -75,6 +81,7 @@ class KiteAutoTradingApp:
         if self.logger:
             self.logger.info(f"Received signal {signum}, initiating shutdown...")
         self.running = False
+        self._invalidate_status_cache()
         self._stop_event.set()
     
     def initialize(self):
@@ -148,11 +155,11 @@ class KiteAutoTradingApp:
             self.logger.info("Loading configuration...")
             self.config_loader = ConfigLoader(self.config_path)
             self.config = self.config_loader.load_config()
+            self._status_cache_ttl = self.config.monitoring.status_cache_ttl
             
             # Track config file modification time
-            config_file = Path(self.config_path)
-            if config_file.exists():
-                self._config_last_modified = config_file.stat().st_mtime
+            if self._config_path.exists():
+                self._config_last_modified = self._config_path.stat().st_mtime
             
             self.logger.info("Configuration loaded successfully")
         except Exception as e:
@@ -247,11 +254,13 @@ class KiteAutoTradingApp:
                 api_client=self.api_client,
                 buffer_size=self.config.market_data.buffer_size,
                 reconnect_interval=self.config.market_data.reconnect_interval,
-                max_reconnect_attempts=self.config.market_data.max_reconnect_attempts
+                max_reconnect_attempts=self.config.market_data.max_reconnect_attempts,
+                batch_size=self.config.market_data.batch_size,
+                batch_ms=self.config.market_data.batch_ms
             )
             
             # Register callbacks
-            self.market_data_feed.register_callback('tick', self._handle_market_tick)
+            self.market_data_feed.register_callback('ticks', self._handle_market_ticks)
             self.market_data_feed.register_callback('connect', self._handle_market_connect)
             self.market_data_feed.register_callback('disconnect', self._handle_market_disconnect)
             self.market_data_feed.register_callback('error', self._handle_market_error)
@@ -346,6 +355,7 @@ class KiteAutoTradingApp:
         """Run the main application loop."""
         self.logger.info("Starting main application loop...")
         self.running = True
+        self._invalidate_status_cache()
         
         if self.dry_run:
             self.logger.info("Running in DRY RUN mode - no real trades will be executed")
@@ -443,10 +453,9 @@ class KiteAutoTradingApp:
             
             # Create order from signal
             from kite_auto_trading.models.base import Order, TransactionType, OrderType
-            from kite_auto_trading.models.signals import SignalType
             
             # Determine transaction type from signal
-            if signal.signal_type in [SignalType.ENTRY_LONG, SignalType.EXIT_SHORT]:
+            if signal.is_long_signal():
                 transaction_type = TransactionType.BUY
             else:
                 transaction_type = TransactionType.SELL
@@ -512,10 +521,12 @@ class KiteAutoTradingApp:
     
     def _handle_order_update(self, update):
         """Handle order status updates."""
+        self._invalidate_status_cache()
         self.logger.info(f"Order update: {update.order_id} -> {update.status.value}")
     
     def _handle_fill_update(self, fill):
         """Handle order fill updates."""
+        self._invalidate_status_cache()
         self.logger.info(f"Order fill: {fill.order_id} - {fill.quantity}@{fill.price}")
         
         # Update portfolio with trade
@@ -529,6 +540,11 @@ class KiteAutoTradingApp:
         }
         # self.portfolio_manager.update_position(trade_data)
     
+    def _handle_market_ticks(self, ticks):
+        """Handle a batch of market data ticks."""
+        for tick in ticks:
+            self._handle_market_tick(tick)
+    
     def _handle_market_tick(self, tick):
         """Handle market data tick."""
         # Update portfolio with current prices
@@ -558,14 +574,12 @@ class KiteAutoTradingApp:
         # Cancel all pending orders
         if self.order_manager:
             pending_orders = self.order_manager.get_pending_orders()
-            for order in pending_orders:
-                try:
-                    self.order_manager.cancel_order(order.order_id)
-                except Exception as e:
-                    self.logger.error(f"Failed to cancel order {order.order_id}: {e}")
+            if pending_orders:
+                self._cancel_orders([order.order_id for order in pending_orders])
         
         # Stop trading
         self.running = False
+        self._invalidate_status_cache()
         self._stop_event.set()
     
     # Configuration Hot-Reloading
@@ -598,9 +612,8 @@ class KiteAutoTradingApp:
         
         while self._config_watch_enabled and not self._stop_event.is_set():
             try:
-                config_file = Path(self.config_path)
-                if config_file.exists():
-                    current_mtime = config_file.stat().st_mtime
+                if self._config_path.exists():
+                    current_mtime = self._config_path.stat().st_mtime
                     
                     if self._config_last_modified and current_mtime > self._config_last_modified:
                         self.logger.info("Configuration file changed, reloading...")
@@ -649,6 +662,7 @@ class KiteAutoTradingApp:
             # Update monitoring thresholds
             if old_config.monitoring != new_config.monitoring:
                 self.logger.info("Updating monitoring configuration...")
+                self._status_cache_ttl = new_config.monitoring.status_cache_ttl
                 if self.monitoring_service:
                     self.monitoring_service.alert_thresholds = {
                         'max_drawdown_pct': new_config.monitoring.alert_thresholds.drawdown_percent,
@@ -741,9 +755,21 @@ class KiteAutoTradingApp:
         """
         Get comprehensive application status.
         
+        The status is cached for ``monitoring.status_cache_ttl`` seconds so
+        frequent polling does not re-aggregate every component. The cache
+        is invalidated on order and fill updates and when ``running``
+        changes. Each call returns a fresh top-level dict; the nested
+        component dicts are shared with the cache and must be treated as
+        read-only.
+        
         Returns:
             Dictionary with application status
         """
+        now = time.monotonic()
+        cached_at, cached = self._status_cache
+        if cached is not None and now - cached_at < self._status_cache_ttl:
+            return dict(cached)
+        
         status = {
             'running': self.running,
             'dry_run': self.dry_run,
@@ -769,11 +795,16 @@ class KiteAutoTradingApp:
         # Add order manager stats
         if self.order_manager:
             status['orders'] = {
-                'pending': len(self.order_manager.get_pending_orders()),
-                'open': len(self.order_manager.get_open_orders()),
+                'pending': self.order_manager.pending_count(),
+                'open': self.order_manager.open_count(),
             }
         
-        return status
+        self._status_cache = (now, status)
+        return dict(status)
+    
+    def _invalidate_status_cache(self):
+        """Drop the cached application status."""
+        self._status_cache = (0.0, None)
     
     def get_performance_report(self) -> Dict[str, Any]:
         """
@@ -819,6 +850,7 @@ class KiteAutoTradingApp:
         if success:
             self.logger.info("Emergency stop cleared, trading resumed")
             self.running = True
+            self._invalidate_status_cache()
             self._stop_event.clear()
         else:
             self.logger.warning("No active emergency stop to clear")
@@ -835,32 +867,23 @@ class KiteAutoTradingApp:
                 if self._config_watch_enabled:
                     self.disable_config_hot_reload()
                 
-                # Stop monitoring service
+                # Stop monitoring, market data and order processing concurrently;
+                # they are independent and each may block on a thread join
+                stop_tasks = {}
                 if self.monitoring_service:
-                    self.monitoring_service.stop_monitoring()
-                    self.logger.info("Monitoring service stopped")
-                
-                # Stop market data feed
+                    stop_tasks["Monitoring service stopped"] = self.monitoring_service.stop_monitoring
                 if self.market_data_feed:
-                    self.market_data_feed.disconnect()
-                    self.logger.info("Market data feed disconnected")
-                
-                # Stop order manager
+                    stop_tasks["Market data feed disconnected"] = self.market_data_feed.disconnect
                 if self.order_manager:
-                    self.order_manager.stop_queue_processing()
-                    self.order_manager.stop_execution_monitoring()
-                    self.logger.info("Order manager stopped")
+                    stop_tasks["Order manager stopped"] = self._stop_order_manager
+                self._run_concurrently(stop_tasks)
                 
                 # Cancel pending orders
-                if self.order_manager and not self.dry_run:
+                if self.order_manager and not self.dry_run and self.order_manager.pending_count():
                     pending_orders = self.order_manager.get_pending_orders()
                     if pending_orders:
                         self.logger.info(f"Cancelling {len(pending_orders)} pending orders...")
-                        for order in pending_orders:
-                            try:
-                                self.order_manager.cancel_order(order.order_id)
-                            except Exception as e:
-                                self.logger.error(f"Failed to cancel order: {e}")
+                        self._cancel_orders([order.order_id for order in pending_orders])
                 
                 # Generate final portfolio report
                 if self.portfolio_manager:
@@ -874,6 +897,91 @@ class KiteAutoTradingApp:
                 
             except Exception as e:
                 self.logger.error(f"Error during shutdown: {e}", exc_info=True)
+    
+    def _stop_order_manager(self):
+        """Stop order queue processing and execution monitoring."""
+        self.order_manager.stop_queue_processing()
+        self.order_manager.stop_execution_monitoring()
+    
+    def _cancel_orders(self, order_ids: List[str]):
+        """Cancel orders in one batch and log any that failed."""
+        try:
+            results = self.order_manager.cancel_orders(order_ids)
+        except Exception as e:
+            self.logger.error(f"Failed to cancel orders: {e}")
+            return
+        
+        failed = [order_id for order_id, cancelled in results.items() if not cancelled]
+        if failed:
+            self.logger.error(f"Failed to cancel {len(failed)} orders: {', '.join(failed)}")
+    
+    def _run_concurrently(self, tasks: Dict[str, Any]):
+        """
+        Run independent shutdown steps in parallel and wait for all of them.
+        
+        Args:
+            tasks: Mapping of completion log message to callable
+        """
+        if not tasks:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {executor.submit(task): message for message, task in tasks.items()}
+            wait(futures)
+        
+        for future, message in futures.items():
+            error = future.exception()
+            if error is not None:
+                self.logger.error(f"Error during shutdown: {error}", exc_info=error)
+            else:
+                self.logger.info(message)
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once and reuse it across main() calls."""
+    global _PARSER
+    if _PARSER is None:
+        parser = argparse.ArgumentParser(
+            description="Kite Auto-Trading Application",
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog="""
+Examples:
+  python -m kite_auto_trading.main --config config.yaml
+  python -m kite_auto_trading.main --dry-run --config test_config.yaml
+            """
+        )
+        
+        parser.add_argument(
+            "--config",
+            type=str,
+            default="config.yaml",
+            help="Path to configuration file (default: config.yaml)"
+        )
+        
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Run in simulation mode without executing real trades"
+        )
+        
+        parser.add_argument(
+            "--log-level",
+            choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+            default="INFO",
+            help="Set logging level (default: INFO)"
+        )
+        
+        parser.add_argument(
+            "--version",
+            action="version",
+            version=f"%(prog)s {APP_VERSION}"
+        )
+        
+        _PARSER = parser
+    return _PARSER
 
 
 def main(args: Optional[list] = None) -> int:
@@ -886,43 +994,7 @@ def main(args: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
-    parser = argparse.ArgumentParser(
-        description="Kite Auto-Trading Application",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python -m kite_auto_trading.main --config config.yaml
-  python -m kite_auto_trading.main --dry-run --config test_config.yaml
-        """
-    )
-    
-    parser.add_argument(
-        "--config",
-        type=str,
-        default="config.yaml",
-        help="Path to configuration file (default: config.yaml)"
-    )
-    
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Run in simulation mode without executing real trades"
-    )
-    
-    parser.add_argument(
-        "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
-        help="Set logging level (default: INFO)"
-    )
-    
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {APP_VERSION}"
-    )
-    
-    parsed_args = parser.parse_args(args)
+    parsed_args = _get_parser().parse_args(args)
     
     app = KiteAutoTradingApp(
         config_path=parsed_args.config,
@@ -4,6 +4,8 @@ Data models for the Kite Auto-Trading application.
 This module contains all data structures and models used throughout the application.
 """
 
+import importlib
+
 from .base import (
     Order,
     Position,
@@ -12,30 +14,55 @@ from .base import (
     OrderType,
     TransactionType,
     OrderStatus,
+    PRICED_ORDER_TYPES,
+    TRIGGER_ORDER_TYPES,
+    ACTIVE_ORDER_STATUSES,
+    TERMINAL_ORDER_STATUSES,
     MarketDataProvider,
     OrderExecutor,
     RiskManager,
     Strategy,
 )
 
-from .market_data import (
-    Tick,
-    OHLC,
-    Instrument,
-    InstrumentType,
-    MarketDepth,
-    validate_tick_data,
-    validate_ohlc_data,
-    clean_tick_data,
-    clean_ohlc_data,
-)
+# Lazily exported name -> submodule that defines it. market_data pulls in
+# NumPy, so it is only imported when one of its names is first used.
+_LAZY = {
+    'Tick': 'market_data',
+    'TickBatch': 'market_data',
+    'TICK_FIELDS': 'market_data',
+    'pack_tick': 'market_data',
+    'unpack_tick': 'market_data',
+    'OHLC': 'market_data',
+    'Instrument': 'market_data',
+    'InstrumentType': 'market_data',
+    'MarketDepth': 'market_data',
+    'DEPTH_DTYPE': 'market_data',
+    'validate_tick_data': 'market_data',
+    'validate_tick_batch': 'market_data',
+    'validate_ohlc_data': 'market_data',
+    'validate_ohlc_array': 'market_data',
+    'clean_tick_data': 'market_data',
+    'decode_ticks': 'market_data',
+    'clean_ohlc_data': 'market_data',
+    'TradingSignal': 'signals',
+    'SignalType': 'signals',
+    'SignalStrength': 'signals',
+    'StrategyParameters': 'signals',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-from .signals import (
-    TradingSignal,
-    SignalType,
-    SignalStrength,
-    StrategyParameters,
-)
 
 __all__ = [
     'Order',
@@ -45,18 +72,30 @@ __all__ = [
     'OrderType',
     'TransactionType',
     'OrderStatus',
+    'PRICED_ORDER_TYPES',
+    'TRIGGER_ORDER_TYPES',
+    'ACTIVE_ORDER_STATUSES',
+    'TERMINAL_ORDER_STATUSES',
     'MarketDataProvider',
     'OrderExecutor',
     'RiskManager',
     'Strategy',
     'Tick',
+    'TickBatch',
+    'TICK_FIELDS',
+    'pack_tick',
+    'unpack_tick',
     'OHLC',
     'Instrument',
     'InstrumentType',
     'MarketDepth',
+    'DEPTH_DTYPE',
     'validate_tick_data',
+    'validate_tick_batch',
     'validate_ohlc_data',
+    'validate_ohlc_array',
     'clean_tick_data',
+    'decode_ticks',
     'clean_ohlc_data',
     'TradingSignal',
     'SignalType',
@@ -2,12 +2,21 @@
 Base data models and interfaces for the Kite Auto-Trading application.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .signals import TradingSignal
+
+
+def _intern(value: Any) -> Any:
+    """Intern identifier strings so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
 
 class OrderType(Enum):
     """Order types supported by the system."""
@@ -32,7 +41,19 @@ class OrderStatus(Enum):
     REJECTED = "REJECTED"
 
 
-@dataclass
+# Enum groupings used in membership checks. Enum values stay strings since
+# they are what the Kite API, logs and audit trail carry on the wire.
+PRICED_ORDER_TYPES = frozenset({OrderType.LIMIT, OrderType.SL})
+TRIGGER_ORDER_TYPES = frozenset({OrderType.SL, OrderType.SL_M})
+ACTIVE_ORDER_STATUSES = frozenset({OrderStatus.PENDING, OrderStatus.OPEN})
+TERMINAL_ORDER_STATUSES = frozenset({
+    OrderStatus.COMPLETE,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+})
+
+
+@dataclass(slots=True)
 class Order:
     """Order data model."""
     instrument: str
@@ -45,9 +66,13 @@ class Order:
     timestamp: Optional[datetime] = None
     order_id: Optional[str] = None
     status: OrderStatus = OrderStatus.PENDING
+    
+    def __post_init__(self):
+        self.instrument = _intern(self.instrument)
+        self.strategy_id = _intern(self.strategy_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position data model."""
     instrument: str
@@ -57,9 +82,13 @@ class Position:
     unrealized_pnl: float
     strategy_id: str
     entry_time: datetime
+    
+    def __post_init__(self):
+        self.instrument = _intern(self.instrument)
+        self.strategy_id = _intern(self.strategy_id)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskParameters:
     """Risk management parameters."""
     max_position_size: float
@@ -69,7 +98,7 @@ class RiskParameters:
     max_positions_per_instrument: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyConfig:
     """Strategy configuration data model."""
     name: str
@@ -122,6 +151,21 @@ class OrderExecutor(ABC):
     def get_order_status(self, order_id: str) -> OrderStatus:
         """Get order status."""
         pass
+    
+    def get_orders_status(self, order_ids: List[str]) -> Dict[str, OrderStatus]:
+        """
+        Get status for several orders; override to use a single bulk call.
+        
+        Orders whose status query fails are left out of the result, so one
+        bad order does not fail the whole batch.
+        """
+        statuses = {}
+        for order_id in order_ids:
+            try:
+                statuses[order_id] = self.get_order_status(order_id)
+            except Exception:
+                continue
+        return statuses
 
 
 class RiskManager(ABC):
@@ -151,16 +195,16 @@ class Strategy(ABC):
         self.enabled = config.enabled
     
     @abstractmethod
-    def evaluate(self, market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def evaluate(self, market_data: Dict[str, Any]) -> List['TradingSignal']:
         """Evaluate market data and return trading signals."""
         pass
     
     @abstractmethod
-    def get_entry_signals(self, market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def get_entry_signals(self, market_data: Dict[str, Any]) -> List['TradingSignal']:
         """Generate entry signals based on market data."""
         pass
     
     @abstractmethod
-    def get_exit_signals(self, positions: List[Position]) -> List[Dict[str, Any]]:
+    def get_exit_signals(self, positions: List[Position]) -> List['TradingSignal']:
         """Generate exit signals for current positions."""
         pass
\ No newline at end of file
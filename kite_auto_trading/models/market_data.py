@@ -4,11 +4,22 @@ Market data models and interfaces for the Kite Auto-Trading application.
 This module contains data structures for ticks, OHLC data, and instrument information.
 """
 
+import json
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
+import numpy as np
+
+try:
+    import msgspec
+except ImportError:  # optional; decode_ticks falls back to json + validators
+    msgspec = None
+
+from .base import _intern
+
 
 class InstrumentType(Enum):
     """Types of trading instruments."""
@@ -19,7 +30,10 @@ class InstrumentType(Enum):
     COMMODITY = "COM"
 
 
-@dataclass
+_DERIVATIVE_TYPES = frozenset({InstrumentType.FUTURES, InstrumentType.OPTIONS})
+
+
+@dataclass(frozen=True, slots=True)
 class Tick:
     """
     Real-time tick data model representing a single market data update.
@@ -64,8 +78,190 @@ class Tick:
         if self.ask_price is not None and self.ask_price < 0:
             raise ValueError(f"Invalid ask_price: {self.ask_price}. Must be non-negative.")
 
+    @classmethod
+    def from_batch(cls, batch: 'TickBatch', i: int) -> 'Tick':
+        """
+        Build a Tick from row ``i`` of a TickBatch.
+        
+        Args:
+            batch: Source tick batch
+            i: Row index within the batch
+            
+        Returns:
+            Tick populated from the batch row
+        """
+        if not 0 <= i < len(batch):
+            raise IndexError(f"Tick index {i} out of range for batch of size {len(batch)}")
+        
+        bid_price = batch.bid_price[i]
+        ask_price = batch.ask_price[i]
+        bid_quantity = batch.bid_quantity[i]
+        ask_quantity = batch.ask_quantity[i]
+        
+        return cls(
+            instrument_token=int(batch.instrument_token[i]),
+            timestamp=batch.timestamp[i].astype('datetime64[us]').item(),
+            last_price=float(batch.last_price[i]),
+            volume=int(batch.volume[i]),
+            bid_price=None if np.isnan(bid_price) else float(bid_price),
+            ask_price=None if np.isnan(ask_price) else float(ask_price),
+            bid_quantity=None if bid_quantity < 0 else int(bid_quantity),
+            ask_quantity=None if ask_quantity < 0 else int(ask_quantity),
+        )
+
+
+# Field order of packed tick tuples; matches Tick's positional fields so a
+# packed tick can be materialized with Tick(*packed).
+TICK_FIELDS = (
+    'instrument_token',
+    'timestamp',
+    'last_price',
+    'volume',
+    'bid_price',
+    'ask_price',
+    'bid_quantity',
+    'ask_quantity',
+)
 
-@dataclass
+
+def pack_tick(tick_data: Dict[str, Any]) -> tuple:
+    """
+    Pack a raw tick dictionary into a tuple ordered by TICK_FIELDS.
+    
+    Tuples of plain numbers are far smaller than dicts or Tick objects and
+    are not tracked by the garbage collector, which makes them suitable
+    for large in-memory tick buffers.
+    
+    Args:
+        tick_data: Tick data dictionary
+        
+    Returns:
+        Packed tick tuple
+    """
+    get = tick_data.get
+    return (
+        tick_data['instrument_token'],
+        get('timestamp'),
+        get('last_price'),
+        get('volume', 0),
+        get('bid_price'),
+        get('ask_price'),
+        get('bid_quantity'),
+        get('ask_quantity'),
+    )
+
+
+def unpack_tick(packed: tuple) -> Dict[str, Any]:
+    """
+    Convert a packed tick tuple back into a dictionary.
+    
+    Args:
+        packed: Tuple produced by pack_tick
+        
+    Returns:
+        Tick data dictionary keyed by TICK_FIELDS
+    """
+    return dict(zip(TICK_FIELDS, packed))
+
+
+class TickBatch:
+    """
+    Columnar (structure-of-arrays) buffer of tick data.
+    
+    Ticks are appended into preallocated NumPy arrays so that validation
+    and aggregation can run as vectorized operations over the whole batch
+    instead of per-object Python code. Missing bid/ask prices are stored as
+    NaN and missing quantities as -1.
+    
+    Attributes:
+        capacity: Maximum number of ticks the batch can hold
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be positive.")
+        self.capacity = capacity
+        self._size = 0
+        self._instrument_token = np.empty(capacity, dtype=np.int64)
+        self._timestamp = np.empty(capacity, dtype='datetime64[us]')
+        self._last_price = np.empty(capacity, dtype=np.float64)
+        self._volume = np.empty(capacity, dtype=np.int64)
+        self._bid_price = np.empty(capacity, dtype=np.float64)
+        self._ask_price = np.empty(capacity, dtype=np.float64)
+        self._bid_quantity = np.empty(capacity, dtype=np.int64)
+        self._ask_quantity = np.empty(capacity, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def is_full(self) -> bool:
+        """Check if the batch has reached its capacity."""
+        return self._size >= self.capacity
+    
+    def append(self, tick_data: Dict[str, Any]) -> None:
+        """
+        Append a raw tick dictionary to the batch.
+        
+        Args:
+            tick_data: Tick data dictionary (as produced by clean_tick_data)
+        """
+        if self._size >= self.capacity:
+            raise IndexError(f"TickBatch is full (capacity={self.capacity})")
+        
+        i = self._size
+        bid_price = tick_data.get('bid_price')
+        ask_price = tick_data.get('ask_price')
+        bid_quantity = tick_data.get('bid_quantity')
+        ask_quantity = tick_data.get('ask_quantity')
+        
+        self._instrument_token[i] = tick_data['instrument_token']
+        self._timestamp[i] = tick_data.get('timestamp') or datetime.now()
+        self._last_price[i] = tick_data['last_price']
+        self._volume[i] = tick_data.get('volume', 0)
+        self._bid_price[i] = np.nan if bid_price is None else bid_price
+        self._ask_price[i] = np.nan if ask_price is None else ask_price
+        self._bid_quantity[i] = -1 if bid_quantity is None else bid_quantity
+        self._ask_quantity[i] = -1 if ask_quantity is None else ask_quantity
+        self._size = i + 1
+    
+    def clear(self) -> None:
+        """Reset the batch without releasing its buffers."""
+        self._size = 0
+    
+    @property
+    def instrument_token(self) -> np.ndarray:
+        return self._instrument_token[:self._size]
+    
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._timestamp[:self._size]
+    
+    @property
+    def last_price(self) -> np.ndarray:
+        return self._last_price[:self._size]
+    
+    @property
+    def volume(self) -> np.ndarray:
+        return self._volume[:self._size]
+    
+    @property
+    def bid_price(self) -> np.ndarray:
+        return self._bid_price[:self._size]
+    
+    @property
+    def ask_price(self) -> np.ndarray:
+        return self._ask_price[:self._size]
+    
+    @property
+    def bid_quantity(self) -> np.ndarray:
+        return self._bid_quantity[:self._size]
+    
+    @property
+    def ask_quantity(self) -> np.ndarray:
+        return self._ask_quantity[:self._size]
+
+
+@dataclass(frozen=True, slots=True)
 class OHLC:
     """
     OHLC (Open, High, Low, Close) candlestick data model.
@@ -102,6 +298,67 @@ class OHLC:
         if self.volume < 0:
             raise ValueError(f"Invalid volume: {self.volume}. Must be non-negative.")
     
+    @classmethod
+    def from_arrays(
+        cls,
+        instrument_token: int,
+        timestamps: List[datetime],
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any,
+        timeframe: str,
+    ) -> List['OHLC']:
+        """
+        Build candles from parallel price/volume arrays.
+        
+        The whole series is validated once with validate_ohlc_array, so
+        the per-candle __post_init__ checks are skipped.
+        
+        Args:
+            instrument_token: Instrument the candles belong to
+            timestamps: Start time of each candle
+            open: Opening prices
+            high: High prices
+            low: Low prices
+            close: Closing prices
+            volume: Volumes
+            timeframe: Timeframe of the candles
+            
+        Returns:
+            List of OHLC candles
+        """
+        open_arr, high_arr, low_arr, close_arr, volume_arr = validate_ohlc_array(
+            open, high, low, close, volume
+        )
+        if len(timestamps) != len(open_arr):
+            raise ValueError(
+                f"Length mismatch: {len(timestamps)} timestamps for {len(open_arr)} candles."
+            )
+        
+        candles = []
+        setattr_ = object.__setattr__
+        for ts, o, h, l, c, v in zip(
+            timestamps,
+            open_arr.tolist(),
+            high_arr.tolist(),
+            low_arr.tolist(),
+            close_arr.tolist(),
+            volume_arr.tolist(),
+        ):
+            candle = object.__new__(cls)
+            setattr_(candle, 'instrument_token', instrument_token)
+            setattr_(candle, 'timestamp', ts)
+            setattr_(candle, 'open', o)
+            setattr_(candle, 'high', h)
+            setattr_(candle, 'low', l)
+            setattr_(candle, 'close', c)
+            setattr_(candle, 'volume', v)
+            setattr_(candle, 'timeframe', timeframe)
+            candles.append(candle)
+        return candles
+    
     def is_bullish(self) -> bool:
         """Check if the candle is bullish (close > open)."""
         return self.close > self.open
@@ -119,7 +376,7 @@ class OHLC:
         return self.high - self.low
 
 
-@dataclass
+@dataclass(slots=True)
 class Instrument:
     """
     Instrument information model.
@@ -137,6 +394,7 @@ class Instrument:
         tick_size: Minimum price movement
         lot_size: Minimum trading quantity
         last_price: Last known price
+        expiry_ts: Expiry as a POSIX timestamp, derived from expiry
     """
     instrument_token: int
     exchange_token: int
@@ -150,6 +408,7 @@ class Instrument:
     tick_size: float = 0.05
     lot_size: int = 1
     last_price: Optional[float] = None
+    expiry_ts: Optional[float] = field(init=False, default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate instrument data after initialization."""
@@ -161,48 +420,133 @@ class Instrument:
             raise ValueError(f"Invalid lot_size: {self.lot_size}. Must be positive.")
         if self.last_price is not None and self.last_price < 0:
             raise ValueError(f"Invalid last_price: {self.last_price}. Must be non-negative.")
+        
+        self.tradingsymbol = _intern(self.tradingsymbol)
+        self.exchange = _intern(self.exchange)
+        self.segment = _intern(self.segment)
+        self.expiry_ts = self.expiry.timestamp() if self.expiry is not None else None
     
     def is_derivative(self) -> bool:
         """Check if the instrument is a derivative."""
-        return self.instrument_type in [InstrumentType.FUTURES, InstrumentType.OPTIONS]
+        return self.instrument_type in _DERIVATIVE_TYPES
     
     def is_expired(self) -> bool:
         """Check if the instrument has expired (for derivatives)."""
-        if self.expiry is None:
-            return False
-        return datetime.now() > self.expiry
+        return self.is_expired_at(time.time())
+    
+    def is_expired_at(self, now_ts: float) -> bool:
+        """
+        Check if the instrument has expired as of a given time.
+        
+        Lets callers scanning many instruments read the clock once.
+        
+        Args:
+            now_ts: Current time as a POSIX timestamp (e.g. time.time())
+            
+        Returns:
+            True if the instrument has an expiry before now_ts
+        """
+        return self.expiry_ts is not None and now_ts > self.expiry_ts
+
 
+# Kite publishes five price levels per side in full mode
+DEPTH_LEVELS = 5
+DEPTH_DTYPE = np.dtype([
+    ('price', np.float64),
+    ('quantity', np.int64),
+    ('orders', np.int64),
+])
 
-@dataclass
+
+def _depth_array(levels: Any) -> np.ndarray:
+    """Copy a list of depth level dicts (or a structured array) into a DEPTH_DTYPE array."""
+    if isinstance(levels, np.ndarray):
+        if levels.dtype == DEPTH_DTYPE:
+            return levels
+        names = levels.dtype.names or ()
+        missing = [name for name in DEPTH_DTYPE.names if name not in names]
+        if missing:
+            raise ValueError(f"Depth array is missing fields: {', '.join(missing)}")
+        array = np.zeros(max(DEPTH_LEVELS, len(levels)), dtype=DEPTH_DTYPE)
+        for name in DEPTH_DTYPE.names:
+            array[name][:len(levels)] = levels[name]
+        return array
+    
+    array = np.zeros(max(DEPTH_LEVELS, len(levels)), dtype=DEPTH_DTYPE)
+    for i, level in enumerate(levels):
+        array[i] = (level['price'], level['quantity'], level.get('orders', 0))
+    return array
+
+
+def _depth_level(row: np.void) -> Dict[str, Any]:
+    """Convert one DEPTH_DTYPE row into a level dict of Python scalars."""
+    return dict(zip(DEPTH_DTYPE.names, row.item()))
+
+
+@dataclass(slots=True)
 class MarketDepth:
     """
     Market depth (order book) data model.
     
+    Levels are kept in fixed-size NumPy arrays with fields price, quantity
+    and orders. Unused levels have a price of 0. Lists of level dicts are
+    accepted and converted on construction.
+    
     Attributes:
         instrument_token: Unique identifier for the instrument
         timestamp: Time when the depth was captured
-        bids: List of bid levels (price, quantity, orders)
-        asks: List of ask levels (price, quantity, orders)
+        bids: Bid levels, best (highest) price first
+        asks: Ask levels, best (lowest) price first
     """
     instrument_token: int
     timestamp: datetime
-    bids: List[Dict[str, Any]] = field(default_factory=list)
-    asks: List[Dict[str, Any]] = field(default_factory=list)
+    bids: np.ndarray = field(default_factory=lambda: np.zeros(DEPTH_LEVELS, dtype=DEPTH_DTYPE))
+    asks: np.ndarray = field(default_factory=lambda: np.zeros(DEPTH_LEVELS, dtype=DEPTH_DTYPE))
+    
+    def __post_init__(self):
+        """Convert list-based depth levels to arrays."""
+        self.bids = _depth_array(self.bids)
+        self.asks = _depth_array(self.asks)
+    
+    @classmethod
+    def from_kite_depth(
+        cls,
+        instrument_token: int,
+        timestamp: datetime,
+        depth: Dict[str, List[Dict[str, Any]]],
+    ) -> 'MarketDepth':
+        """
+        Build market depth from a Kite full-mode tick's ``depth`` payload.
+        
+        Args:
+            instrument_token: Instrument the depth belongs to
+            timestamp: Time when the depth was captured
+            depth: Kite depth dict with 'buy' and 'sell' level lists
+            
+        Returns:
+            MarketDepth with levels copied into arrays
+        """
+        return cls(
+            instrument_token=instrument_token,
+            timestamp=timestamp,
+            bids=_depth_array(depth.get('buy', ())),
+            asks=_depth_array(depth.get('sell', ())),
+        )
     
     def get_best_bid(self) -> Optional[Dict[str, Any]]:
-        """Get the best bid (highest price)."""
-        return self.bids[0] if self.bids else None
+        """Get the best bid (highest price) level."""
+        return _depth_level(self.bids[0]) if self.bids['price'][0] > 0 else None
     
     def get_best_ask(self) -> Optional[Dict[str, Any]]:
-        """Get the best ask (lowest price)."""
-        return self.asks[0] if self.asks else None
+        """Get the best ask (lowest price) level."""
+        return _depth_level(self.asks[0]) if self.asks['price'][0] > 0 else None
     
     def get_spread(self) -> Optional[float]:
         """Calculate the bid-ask spread."""
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        if best_bid and best_ask:
-            return best_ask['price'] - best_bid['price']
+        best_bid = self.bids['price'][0]
+        best_ask = self.asks['price'][0]
+        if best_bid > 0 and best_ask > 0:
+            return float(best_ask - best_bid)
         return None
 
 
@@ -216,19 +560,39 @@ def validate_tick_data(tick_data: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ['instrument_token', 'last_price']
-    
-    for field in required_fields:
-        if field not in tick_data:
-            return False
-    
-    if not isinstance(tick_data['instrument_token'], int):
+    try:
+        instrument_token = tick_data['instrument_token']
+        last_price = tick_data['last_price']
+    except KeyError:
         return False
     
-    if not isinstance(tick_data['last_price'], (int, float)) or tick_data['last_price'] <= 0:
-        return False
+    return (
+        isinstance(instrument_token, int)
+        and isinstance(last_price, (int, float))
+        and last_price > 0
+    )
+
+
+def validate_tick_batch(batch: TickBatch) -> bool:
+    """
+    Validate all ticks in a TickBatch using vectorized checks.
     
-    return True
+    Applies the same rules as Tick.__post_init__ to every row at once.
+    
+    Args:
+        batch: Tick batch to validate
+        
+    Returns:
+        True if every tick in the batch is valid, False otherwise
+    """
+    # NaN bid/ask (missing values) compare False against 0 and pass
+    invalid = (
+        (batch.last_price <= 0)
+        | (batch.volume < 0)
+        | (batch.bid_price < 0)
+        | (batch.ask_price < 0)
+    )
+    return not bool(np.any(invalid))
 
 
 def validate_ohlc_data(ohlc_data: Dict[str, Any]) -> bool:
@@ -268,21 +632,71 @@ def validate_ohlc_data(ohlc_data: Dict[str, Any]) -> bool:
         return False
 
 
-def clean_tick_data(tick_data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_ohlc_array(open: Any, high: Any, low: Any, close: Any, volume: Any):
+    """
+    Validate a series of OHLC candles using vectorized checks.
+    
+    Applies the same rules as OHLC.__post_init__ to every row at once.
+    
+    Args:
+        open: Opening prices
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        volume: Volumes
+        
+    Returns:
+        Tuple of (open, high, low, close, volume) as NumPy arrays
+        
+    Raises:
+        ValueError: If the arrays differ in length or any row is invalid
+    """
+    o = np.asarray(open, dtype=np.float64)
+    h = np.asarray(high, dtype=np.float64)
+    l = np.asarray(low, dtype=np.float64)
+    c = np.asarray(close, dtype=np.float64)
+    v = np.asarray(volume, dtype=np.int64)
+    
+    if not (len(o) == len(h) == len(l) == len(c) == len(v)):
+        raise ValueError("OHLC arrays must all have the same length.")
+    
+    bad = (
+        (o <= 0) | (h <= 0) | (l <= 0) | (c <= 0)
+        | (h < l) | (h < o) | (h < c)
+        | (l > o) | (l > c)
+        | (v < 0)
+    )
+    if bad.any():
+        row = int(bad.argmax())
+        raise ValueError(
+            f"Invalid OHLC at row {row}: open={o[row]}, high={h[row]}, "
+            f"low={l[row]}, close={c[row]}, volume={v[row]}"
+        )
+    
+    return o, h, l, c, v
+
+
+def clean_tick_data(tick_data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Clean and normalize tick data.
     
     Args:
         tick_data: Raw tick data dictionary
+        now: Timestamp to use when the tick has none (defaults to current time).
+            Pass one value for a whole batch to avoid a clock read per tick.
         
     Returns:
         Cleaned tick data dictionary
     """
+    timestamp = tick_data.get('timestamp')
+    if timestamp is None:
+        timestamp = now if now is not None else datetime.now()
+    
     cleaned = {
         'instrument_token': int(tick_data['instrument_token']),
         'last_price': float(tick_data['last_price']),
         'volume': int(tick_data.get('volume', 0)),
-        'timestamp': tick_data.get('timestamp', datetime.now()),
+        'timestamp': timestamp,
     }
     
     # Optional fields
@@ -305,23 +719,105 @@ def clean_tick_data(tick_data: Dict[str, Any]) -> Dict[str, Any]:
     return cleaned
 
 
-def clean_ohlc_data(ohlc_data: Dict[str, Any]) -> Dict[str, Any]:
+if msgspec is not None:
+    class RawTick(msgspec.Struct):
+        """Typed wire format of a JSON tick, validated while decoding."""
+        instrument_token: int
+        last_price: float
+        volume: int = 0
+        timestamp: Optional[datetime] = None
+        bid_price: Optional[float] = None
+        ask_price: Optional[float] = None
+        bid_quantity: Optional[int] = None
+        ask_quantity: Optional[int] = None
+        open: Optional[float] = None
+        high: Optional[float] = None
+        low: Optional[float] = None
+        close: Optional[float] = None
+        change: Optional[float] = None
+
+    _raw_ticks_decoder = msgspec.json.Decoder(List[RawTick])
+else:
+    RawTick = None
+    _raw_ticks_decoder = None
+
+
+def decode_ticks(payload, now: Optional[datetime] = None) -> List[Tick]:
+    """
+    Decode a JSON array of ticks into Tick objects.
+    
+    When msgspec is installed, parsing and type validation happen in a
+    single pass and the per-field validate/clean step is skipped. Otherwise
+    the payload is parsed with json and run through validate_tick_data and
+    clean_tick_data.
+    
+    Args:
+        payload: JSON document (str or bytes) holding a list of tick objects
+        now: Timestamp to use for ticks without one (defaults to current time)
+        
+    Returns:
+        List of Tick objects
+        
+    Raises:
+        ValueError: If the payload is not a valid list of ticks
+    """
+    if now is None:
+        now = datetime.now()
+    
+    if _raw_ticks_decoder is not None:
+        try:
+            raw_ticks = _raw_ticks_decoder.decode(payload)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid tick payload: {e}") from e
+        return [
+            Tick(
+                instrument_token=raw.instrument_token,
+                timestamp=raw.timestamp or now,
+                last_price=raw.last_price,
+                volume=raw.volume,
+                bid_price=raw.bid_price,
+                ask_price=raw.ask_price,
+                bid_quantity=raw.bid_quantity,
+                ask_quantity=raw.ask_quantity,
+                open=raw.open,
+                high=raw.high,
+                low=raw.low,
+                close=raw.close,
+                change=raw.change,
+            )
+            for raw in raw_ticks
+        ]
+    
+    ticks = []
+    for tick_data in json.loads(payload):
+        if not validate_tick_data(tick_data):
+            raise ValueError(f"Invalid tick payload: {tick_data}")
+        ticks.append(Tick(**clean_tick_data(tick_data, now)))
+    return ticks
+
+
+def clean_ohlc_data(ohlc_data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Clean and normalize OHLC data.
     
     Args:
         ohlc_data: Raw OHLC data dictionary
+        now: Timestamp to use when the candle has none (defaults to current time)
         
     Returns:
         Cleaned OHLC data dictionary
     """
+    timestamp = ohlc_data.get('timestamp')
+    if timestamp is None:
+        timestamp = now if now is not None else datetime.now()
+    
     cleaned = {
         'open': float(ohlc_data['open']),
         'high': float(ohlc_data['high']),
         'low': float(ohlc_data['low']),
         'close': float(ohlc_data['close']),
         'volume': int(ohlc_data['volume']),
-        'timestamp': ohlc_data.get('timestamp', datetime.now()),
+        'timestamp': timestamp,
     }
     
     if 'instrument_token' in ohlc_data:
@@ -19,6 +19,12 @@ class SignalType(Enum):
     HOLD = "HOLD"
 
 
+_ENTRY_SIGNALS = frozenset({SignalType.ENTRY_LONG, SignalType.ENTRY_SHORT})
+_EXIT_SIGNALS = frozenset({SignalType.EXIT_LONG, SignalType.EXIT_SHORT})
+_LONG_SIGNALS = frozenset({SignalType.ENTRY_LONG, SignalType.EXIT_SHORT})
+_SHORT_SIGNALS = frozenset({SignalType.ENTRY_SHORT, SignalType.EXIT_LONG})
+
+
 class SignalStrength(Enum):
     """Signal strength levels."""
     WEAK = "WEAK"
@@ -26,7 +32,7 @@ class SignalStrength(Enum):
     STRONG = "STRONG"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradingSignal:
     """
     Trading signal generated by a strategy.
@@ -65,19 +71,19 @@ class TradingSignal:
     
     def is_entry_signal(self) -> bool:
         """Check if this is an entry signal."""
-        return self.signal_type in [SignalType.ENTRY_LONG, SignalType.ENTRY_SHORT]
+        return self.signal_type in _ENTRY_SIGNALS
     
     def is_exit_signal(self) -> bool:
         """Check if this is an exit signal."""
-        return self.signal_type in [SignalType.EXIT_LONG, SignalType.EXIT_SHORT]
+        return self.signal_type in _EXIT_SIGNALS
     
     def is_long_signal(self) -> bool:
         """Check if this is a long (buy) signal."""
-        return self.signal_type in [SignalType.ENTRY_LONG, SignalType.EXIT_SHORT]
+        return self.signal_type in _LONG_SIGNALS
     
     def is_short_signal(self) -> bool:
         """Check if this is a short (sell) signal."""
-        return self.signal_type in [SignalType.ENTRY_SHORT, SignalType.EXIT_LONG]
+        return self.signal_type in _SHORT_SIGNALS
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert signal to dictionary representation."""
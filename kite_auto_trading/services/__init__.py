@@ -3,8 +3,14 @@ Service layer for the Kite Auto-Trading application.
 
 This module contains business logic and service classes that orchestrate
 the application's core functionality.
+
+Only the service interfaces are imported eagerly. Concrete services are
+loaded on first attribute access (PEP 562) so that importing this package
+does not pull in pandas/numpy and the rest of the service stack.
 """
 
+import importlib
+
 from .base import (
     ConfigurationService,
     PortfolioService,
@@ -12,49 +18,49 @@ from .base import (
     StrategyService,
 )
 
-from .market_data_feed import (
-    MarketDataFeed,
-    ConnectionState,
-)
+# Lazily exported name -> submodule that defines it
+_LAZY = {
+    'MarketDataFeed': 'market_data_feed',
+    'ConnectionState': 'market_data_feed',
+    'RiskManagerService': 'risk_manager',
+    'RiskValidationResult': 'risk_manager',
+    'PositionSizeResult': 'risk_manager',
+    'EmergencyStopReason': 'risk_manager',
+    'DrawdownMetrics': 'risk_manager',
+    'OrderManager': 'order_manager',
+    'OrderUpdate': 'order_manager',
+    'OrderRecord': 'order_manager',
+    'OrderValidationError': 'order_manager',
+    'OrderExecutionError': 'order_manager',
+    'PortfolioManager': 'portfolio_manager',
+    'Position': 'portfolio_manager',
+    'Trade': 'portfolio_manager',
+    'PortfolioSnapshot': 'portfolio_manager',
+    'PortfolioMetricsCalculator': 'portfolio_metrics',
+    'PerformanceMetrics': 'portfolio_metrics',
+    'RiskMetrics': 'portfolio_metrics',
+    'DailyReport': 'portfolio_metrics',
+    'LoggingServiceImpl': 'logging_service',
+    'StructuredLogger': 'logging_service',
+    'TradeLogger': 'logging_service',
+    'ErrorLogger': 'logging_service',
+    'PerformanceLogger': 'logging_service',
+    'LogLevel': 'logging_service',
+}
 
-from .risk_manager import (
-    RiskManagerService,
-    RiskValidationResult,
-    PositionSizeResult,
-    EmergencyStopReason,
-    DrawdownMetrics,
-)
 
-from .order_manager import (
-    OrderManager,
-    OrderUpdate,
-    OrderRecord,
-    OrderValidationError,
-    OrderExecutionError,
-)
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY[name]}', __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
 
-from .portfolio_manager import (
-    PortfolioManager,
-    Position,
-    Trade,
-    PortfolioSnapshot,
-)
 
-from .portfolio_metrics import (
-    PortfolioMetricsCalculator,
-    PerformanceMetrics,
-    RiskMetrics,
-    DailyReport,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-from .logging_service import (
-    LoggingServiceImpl,
-    StructuredLogger,
-    TradeLogger,
-    ErrorLogger,
-    PerformanceLogger,
-    LogLevel,
-)
 
 __all__ = [
     'ConfigurationService',
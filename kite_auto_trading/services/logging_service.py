@@ -5,14 +5,57 @@ This module provides structured logging with JSON format, trade execution audit
 and error logging with context information.
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import threading
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from enum import Enum
 
-from kite_auto_trading.models.base import Order
+from kite_auto_trading.config.logging_config import start_queue_listener
+from kite_auto_trading.models.base import Order, OrderType, TransactionType
+
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+_CRITICAL = logging.CRITICAL
+
+_now = datetime.now
+
+# Enum member -> serialized value, avoiding the Enum.value property per event
+_TRANSACTION_TYPE_VALUES = {member: member.value for member in TransactionType}
+_ORDER_TYPE_VALUES = {member: member.value for member in OrderType}
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes for the stdlib encoder the way orjson does."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(data: Any) -> str:
+        """Serialize log data to a JSON string."""
+        return orjson.dumps(data, option=_ORJSON_OPTIONS).decode()
+
+    _loads = orjson.loads
+else:
+    def _dumps(data: Any) -> str:
+        """Serialize log data to a JSON string."""
+        return json.dumps(data, default=_json_default)
+
+    _loads = json.loads
 
 
 class LogLevel(Enum):
@@ -24,28 +67,114 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
+_FILE_BUFFER_SIZE = 1 << 16
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler with a large write buffer that does not flush per record.
+    
+    Flushing is left to the owning _BatchingHandler, so a batch of records
+    reaches the file in as few write() calls as the buffer allows.
+    """
+    
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes its target's file buffer."""
+    
+    def flush(self) -> None:
+        super().flush()
+        with self.lock:
+            if self.target is not None:
+                self.target.flush()
+
+
+_LEVEL_NUMBERS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.CRITICAL: logging.CRITICAL,
+}
+
+
 class StructuredLogger:
     """
     Structured logger that outputs logs in JSON format for easy parsing and analysis.
     """
     
-    def __init__(self, name: str, log_dir: str = "logs"):
+    def __init__(
+        self,
+        name: str,
+        log_dir: str = "logs",
+        background: bool = False,
+        buffer_capacity: int = 0,
+        flush_interval: float = 0.1
+    ):
         """
         Initialize structured logger.
         
         Args:
             name: Logger name
             log_dir: Directory for log files
+            background: Format and write records on a background listener
+                thread; the logging call only enqueues the record
+            buffer_capacity: Number of records to buffer before writing them
+                to file in one batch (0 writes every record immediately).
+                ERROR and above always flush the buffer.
+            flush_interval: Seconds between periodic flushes of buffered records
         """
         self.name = name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.background = background
+        self.buffer_capacity = buffer_capacity
+        self.flush_interval = flush_interval
+        self._listeners: List[logging.handlers.QueueListener] = []
+        self._handlers: List[logging.Handler] = []
+        self._batching_handlers: List[_BatchingHandler] = []
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
         
         # Create separate loggers for different purposes
         self.general_logger = self._create_logger(f"{name}.general", "general.log")
         self.trade_logger = self._create_logger(f"{name}.trades", "trades.log")
         self.error_logger = self._create_logger(f"{name}.errors", "errors.log")
         self.performance_logger = self._create_logger(f"{name}.performance", "performance.log")
+        
+        general = self.general_logger
+        self._log_methods = {
+            LogLevel.DEBUG: general.debug,
+            LogLevel.INFO: general.info,
+            LogLevel.WARNING: general.warning,
+            LogLevel.ERROR: general.error,
+            LogLevel.CRITICAL: general.critical,
+        }
+        
+        if self._batching_handlers:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                daemon=True,
+                name=f"{name}LogFlush"
+            )
+            self._flush_thread.start()
+        
+        if self._listeners or self._batching_handlers:
+            atexit.register(self.close)
     
     def _create_logger(self, logger_name: str, filename: str) -> logging.Logger:
         """
@@ -63,24 +192,77 @@ class StructuredLogger:
         logger.handlers.clear()
         
         # File handler
-        file_handler = logging.FileHandler(
+        handler_class = _BufferedFileHandler if self.buffer_capacity else logging.FileHandler
+        file_handler = handler_class(
             self.log_dir / filename,
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(JSONFormatter())
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_JSON_FORMATTER)
+        self._handlers.append(file_handler)
+        
+        if self.buffer_capacity:
+            file_handler = _BatchingHandler(
+                self.buffer_capacity,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            self._handlers.append(file_handler)
+            self._batching_handlers.append(file_handler)
+        
+        handlers = [file_handler]
         
         # Console handler for errors
         if "error" in logger_name:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.ERROR)
-            console_handler.setFormatter(JSONFormatter())
-            logger.addHandler(console_handler)
+            console_handler.setFormatter(_JSON_FORMATTER)
+            handlers.append(console_handler)
+        
+        if self.background:
+            self._listeners.append(start_queue_listener(logger, handlers))
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
         
         logger.propagate = False
         return logger
     
+    def _flush_loop(self) -> None:
+        """Periodically write out buffered records so quiet logs don't go stale."""
+        while not self._flush_stop.wait(self.flush_interval):
+            for handler in self._batching_handlers:
+                handler.flush()
+    
+    def flush(self) -> None:
+        """Wait until all queued and buffered records have been written."""
+        for listener in self._listeners:
+            # stop() drains the queue before joining the listener thread
+            listener.stop()
+            listener.start()
+        for handler in self._batching_handlers:
+            handler.flush()
+    
+    def close(self) -> None:
+        """Write out queued and buffered records and close the file handlers."""
+        if not (self._listeners or self._batching_handlers):
+            return
+        
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners.clear()
+        
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+        
+        # Batching handlers were added after their targets; close them first
+        for handler in reversed(self._handlers):
+            handler.close()
+        self._batching_handlers.clear()
+        atexit.unregister(self.close)
+    
     def log(self, level: LogLevel, message: str, **kwargs):
         """
         Log a message with structured data.
@@ -90,15 +272,17 @@ class StructuredLogger:
             message: Log message
             **kwargs: Additional structured data
         """
+        if not self.general_logger.isEnabledFor(_LEVEL_NUMBERS[level]):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "level": level.value,
             "message": message,
             **kwargs
         }
         
-        log_method = getattr(self.general_logger, level.value.lower())
-        log_method(json.dumps(log_data))
+        self._log_methods[level](log_data)
     
     def debug(self, message: str, **kwargs):
         """Log debug message."""
@@ -124,6 +308,10 @@ class StructuredLogger:
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter that outputs logs in JSON format.
+    
+    Records whose message is a dict (as emitted by the structured loggers)
+    are serialized directly; JSON strings are passed through and plain
+    messages are wrapped with record metadata.
     """
     
     def format(self, record: logging.LogRecord) -> str:
@@ -136,9 +324,13 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON formatted log string
         """
+        # Structured loggers pass their dict through as the message
+        if isinstance(record.msg, dict):
+            return _dumps(record.msg)
+        
         # Try to parse message as JSON if it's already JSON
         try:
-            log_data = json.loads(record.getMessage())
+            log_data = _loads(record.getMessage())
         except (json.JSONDecodeError, ValueError):
             # If not JSON, create structured log
             log_data = {
@@ -155,7 +347,11 @@ class JSONFormatter(logging.Formatter):
             if record.exc_info:
                 log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+# JSONFormatter is stateless, so every handler shares one instance
+_JSON_FORMATTER = JSONFormatter()
 
 
 class TradeLogger:
@@ -180,19 +376,22 @@ class TradeLogger:
             order: Order object
             strategy_id: Strategy that generated the order
         """
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "order_placed",
-            "order_id": getattr(order, 'order_id', None),
+            "order_id": order.order_id,
             "instrument": order.instrument,
-            "transaction_type": order.transaction_type.value,
+            "transaction_type": _TRANSACTION_TYPE_VALUES[order.transaction_type],
             "quantity": order.quantity,
-            "order_type": order.order_type.value,
+            "order_type": _ORDER_TYPE_VALUES[order.order_type],
             "price": order.price,
             "trigger_price": order.trigger_price,
             "strategy_id": strategy_id
         }
-        self.logger.info(json.dumps(log_data))
+        self.logger.info(log_data)
     
     def log_order_executed(self, order: Order, execution_details: Dict[str, Any]):
         """
@@ -202,12 +401,15 @@ class TradeLogger:
             order: Order object
             execution_details: Execution details including fill price, quantity, etc.
         """
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "order_executed",
-            "order_id": getattr(order, 'order_id', None),
+            "order_id": order.order_id,
             "instrument": order.instrument,
-            "transaction_type": order.transaction_type.value,
+            "transaction_type": _TRANSACTION_TYPE_VALUES[order.transaction_type],
             "quantity": execution_details.get('filled_quantity', order.quantity),
             "average_price": execution_details.get('average_price'),
             "total_cost": execution_details.get('total_cost'),
@@ -216,7 +418,7 @@ class TradeLogger:
             "status": execution_details.get('status'),
             "exchange_timestamp": execution_details.get('exchange_timestamp')
         }
-        self.logger.info(json.dumps(log_data))
+        self.logger.info(log_data)
     
     def log_order_rejected(self, order: Order, reason: str):
         """
@@ -226,16 +428,19 @@ class TradeLogger:
             order: Order object
             reason: Rejection reason
         """
+        if not self.logger.isEnabledFor(_WARNING):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "order_rejected",
-            "order_id": getattr(order, 'order_id', None),
+            "order_id": order.order_id,
             "instrument": order.instrument,
-            "transaction_type": order.transaction_type.value,
+            "transaction_type": _TRANSACTION_TYPE_VALUES[order.transaction_type],
             "quantity": order.quantity,
             "reason": reason
         }
-        self.logger.warning(json.dumps(log_data))
+        self.logger.warning(log_data)
     
     def log_order_cancelled(self, order_id: str, reason: str):
         """
@@ -245,13 +450,16 @@ class TradeLogger:
             order_id: Order ID
             reason: Cancellation reason
         """
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "order_cancelled",
             "order_id": order_id,
             "reason": reason
         }
-        self.logger.info(json.dumps(log_data))
+        self.logger.info(log_data)
 
 
 class ErrorLogger:
@@ -277,8 +485,11 @@ class ErrorLogger:
             context: Context information
             severity: Error severity level
         """
+        if not self.logger.isEnabledFor(_CRITICAL if severity == "CRITICAL" else _ERROR):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "error",
             "severity": severity,
             "error_type": type(error).__name__,
@@ -287,9 +498,9 @@ class ErrorLogger:
         }
         
         if severity == "CRITICAL":
-            self.logger.critical(json.dumps(log_data), exc_info=True)
+            self.logger.critical(log_data, exc_info=True)
         else:
-            self.logger.error(json.dumps(log_data), exc_info=True)
+            self.logger.error(log_data, exc_info=True)
     
     def log_api_error(self, endpoint: str, error: Exception, request_data: Optional[Dict[str, Any]] = None):
         """
@@ -331,13 +542,16 @@ class ErrorLogger:
             violation_type: Type of violation
             details: Violation details
         """
+        if not self.logger.isEnabledFor(_WARNING):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "risk_violation",
             "violation_type": violation_type,
             "details": details
         }
-        self.logger.warning(json.dumps(log_data))
+        self.logger.warning(log_data)
 
 
 class PerformanceLogger:
@@ -361,12 +575,15 @@ class PerformanceLogger:
         Args:
             metrics: Performance metrics dictionary
         """
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "performance_metrics",
             "metrics": metrics
         }
-        self.logger.info(json.dumps(log_data))
+        self.logger.info(log_data)
     
     def log_system_health(self, health_data: Dict[str, Any]):
         """
@@ -375,12 +592,15 @@ class PerformanceLogger:
         Args:
             health_data: System health data
         """
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        
         log_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now(),
             "event": "system_health",
             "health": health_data
         }
-        self.logger.info(json.dumps(log_data))
+        self.logger.info(log_data)
 
 
 class LoggingServiceImpl:
@@ -388,14 +608,21 @@ class LoggingServiceImpl:
     Implementation of LoggingService interface with comprehensive logging capabilities.
     """
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", background: bool = False, buffer_capacity: int = 0):
         """
         Initialize logging service.
         
         Args:
             log_dir: Directory for log files
-        """
-        self.structured_logger = StructuredLogger("kite_auto_trading", log_dir)
+            background: Write log records from a background thread
+            buffer_capacity: Records to buffer before each batched file write
+        """
+        self.structured_logger = StructuredLogger(
+            "kite_auto_trading",
+            log_dir,
+            background=background,
+            buffer_capacity=buffer_capacity
+        )
         self.trade_logger = TradeLogger(self.structured_logger.trade_logger)
         self.error_logger = ErrorLogger(self.structured_logger.error_logger)
         self.performance_logger = PerformanceLogger(self.structured_logger.performance_logger)
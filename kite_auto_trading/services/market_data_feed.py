@@ -10,8 +10,13 @@ import threading
 import time
 from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, FrozenSet, List, Optional, Callable, Any, Set, Tuple
 from enum import Enum
+from itertools import islice
+
+import numpy as np
+
+from kite_auto_trading.models.market_data import pack_tick, unpack_tick
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,20 @@ class ConnectionState(Enum):
     ERROR = "ERROR"
 
 
+_INITIAL_SLOTS = 64
+
+# Lock-free tail reads retried after a concurrent append before taking the lock
+_TAIL_READ_ATTEMPTS = 3
+
+_CALLBACK_ATTRS = {
+    'tick': 'on_tick_callbacks',
+    'ticks': 'on_ticks_callbacks',
+    'connect': 'on_connect_callbacks',
+    'disconnect': 'on_disconnect_callbacks',
+    'error': 'on_error_callbacks',
+}
+
+
 class MarketDataFeed:
     """
     Real-time market data feed handler with WebSocket support.
@@ -39,7 +58,9 @@ class MarketDataFeed:
         api_client,
         buffer_size: int = 1000,
         reconnect_interval: int = 10,
-        max_reconnect_attempts: int = 5
+        max_reconnect_attempts: int = 5,
+        batch_size: int = 64,
+        batch_ms: float = 1.0
     ):
         """
         Initialize market data feed handler.
@@ -49,33 +70,63 @@ class MarketDataFeed:
             buffer_size: Maximum size of data buffer
             reconnect_interval: Seconds between reconnection attempts
             max_reconnect_attempts: Maximum number of reconnection attempts
+            batch_size: Maximum ticks per 'ticks' callback batch
+            batch_ms: Maximum age in milliseconds of a pending tick batch
         """
         self.api_client = api_client
         self.buffer_size = buffer_size
         self.reconnect_interval = reconnect_interval
         self.max_reconnect_attempts = max_reconnect_attempts
+        self.batch_size = batch_size
+        self.batch_ms = batch_ms
         
         # Connection state
         self.state = ConnectionState.DISCONNECTED
         self.reconnect_count = 0
         self.last_connection_time: Optional[datetime] = None
         
-        # Data management
+        # Data management; buffered ticks are packed tuples (see TICK_FIELDS)
         self.data_buffer: deque = deque(maxlen=buffer_size)
-        self.subscribed_instruments: List[int] = []
+        self.subscribed_instruments: Set[int] = set()
+        # Immutable copy republished under the lock on every change, so
+        # readers never need the lock
+        self._subscribed_snapshot: FrozenSet[int] = frozenset()
         self.latest_ticks: Dict[int, Dict[str, Any]] = {}
         
-        # Callbacks
-        self.on_tick_callbacks: List[Callable] = []
-        self.on_connect_callbacks: List[Callable] = []
-        self.on_disconnect_callbacks: List[Callable] = []
-        self.on_error_callbacks: List[Callable] = []
+        # Columnar latest price/volume per instrument for vectorized readers.
+        # Each token gets a fixed row on its first tick.
+        self._token_index: Dict[int, int] = {}
+        self._tokens = np.zeros(_INITIAL_SLOTS, dtype=np.int64)
+        self._last_prices = np.full(_INITIAL_SLOTS, np.nan)
+        self._volumes = np.zeros(_INITIAL_SLOTS, dtype=np.int64)
+        self._received_ns = np.zeros(_INITIAL_SLOTS, dtype=np.int64)
+        
+        # Callbacks; tuples replaced on registration (copy-on-write) so the
+        # tick path can iterate them without a lock or defensive copy
+        self.on_tick_callbacks: Tuple[Callable, ...] = ()
+        self.on_ticks_callbacks: Tuple[Callable, ...] = ()
+        self.on_connect_callbacks: Tuple[Callable, ...] = ()
+        self.on_disconnect_callbacks: Tuple[Callable, ...] = ()
+        self.on_error_callbacks: Tuple[Callable, ...] = ()
         
-        # Threading
+        # Threading. The tick path (data_buffer/latest_ticks) is single-producer
+        # and readers are lock-free: deque.append, dict item assignment and the
+        # C-level copies taken by readers are each atomic under the GIL. Only
+        # data_buffer appends and clears take _lock, an uncontended acquire,
+        # so a tail read that keeps losing the race can wait them out.
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
         self._reconnect_thread: Optional[threading.Thread] = None
         
+        # Pending batch for 'ticks' callbacks. Both the producer and the flush
+        # thread deliver batches; _dispatch_lock covers the swap and the
+        # callback loop so batches arrive in order and callbacks never overlap.
+        self._dispatch_lock = threading.RLock()
+        self._tick_batch: List[Dict[str, Any]] = []
+        self._batch_started = 0.0
+        self._batch_event = threading.Event()
+        self._batch_thread: Optional[threading.Thread] = None
+        
         logger.info("MarketDataFeed initialized")
     
     def connect(self) -> bool:
@@ -103,7 +154,7 @@ class MarketDataFeed:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to market data feed: {e}")
+            logger.error("Failed to connect to market data feed: %s", e)
             self.state = ConnectionState.ERROR
             self._trigger_callbacks(self.on_error_callbacks, error=str(e))
             return False
@@ -113,9 +164,14 @@ class MarketDataFeed:
         try:
             logger.info("Disconnecting from market data feed...")
             
+            # Deliver any ticks still waiting in the batch
+            self._stop_batch_flush()
+            self.flush_ticks()
+            
             with self._lock:
                 self.state = ConnectionState.DISCONNECTED
                 self.subscribed_instruments.clear()
+                self._subscribed_snapshot = frozenset()
             
             self._stop_event.set()
             
@@ -126,7 +182,7 @@ class MarketDataFeed:
             self._trigger_callbacks(self.on_disconnect_callbacks)
             
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
     
     def subscribe_instruments(self, instrument_tokens: List[int]) -> bool:
         """
@@ -143,20 +199,19 @@ class MarketDataFeed:
             return False
         
         try:
-            logger.info(f"Subscribing to {len(instrument_tokens)} instruments")
+            logger.info("Subscribing to %d instruments", len(instrument_tokens))
             
             # In real implementation: self.api_client.subscribe(instrument_tokens)
             
             with self._lock:
-                for token in instrument_tokens:
-                    if token not in self.subscribed_instruments:
-                        self.subscribed_instruments.append(token)
+                self.subscribed_instruments.update(instrument_tokens)
+                self._subscribed_snapshot = frozenset(self.subscribed_instruments)
             
-            logger.info(f"Successfully subscribed to {len(instrument_tokens)} instruments")
+            logger.info("Successfully subscribed to %d instruments", len(instrument_tokens))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to subscribe to instruments: {e}")
+            logger.error("Failed to subscribe to instruments: %s", e)
             return False
     
     def unsubscribe_instruments(self, instrument_tokens: List[int]) -> bool:
@@ -170,30 +225,58 @@ class MarketDataFeed:
             True if unsubscription successful, False otherwise
         """
         try:
-            logger.info(f"Unsubscribing from {len(instrument_tokens)} instruments")
+            logger.info("Unsubscribing from %d instruments", len(instrument_tokens))
             
             # In real implementation: self.api_client.unsubscribe(instrument_tokens)
             
             with self._lock:
+                self.subscribed_instruments.difference_update(instrument_tokens)
+                self._subscribed_snapshot = frozenset(self.subscribed_instruments)
                 for token in instrument_tokens:
-                    if token in self.subscribed_instruments:
-                        self.subscribed_instruments.remove(token)
-                    if token in self.latest_ticks:
-                        del self.latest_ticks[token]
+                    self.latest_ticks.pop(token, None)
+                    index = self._token_index.get(token)
+                    if index is not None:
+                        self._last_prices[index] = np.nan
+                        self._volumes[index] = 0
             
-            logger.info(f"Successfully unsubscribed from {len(instrument_tokens)} instruments")
+            logger.info("Successfully unsubscribed from %d instruments", len(instrument_tokens))
             return True
             
         except Exception as e:
-            logger.error(f"Failed to unsubscribe from instruments: {e}")
+            logger.error("Failed to unsubscribe from instruments: %s", e)
             return False
     
-    def process_tick(self, tick_data: Dict[str, Any]) -> None:
+    def process_ticks(self, ticks: List[Dict[str, Any]]) -> None:
+        """
+        Process a batch of incoming ticks from a single WebSocket message.
+        
+        The clock is read once for the whole batch, so ticks without a
+        timestamp in the same message share one. Batched 'ticks' callbacks
+        are flushed at the end of the message.
+        
+        Args:
+            ticks: Raw tick data from WebSocket
+        """
+        now = datetime.now()
+        received_ns = time.monotonic_ns()
+        for tick_data in ticks:
+            self.process_tick(tick_data, now=now, received_ns=received_ns)
+        self.flush_ticks()
+    
+    def process_tick(
+        self,
+        tick_data: Dict[str, Any],
+        now: Optional[datetime] = None,
+        received_ns: Optional[int] = None
+    ) -> None:
         """
         Process incoming tick data.
         
         Args:
             tick_data: Raw tick data from WebSocket
+            now: Timestamp for ticks that have none (defaults to current time)
+            received_ns: Arrival time on the time.monotonic_ns() clock
+                (defaults to the current reading)
         """
         try:
             instrument_token = tick_data.get('instrument_token')
@@ -203,18 +286,125 @@ class MarketDataFeed:
             
             # Add timestamp if not present
             if 'timestamp' not in tick_data:
-                tick_data['timestamp'] = datetime.now()
+                tick_data['timestamp'] = now if now is not None else datetime.now()
             
             # Buffer the tick
+            packed = pack_tick(tick_data)
             with self._lock:
-                self.data_buffer.append(tick_data)
-                self.latest_ticks[instrument_token] = tick_data
+                self.data_buffer.append(packed)
+            self.latest_ticks[instrument_token] = tick_data
+            
+            index = self._token_index.get(instrument_token)
+            if index is None:
+                index = self._add_instrument_slot(instrument_token)
+            try:
+                self._last_prices[index] = tick_data.get('last_price')
+                self._volumes[index] = tick_data.get('volume') or 0
+            except (TypeError, ValueError):
+                # A malformed field must not drop the tick for callbacks
+                logger.warning("Non-numeric price or volume in tick for %s", instrument_token)
+                self._last_prices[index] = np.nan
+                self._volumes[index] = 0
+            self._received_ns[index] = received_ns if received_ns is not None else time.monotonic_ns()
             
             # Trigger callbacks
             self._trigger_callbacks(self.on_tick_callbacks, tick=tick_data)
+            if self.on_ticks_callbacks:
+                self._add_to_batch(tick_data)
             
         except Exception as e:
-            logger.error(f"Error processing tick: {e}")
+            logger.error("Error processing tick: %s", e)
+    
+    def _add_instrument_slot(self, instrument_token: int) -> int:
+        """
+        Assign a row in the columnar latest-tick arrays to a new instrument.
+        
+        Arrays are grown before the token is published in _token_index, so
+        readers never see an index beyond the arrays they hold.
+        
+        Args:
+            instrument_token: Instrument token
+            
+        Returns:
+            Row index for the instrument
+        """
+        # Rare path: hold the lock so a concurrent unsubscribe cannot write
+        # into arrays that are being copied and replaced
+        with self._lock:
+            index = len(self._token_index)
+            capacity = len(self._tokens)
+            if index == capacity:
+                tokens = np.zeros(capacity * 2, dtype=np.int64)
+                last_prices = np.full(capacity * 2, np.nan)
+                volumes = np.zeros(capacity * 2, dtype=np.int64)
+                received_ns = np.zeros(capacity * 2, dtype=np.int64)
+                tokens[:capacity] = self._tokens
+                last_prices[:capacity] = self._last_prices
+                volumes[:capacity] = self._volumes
+                received_ns[:capacity] = self._received_ns
+                self._tokens, self._last_prices = tokens, last_prices
+                self._volumes, self._received_ns = volumes, received_ns
+            
+            self._tokens[index] = instrument_token
+            self._token_index[instrument_token] = index
+            return index
+    
+    def _add_to_batch(self, tick_data: Dict[str, Any]) -> None:
+        """Queue a tick for 'ticks' callbacks, flushing when the batch is full or old."""
+        now = time.monotonic()
+        with self._lock:
+            started = not self._tick_batch
+            if started:
+                self._batch_started = now
+            self._tick_batch.append(tick_data)
+            due = (
+                len(self._tick_batch) >= self.batch_size
+                or (now - self._batch_started) * 1000 >= self.batch_ms
+            )
+        
+        if due:
+            self.flush_ticks()
+        elif started:
+            self._schedule_batch_flush()
+    
+    def _schedule_batch_flush(self) -> None:
+        """Wake the flush thread so a partial batch is delivered after batch_ms."""
+        if self._batch_thread is None:
+            self._batch_thread = threading.Thread(
+                target=self._batch_flush_loop,
+                daemon=True,
+                name="TickBatchFlush"
+            )
+            self._batch_thread.start()
+        self._batch_event.set()
+    
+    def _batch_flush_loop(self) -> None:
+        """Flush partial tick batches that would otherwise wait for the next tick."""
+        while True:
+            self._batch_event.wait()
+            self._batch_event.clear()
+            if self._batch_thread is not threading.current_thread():
+                return
+            time.sleep(self.batch_ms / 1000)
+            self.flush_ticks()
+    
+    def _stop_batch_flush(self) -> None:
+        """Stop the partial-batch flush thread if it is running."""
+        thread, self._batch_thread = self._batch_thread, None
+        if thread is not None:
+            self._batch_event.set()
+            thread.join(timeout=1)
+    
+    def flush_ticks(self) -> None:
+        """Deliver pending batched ticks to 'ticks' callbacks."""
+        with self._dispatch_lock:
+            with self._lock:
+                batch = self._tick_batch
+                if not batch:
+                    return
+                self._tick_batch = []
+            
+            self._trigger_callbacks(self.on_ticks_callbacks, ticks=batch)
     
     def get_latest_tick(self, instrument_token: int) -> Optional[Dict[str, Any]]:
         """
@@ -226,8 +416,29 @@ class MarketDataFeed:
         Returns:
             Latest tick data or None if not available
         """
-        with self._lock:
-            return self.latest_ticks.get(instrument_token)
+        return self.latest_ticks.get(instrument_token)
+    
+    def get_latest_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Get the latest price and volume of every instrument as aligned arrays.
+        
+        Lets strategies evaluate all instruments with vectorized NumPy
+        operations instead of iterating over tick dictionaries. Instruments
+        without a current price (e.g. unsubscribed) have a NaN last_price.
+        'received_ns' is the arrival time of each latest tick on the
+        time.monotonic_ns() clock, for vectorized staleness checks.
+        
+        Returns:
+            Dictionary with 'instrument_token', 'last_price', 'volume' and
+            'received_ns' arrays
+        """
+        count = len(self._token_index)
+        return {
+            'instrument_token': self._tokens[:count].copy(),
+            'last_price': self._last_prices[:count].copy(),
+            'volume': self._volumes[:count].copy(),
+            'received_ns': self._received_ns[:count].copy(),
+        }
     
     def get_buffered_ticks(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -239,10 +450,43 @@ class MarketDataFeed:
         Returns:
             List of tick data
         """
-        with self._lock:
-            if count is None:
-                return list(self.data_buffer)
+        return [unpack_tick(packed) for packed in self.get_packed_ticks(count)]
+    
+    def get_packed_ticks(self, count: Optional[int] = None) -> List[tuple]:
+        """
+        Get buffered ticks as packed tuples ordered by TICK_FIELDS.
+        
+        Cheaper than get_buffered_ticks for consumers that can work with
+        tuples or build Tick objects via Tick(*packed).
+        
+        Args:
+            count: Number of recent ticks to retrieve (None for all). Values
+                of 0 or below slice like ``ticks[-count:]``, so 0 returns
+                every tick and -n skips the oldest n.
+            
+        Returns:
+            List of packed tick tuples
+        """
+        if count is None:
+            return list(self.data_buffer)
+        if count <= 0:
             return list(self.data_buffer)[-count:]
+        
+        # Walk back from the newest tick instead of copying the whole buffer.
+        # The producer may append between creating and draining the iterator,
+        # which invalidates it; retry a few times, then read under the lock
+        # that appends and clears take.
+        for _ in range(_TAIL_READ_ATTEMPTS):
+            try:
+                recent = list(islice(reversed(self.data_buffer), count))
+            except RuntimeError:
+                continue
+            break
+        else:
+            with self._lock:
+                recent = list(islice(reversed(self.data_buffer), count))
+        recent.reverse()
+        return recent
     
     def clear_buffer(self) -> None:
         """Clear the data buffer."""
@@ -258,56 +502,58 @@ class MarketDataFeed:
         """
         Register a callback for events.
         
+        'ticks' callbacks receive a list of ticks, delivered once the batch
+        reaches batch_size ticks or batch_ms milliseconds, at the end of each
+        WebSocket message, and on disconnect.
+        
         Args:
-            callback_type: Type of callback ('tick', 'connect', 'disconnect', 'error')
+            callback_type: Type of callback ('tick', 'ticks', 'connect', 'disconnect', 'error')
             callback: Callback function
         """
-        callback_map = {
-            'tick': self.on_tick_callbacks,
-            'connect': self.on_connect_callbacks,
-            'disconnect': self.on_disconnect_callbacks,
-            'error': self.on_error_callbacks,
-        }
-        
-        if callback_type not in callback_map:
+        attr = _CALLBACK_ATTRS.get(callback_type)
+        if attr is None:
             raise ValueError(f"Invalid callback type: {callback_type}")
         
-        callback_map[callback_type].append(callback)
-        logger.info(f"Registered {callback_type} callback")
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + (callback,))
+        logger.info("Registered %s callback", callback_type)
     
     def _trigger_callbacks(
         self,
-        callbacks: List[Callable],
+        callbacks: Tuple[Callable, ...],
         **kwargs
     ) -> None:
         """
         Trigger registered callbacks.
         
         Args:
-            callbacks: List of callback functions
+            callbacks: Tuple of callback functions
             **kwargs: Arguments to pass to callbacks
         """
         for callback in callbacks:
             try:
                 callback(**kwargs)
             except Exception as e:
-                logger.error(f"Error in callback: {e}")
+                logger.error("Error in callback: %s", e)
     
     def _attempt_reconnect(self) -> None:
         """Attempt to reconnect to market data feed."""
         while not self._stop_event.is_set() and self.reconnect_count < self.max_reconnect_attempts:
             self.reconnect_count += 1
-            logger.info(f"Reconnection attempt {self.reconnect_count}/{self.max_reconnect_attempts}")
+            logger.info("Reconnection attempt %d/%d", self.reconnect_count, self.max_reconnect_attempts)
             
             self.state = ConnectionState.RECONNECTING
             
             if self.connect():
                 # Resubscribe to instruments
-                if self.subscribed_instruments:
-                    self.subscribe_instruments(self.subscribed_instruments.copy())
+                subscribed = self._subscribed_snapshot
+                if subscribed:
+                    self.subscribe_instruments(list(subscribed))
                 return
             
-            time.sleep(self.reconnect_interval)
+            # Wait on the stop event so disconnect() interrupts the back-off
+            if self._stop_event.wait(self.reconnect_interval):
+                return
         
         if self.reconnect_count >= self.max_reconnect_attempts:
             logger.error("Max reconnection attempts reached")
@@ -334,22 +580,23 @@ class MarketDataFeed:
     
     def get_subscribed_instruments(self) -> List[int]:
         """Get list of subscribed instrument tokens."""
-        with self._lock:
-            return self.subscribed_instruments.copy()
+        return list(self._subscribed_snapshot)
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get feed statistics.
         
+        Reads each value without taking the feed lock; the result is a
+        point-in-time view that may be skewed by a concurrent update.
+        
         Returns:
             Dictionary with feed statistics
         """
-        with self._lock:
-            return {
-                'state': self.state.value,
-                'subscribed_instruments': len(self.subscribed_instruments),
-                'buffered_ticks': len(self.data_buffer),
-                'latest_ticks': len(self.latest_ticks),
-                'reconnect_count': self.reconnect_count,
-                'last_connection_time': self.last_connection_time,
-            }
+        return {
+            'state': self.state.value,
+            'subscribed_instruments': len(self._subscribed_snapshot),
+            'buffered_ticks': len(self.data_buffer),
+            'latest_ticks': len(self.latest_ticks),
+            'reconnect_count': self.reconnect_count,
+            'last_connection_time': self.last_connection_time,
+        }
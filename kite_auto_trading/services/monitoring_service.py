@@ -5,15 +5,29 @@ This module provides real-time performance metrics tracking, notification system
 critical errors and alerts, and system health monitoring capabilities.
 """
 
+import heapq
+import itertools
 import logging
+import math
+import queue
+import sys
 import time
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
-from enum import Enum
-from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from enum import Enum, IntEnum
+from collections import Counter, deque
+from operator import attrgetter, itemgetter
 import threading
 
+import numpy as np
+
+try:
+    import psutil
+except ImportError:  # optional; CPU and memory usage are reported as 0.0
+    psutil = None
+
 from kite_auto_trading.services.portfolio_metrics import (
     PortfolioMetricsCalculator,
     PerformanceMetrics,
@@ -23,30 +37,107 @@ from kite_auto_trading.services.portfolio_metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued alerts the notifier emits as one batch
+_NOTIFY_BATCH_SIZE = 32
+
+# Queue sentinel that tells the notifier thread to exit
+_STOP_NOTIFIER = object()
+
+# Most active alerts kept; the oldest are dropped beyond this
+_MAX_ACTIVE_ALERTS = 10_000
+
+# Seconds during which a repeat of the same alert is recorded but not notified
+_ALERT_DEDUP_WINDOW = 300.0
+
+# Seconds a sampled CPU or memory usage value is reused before re-reading it
+_RESOURCE_TTL = 5.0
+
+# Seconds a generated monitoring report is reused while its inputs are unchanged
+_REPORT_TTL = 0.5
+
+_timestamp_of = attrgetter('timestamp')
+_is_acknowledged = attrgetter('acknowledged')
+
+# Portfolio summary fields copied into each performance snapshot
+_snapshot_summary_fields = itemgetter(
+    'portfolio_value', 'total_pnl', 'total_return_pct', 'realized_pnl',
+    'unrealized_pnl', 'num_positions', 'total_trades'
+)
+
+
+def _slice_by_time(
+    items: deque,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None
+) -> list:
+    """
+    Select entries of a timestamp-ordered deque within a time window.
+    
+    Entries are appended in timestamp order, so the window bounds are found
+    by binary search instead of testing every entry.
+    
+    Args:
+        items: Deque of objects with a ``timestamp`` attribute, oldest first
+        start_time: Optional inclusive lower bound
+        end_time: Optional inclusive upper bound
+        
+    Returns:
+        List of entries within the window
+    """
+    snapshot = list(items)
+    lo = bisect_left(snapshot, start_time, key=_timestamp_of) if start_time else 0
+    hi = bisect_right(snapshot, end_time, key=_timestamp_of) if end_time else len(snapshot)
+    return snapshot[lo:hi]
+
 
-class AlertSeverity(Enum):
-    """Alert severity levels."""
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
-    CRITICAL = "CRITICAL"
+class AlertSeverity(IntEnum):
+    """
+    Alert severity levels, ordered from least to most severe.
+    
+    Members are ints so that comparisons in alert filters are plain integer
+    comparisons; use ``.name`` for the display string.
+    """
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+class AlertType(IntEnum):
+    """Types of alerts. Use ``.name`` for the display string."""
+    DRAWDOWN_BREACH = 1
+    LEVERAGE_BREACH = 2
+    CONCENTRATION_BREACH = 3
+    DAILY_LOSS_BREACH = 4
+    SYSTEM_ERROR = 5
+    API_ERROR = 6
+    STRATEGY_ERROR = 7
+    RISK_VIOLATION = 8
+    CONNECTION_LOST = 9
+    PERFORMANCE_DEGRADATION = 10
 
 
-class AlertType(Enum):
-    """Types of alerts."""
-    DRAWDOWN_BREACH = "DRAWDOWN_BREACH"
-    LEVERAGE_BREACH = "LEVERAGE_BREACH"
-    CONCENTRATION_BREACH = "CONCENTRATION_BREACH"
-    DAILY_LOSS_BREACH = "DAILY_LOSS_BREACH"
-    SYSTEM_ERROR = "SYSTEM_ERROR"
-    API_ERROR = "API_ERROR"
-    STRATEGY_ERROR = "STRATEGY_ERROR"
-    RISK_VIOLATION = "RISK_VIOLATION"
-    CONNECTION_LOST = "CONNECTION_LOST"
-    PERFORMANCE_DEGRADATION = "PERFORMANCE_DEGRADATION"
+# Log level and console prefix used when notifying an alert of each severity
+_SEV_TO_LOGLEVEL = {
+    AlertSeverity.LOW: logging.INFO,
+    AlertSeverity.MEDIUM: logging.WARNING,
+    AlertSeverity.HIGH: logging.ERROR,
+    AlertSeverity.CRITICAL: logging.CRITICAL
+}
 
+_SEV_PREFIX = {
+    AlertSeverity.LOW: "",
+    AlertSeverity.MEDIUM: "⚠️ ",
+    AlertSeverity.HIGH: "🔴 ",
+    AlertSeverity.CRITICAL: "🚨 "
+}
 
-@dataclass
+# Enum members by name, for alerts reported by the metrics calculator
+_ALERT_TYPE_BY_NAME = {member.name: member for member in AlertType}
+_SEV_BY_NAME = {member.name: member for member in AlertSeverity}
+
+
+@dataclass(slots=True)
 class Alert:
     """Alert data structure."""
     alert_type: AlertType
@@ -55,9 +146,32 @@ class Alert:
     timestamp: datetime
     details: Dict[str, Any] = field(default_factory=dict)
     acknowledged: bool = False
+    _summary: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """
+        Compact dictionary form of the alert used in monitoring reports.
+        
+        The fields are formatted on first use and memoized; each call returns
+        a fresh copy, so callers may modify the result.
+        
+        Returns:
+            Dictionary with type, severity, message and ISO timestamp
+        """
+        summary = self._summary
+        if summary is None:
+            summary = self._summary = {
+                'type': self.alert_type.name,
+                'severity': self.severity.name,
+                'message': self.message,
+                'timestamp': self.timestamp.isoformat()
+            }
+        return dict(summary)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SystemHealthMetrics:
     """System health metrics."""
     timestamp: datetime
@@ -73,7 +187,7 @@ class SystemHealthMetrics:
     health_score: float  # 0-100
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceSnapshot:
     """Real-time performance snapshot."""
     timestamp: datetime
@@ -90,6 +204,73 @@ class PerformanceSnapshot:
     current_drawdown_pct: float
 
 
+class RunningMean:
+    """
+    Fixed-size window of samples with an incrementally maintained sum.
+    
+    Appending adjusts the sum for the added and evicted samples, so mean()
+    is O(1) instead of summing the window. The sum is recomputed exactly
+    once per full turnover of the window, which bounds floating-point drift
+    and repairs any update lost to concurrent appends.
+    """
+    
+    __slots__ = ('_buf', '_sum', '_evictions')
+    
+    def __init__(self, maxlen: int = 100):
+        self._buf: deque = deque(maxlen=maxlen)
+        self._sum = 0.0
+        self._evictions = 0
+    
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        buf = self._buf
+        if len(buf) == buf.maxlen:
+            self._sum -= buf[0]
+            self._evictions += 1
+        buf.append(value)
+        self._sum += value
+        
+        if self._evictions >= buf.maxlen:
+            self._evictions = 0
+            self._sum = sum(buf)
+    
+    def mean(self) -> float:
+        """Mean of the samples in the window, or 0.0 if empty."""
+        count = len(self._buf)
+        return self._sum / count if count else 0.0
+    
+    def percentile(self, pct: float) -> float:
+        """
+        Nearest-rank percentile of the samples in the window.
+        
+        The window is copied into a NumPy array and partially sorted with
+        np.partition, so no Python-level loop or full sort is needed.
+        
+        Args:
+            pct: Percentile between 0 and 100
+            
+        Returns:
+            The percentile value, or 0.0 if the window is empty
+        """
+        count = len(self._buf)
+        if not count:
+            return 0.0
+        
+        values = np.fromiter(self._buf, dtype=np.float64, count=count)
+        # Nearest rank: the smallest value with at least pct% of samples <= it
+        k = min(count - 1, max(0, math.ceil(pct * count / 100.0) - 1))
+        return float(np.partition(values, k)[k])
+    
+    def __len__(self) -> int:
+        return len(self._buf)
+    
+    def __getitem__(self, index: int) -> float:
+        return self._buf[index]
+    
+    def __iter__(self):
+        return iter(self._buf)
+
+
 class NotificationChannel(Enum):
     """Notification delivery channels."""
     LOG = "LOG"
@@ -150,20 +331,38 @@ class MonitoringService:
             NotificationChannel.CONSOLE
         ]
         
-        # Alert storage
-        self._alerts: List[Alert] = []
+        # Alert storage. Active alerts are an immutable tuple replaced under
+        # _alerts_lock (copy-on-write), so readers use it without locking.
+        self._alerts: Tuple[Alert, ...] = ()
+        self._alerts_lock = threading.Lock()
         self._alert_history: deque = deque(maxlen=1000)
         
+        # Monotonic time each alert key was last notified, guarded by
+        # _alerts_lock; used to suppress repeated notifications
+        self._recent_alert_keys: Dict[tuple, float] = {}
+        
+        # Per-type gate for alerts raised from individual samples: minimum
+        # seconds between them, (monotonic time, severity) of the last one
+        # raised, and how many were suppressed
+        self.alert_min_interval = 60.0
+        self._last_alert_by_type: Dict[AlertType, Tuple[float, AlertSeverity]] = {}
+        self._suppressed_alert_count = 0
+        
         # Performance snapshots
         self._performance_snapshots: deque = deque(maxlen=1000)
         
         # System health tracking
         self._health_metrics: deque = deque(maxlen=100)
+        # Error and warning totals. next() on itertools.count is atomic, so
+        # concurrent recorders never lose an increment; the counts readers
+        # use are the latest values taken from the counters.
+        self._error_counter = itertools.count(1)
+        self._warning_counter = itertools.count(1)
         self._error_count = 0
         self._warning_count = 0
-        self._api_latencies: deque = deque(maxlen=100)
-        self._data_feed_latencies: deque = deque(maxlen=100)
-        self._order_processing_latencies: deque = deque(maxlen=100)
+        self._api_latencies = RunningMean(maxlen=100)
+        self._data_feed_latencies = RunningMean(maxlen=100)
+        self._order_processing_latencies = RunningMean(maxlen=100)
         
         # Notification callbacks
         self._notification_callbacks: Dict[NotificationChannel, Callable] = {}
@@ -172,6 +371,20 @@ class MonitoringService:
         self._is_monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
         self._health_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        
+        # While monitoring runs, alerts are queued here and delivered in
+        # batches by the notifier thread instead of inline
+        self._notify_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._notifier_thread: Optional[threading.Thread] = None
+        
+        # Process handle and cached (value, monotonic time) usage samples
+        self._process = None
+        self._cpu_sample: Tuple[float, float] = (0.0, float('-inf'))
+        self._memory_sample: Tuple[float, float] = (0.0, float('-inf'))
+        
+        # Last generated report as (key, monotonic time, report)
+        self._report_cache: Optional[Tuple[tuple, float, Dict[str, Any]]] = None
         
         logger.info("MonitoringService initialized")
 
@@ -183,84 +396,188 @@ class MonitoringService:
             return
         
         self._is_monitoring = True
+        self._stop_event.clear()
         
-        # Start metrics monitoring thread
-        self._monitor_thread = threading.Thread(
-            target=self._monitor_loop,
+        # Start alert notifier thread
+        self._notifier_thread = threading.Thread(
+            target=self._notifier_loop,
+            name="AlertNotifier",
             daemon=True
         )
-        self._monitor_thread.start()
+        self._notifier_thread.start()
         
-        # Start health check thread
-        self._health_thread = threading.Thread(
-            target=self._health_check_loop,
+        # Start the scheduler thread that runs both metrics updates and
+        # health checks; _health_thread refers to the same thread
+        self._monitor_thread = threading.Thread(
+            target=self._scheduler_loop,
+            name="MonitoringScheduler",
             daemon=True
         )
-        self._health_thread.start()
+        self._monitor_thread.start()
+        self._health_thread = self._monitor_thread
         
         logger.info("Monitoring started")
     
     def stop_monitoring(self):
         """Stop real-time monitoring."""
         self._is_monitoring = False
+        self._stop_event.set()
         
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
         
-        if self._health_thread:
-            self._health_thread.join(timeout=5)
+        if self._notifier_thread:
+            notifier = self._notifier_thread
+            self._notify_queue.put(_STOP_NOTIFIER)
+            notifier.join(timeout=5)
+            self._notifier_thread = None
+            
+            # Deliver anything queued after the notifier exited
+            if not notifier.is_alive():
+                while True:
+                    pending = [
+                        alert for alert in self._drain_notify_queue(None)
+                        if alert is not _STOP_NOTIFIER
+                    ]
+                    if not pending:
+                        break
+                    self._dispatch_alerts(pending)
         
         logger.info("Monitoring stopped")
     
-    def _monitor_loop(self):
-        """Main monitoring loop."""
-        while self._is_monitoring:
+    def _scheduler_loop(self):
+        """
+        Run metrics updates and health checks from a single thread.
+        
+        Jobs are kept in a heap ordered by their next monotonic deadline. The
+        thread waits on the stop event until the earliest deadline, runs that
+        job and reschedules it one interval after its previous deadline. Each
+        job receives the wall-clock time read once when it woke up.
+        """
+        now = time.monotonic()
+        jobs = [
+            (now, 0, self._metrics_tick, 'metrics_update_interval'),
+            (now, 1, self._health_tick, 'health_check_interval'),
+        ]
+        heapq.heapify(jobs)
+        
+        while not self._stop_event.is_set():
+            deadline, order, tick, interval_attr = jobs[0]
+            if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
+            
+            tick(datetime.now())
+            heapq.heapreplace(
+                jobs,
+                (deadline + getattr(self, interval_attr), order, tick, interval_attr)
+            )
+    
+    def _metrics_tick(self, now: datetime):
+        """Update performance metrics and check alert thresholds."""
+        try:
+            # Evaluate metrics and risk alerts in one calculator call
+            thresholds = self.alert_thresholds
+            perf_metrics, risk_alerts = self.metrics_calculator.evaluate_and_alert(
+                max_drawdown_pct=thresholds['max_drawdown_pct'],
+                max_leverage=thresholds['max_leverage'],
+                max_concentration_pct=thresholds['max_concentration_pct'],
+                max_daily_loss_pct=thresholds['max_daily_loss_pct']
+            )
+            
+            # Update performance metrics
+            self._update_performance_metrics(now, perf_metrics)
+            
+            # Check for alerts
+            self._check_alerts(now, risk_alerts)
+            self._prune_recent_alert_keys()
+            
+        except Exception as e:
+            logger.error(f"Error in monitoring loop: {e}", exc_info=True)
+            self._record_error("monitoring_loop", str(e))
+    
+    def _health_tick(self, now: datetime):
+        """Update system health."""
+        try:
+            self._update_system_health(now)
+            
+        except Exception as e:
+            logger.error(f"Error in health check loop: {e}", exc_info=True)
+            self._record_error("health_check_loop", str(e))
+    
+    def _notifier_loop(self):
+        """Deliver queued alerts, batching whatever accumulated meanwhile."""
+        while True:
+            first = self._notify_queue.get()
+            if first is _STOP_NOTIFIER:
+                return
+            
+            alerts = self._drain_notify_queue(first)
+            stopping = alerts and alerts[-1] is _STOP_NOTIFIER
+            if stopping:
+                alerts.pop()
+            
             try:
-                # Update performance metrics
-                self._update_performance_metrics()
-                
-                # Check for alerts
-                self._check_alerts()
-                
-                # Sleep until next update
-                time.sleep(self.metrics_update_interval)
-                
+                self._dispatch_alerts(alerts)
             except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}", exc_info=True)
-                self._record_error("monitoring_loop", str(e))
+                logger.error(f"Error in alert notifier: {e}", exc_info=True)
+            
+            if stopping:
+                return
     
-    def _health_check_loop(self):
-        """Health check loop."""
-        while self._is_monitoring:
+    def _drain_notify_queue(self, first: Optional[Alert]) -> list:
+        """
+        Take up to a batch of queued alerts without blocking.
+        
+        Args:
+            first: Alert already taken from the queue, if any
+            
+        Returns:
+            List of alerts, ending with the stop sentinel if one was taken
+        """
+        alerts = [first] if first is not None else []
+        get_nowait = self._notify_queue.get_nowait
+        while len(alerts) <= _NOTIFY_BATCH_SIZE:
             try:
-                # Update system health
-                self._update_system_health()
-                
-                # Sleep until next check
-                time.sleep(self.health_check_interval)
-                
-            except Exception as e:
-                logger.error(f"Error in health check loop: {e}", exc_info=True)
-                self._record_error("health_check_loop", str(e))
+                item = get_nowait()
+            except queue.Empty:
+                break
+            alerts.append(item)
+            if item is _STOP_NOTIFIER:
+                break
+        return alerts
 
     
-    def _update_performance_metrics(self):
-        """Update real-time performance metrics."""
+    def _update_performance_metrics(
+        self,
+        now: Optional[datetime] = None,
+        perf_metrics: Optional[PerformanceMetrics] = None
+    ):
+        """
+        Update real-time performance metrics.
+        
+        Args:
+            now: Timestamp for the snapshot, defaults to the current time
+            perf_metrics: Already calculated metrics, calculated here if omitted
+        """
         try:
             # Get current performance metrics
-            perf_metrics = self.metrics_calculator.calculate_performance_metrics()
+            if perf_metrics is None:
+                perf_metrics = self.metrics_calculator.calculate_performance_metrics()
             portfolio_summary = self.metrics_calculator.portfolio.get_portfolio_summary()
             
+            (portfolio_value, total_pnl, total_pnl_pct, realized_pnl,
+             unrealized_pnl, num_positions, num_trades) = _snapshot_summary_fields(portfolio_summary)
+            
             # Create performance snapshot
             snapshot = PerformanceSnapshot(
-                timestamp=datetime.now(),
-                portfolio_value=portfolio_summary['portfolio_value'],
-                total_pnl=portfolio_summary['total_pnl'],
-                total_pnl_pct=portfolio_summary['total_return_pct'],
-                realized_pnl=portfolio_summary['realized_pnl'],
-                unrealized_pnl=portfolio_summary['unrealized_pnl'],
-                num_positions=portfolio_summary['num_positions'],
-                num_trades=portfolio_summary['total_trades'],
+                timestamp=now or datetime.now(),
+                portfolio_value=portfolio_value,
+                total_pnl=total_pnl,
+                total_pnl_pct=total_pnl_pct,
+                realized_pnl=realized_pnl,
+                unrealized_pnl=unrealized_pnl,
+                num_positions=num_positions,
+                num_trades=num_trades,
                 win_rate=perf_metrics.win_rate,
                 sharpe_ratio=perf_metrics.sharpe_ratio,
                 max_drawdown_pct=perf_metrics.max_drawdown_pct,
@@ -269,38 +586,39 @@ class MonitoringService:
             
             self._performance_snapshots.append(snapshot)
             
-            logger.debug(f"Performance metrics updated: PnL={snapshot.total_pnl:.2f}, "
-                        f"Positions={snapshot.num_positions}, WinRate={snapshot.win_rate:.2f}%")
+            logger.debug(
+                "Performance metrics updated: PnL=%.2f, Positions=%d, WinRate=%.2f%%",
+                snapshot.total_pnl, snapshot.num_positions, snapshot.win_rate
+            )
             
         except Exception as e:
-            logger.error(f"Error updating performance metrics: {e}", exc_info=True)
+            logger.error("Error updating performance metrics: %s", e, exc_info=True)
             self._record_error("performance_metrics", str(e))
 
     
-    def _update_system_health(self):
-        """Update system health metrics."""
+    def _update_system_health(self, now: Optional[datetime] = None):
+        """
+        Update system health metrics.
+        
+        Args:
+            now: Timestamp for the metrics and any alert, defaults to the
+                current time
+        """
+        if now is None:
+            now = datetime.now()
+        
         try:
             # Calculate average latencies
-            avg_api_latency = (
-                sum(self._api_latencies) / len(self._api_latencies)
-                if self._api_latencies else 0.0
-            )
-            
-            avg_data_feed_latency = (
-                sum(self._data_feed_latencies) / len(self._data_feed_latencies)
-                if self._data_feed_latencies else 0.0
-            )
-            
-            avg_order_latency = (
-                sum(self._order_processing_latencies) / len(self._order_processing_latencies)
-                if self._order_processing_latencies else 0.0
-            )
+            avg_api_latency = self._api_latencies.mean()
+            avg_data_feed_latency = self._data_feed_latencies.mean()
+            avg_order_latency = self._order_processing_latencies.mean()
             
-            # Calculate health score (0-100)
+            # Calculate health score (0-100) from tail latencies, so that
+            # a minority of slow calls is not hidden by the average
             health_score = self._calculate_health_score(
-                avg_api_latency,
-                avg_data_feed_latency,
-                avg_order_latency
+                self._api_latencies.percentile(95),
+                self._data_feed_latencies.percentile(95),
+                self._order_processing_latencies.percentile(95)
             )
             
             # Determine if system is healthy
@@ -308,9 +626,9 @@ class MonitoringService:
             
             # Create health metrics
             health_metrics = SystemHealthMetrics(
-                timestamp=datetime.now(),
-                cpu_usage=0.0,  # Placeholder - would use psutil in production
-                memory_usage=0.0,  # Placeholder - would use psutil in production
+                timestamp=now,
+                cpu_usage=self._cpu_usage(),
+                memory_usage=self._memory_usage(),
                 api_latency_ms=avg_api_latency,
                 data_feed_latency_ms=avg_data_feed_latency,
                 order_processing_latency_ms=avg_order_latency,
@@ -334,17 +652,75 @@ class MonitoringService:
                         'health_score': health_score,
                         'api_latency_ms': avg_api_latency,
                         'error_count': self._error_count
-                    }
+                    },
+                    now=now
                 )
             
-            logger.debug(f"System health updated: Score={health_score:.1f}, "
-                        f"Healthy={is_healthy}, Errors={self._error_count}")
+            logger.debug(
+                "System health updated: Score=%.1f, Healthy=%s, Errors=%d",
+                health_score, is_healthy, self._error_count
+            )
             
         except Exception as e:
-            logger.error(f"Error updating system health: {e}", exc_info=True)
+            logger.error("Error updating system health: %s", e, exc_info=True)
             self._record_error("system_health", str(e))
 
     
+    def _get_process(self):
+        """Return the psutil handle for this process, or None without psutil."""
+        if psutil is None:
+            return None
+        if self._process is None:
+            self._process = psutil.Process()
+        return self._process
+    
+    def _cpu_usage(self) -> float:
+        """
+        CPU usage of this process in percent, refreshed at most every few seconds.
+        
+        Returns:
+            CPU usage percentage, or 0.0 if psutil is not installed
+        """
+        value, sampled_at = self._cpu_sample
+        now = time.monotonic()
+        if now - sampled_at < _RESOURCE_TTL:
+            return value
+        
+        process = self._get_process()
+        if process is None:
+            return 0.0
+        
+        try:
+            value = process.cpu_percent(interval=None)
+        except Exception as e:
+            logger.debug("Could not read CPU usage: %s", e)
+        self._cpu_sample = (value, now)
+        return value
+    
+    def _memory_usage(self) -> float:
+        """
+        Memory usage of this process in percent, refreshed at most every few seconds.
+        
+        Returns:
+            Resident memory as a percentage of system memory, or 0.0 if psutil
+            is not installed
+        """
+        value, sampled_at = self._memory_sample
+        now = time.monotonic()
+        if now - sampled_at < _RESOURCE_TTL:
+            return value
+        
+        process = self._get_process()
+        if process is None:
+            return 0.0
+        
+        try:
+            value = process.memory_percent()
+        except Exception as e:
+            logger.debug("Could not read memory usage: %s", e)
+        self._memory_sample = (value, now)
+        return value
+    
     def _calculate_health_score(
         self,
         api_latency: float,
@@ -381,21 +757,36 @@ class MonitoringService:
         
         return max(0.0, score)
     
-    def _check_alerts(self):
-        """Check for alert conditions."""
+    def _check_alerts(
+        self,
+        now: Optional[datetime] = None,
+        risk_alerts: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Check for alert conditions.
+        
+        Args:
+            now: Timestamp for created alerts, defaults to the current time
+            risk_alerts: Already evaluated risk alerts, checked here if omitted
+        """
+        if now is None:
+            now = datetime.now()
+        
         try:
             # Check risk alerts from metrics calculator
-            risk_alerts = self.metrics_calculator.check_risk_alerts(
-                max_drawdown_pct=self.alert_thresholds['max_drawdown_pct'],
-                max_leverage=self.alert_thresholds['max_leverage'],
-                max_concentration_pct=self.alert_thresholds['max_concentration_pct'],
-                max_daily_loss_pct=self.alert_thresholds['max_daily_loss_pct']
-            )
+            if risk_alerts is None:
+                risk_alerts = self.metrics_calculator.check_risk_alerts(
+                    max_drawdown_pct=self.alert_thresholds['max_drawdown_pct'],
+                    max_leverage=self.alert_thresholds['max_leverage'],
+                    max_concentration_pct=self.alert_thresholds['max_concentration_pct'],
+                    max_daily_loss_pct=self.alert_thresholds['max_daily_loss_pct']
+                )
             
-            # Create alerts for each risk breach
+            # Create alerts for each risk breach; unrecognised names fall back
+            # to a generic type and severity rather than aborting the check
             for risk_alert in risk_alerts:
-                alert_type = AlertType[risk_alert['type']]
-                severity = AlertSeverity[risk_alert['severity']]
+                alert_type = _ALERT_TYPE_BY_NAME.get(risk_alert['type'], AlertType.SYSTEM_ERROR)
+                severity = _SEV_BY_NAME.get(risk_alert['severity'], AlertSeverity.MEDIUM)
                 
                 self._create_alert(
                     alert_type,
@@ -404,7 +795,8 @@ class MonitoringService:
                     {
                         'value': risk_alert['value'],
                         'threshold': risk_alert['threshold']
-                    }
+                    },
+                    now=now
                 )
             
         except Exception as e:
@@ -417,33 +809,133 @@ class MonitoringService:
         alert_type: AlertType,
         severity: AlertSeverity,
         message: str,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None
     ):
         """
         Create and send an alert.
         
+        An alert with the same type, severity and value (or message, when
+        there is no value) as one notified within the dedup window is still
+        recorded, but no notification is sent for it.
+        
         Args:
             alert_type: Type of alert
             severity: Alert severity
             message: Alert message
             details: Additional details
+            now: Alert timestamp, defaults to the current time
         """
         alert = Alert(
             alert_type=alert_type,
             severity=severity,
             message=message,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
             details=details or {}
         )
         
+        value = alert.details.get('value')
+        if isinstance(value, (int, float)):
+            key = (alert_type, severity, round(value, 2))
+        else:
+            key = (alert_type, severity, message)
+        notified_at = time.monotonic()
+        
         # Add to active alerts
-        self._alerts.append(alert)
-        self._alert_history.append(alert)
+        with self._alerts_lock:
+            alerts = self._alerts
+            if len(alerts) >= _MAX_ACTIVE_ALERTS:
+                alerts = alerts[len(alerts) - _MAX_ACTIVE_ALERTS + 1:]
+            self._alerts = alerts + (alert,)
+            self._alert_history.append(alert)
+            
+            last_notified = self._recent_alert_keys.get(key)
+            if last_notified is not None and notified_at - last_notified < _ALERT_DEDUP_WINDOW:
+                return
+            self._recent_alert_keys[key] = notified_at
+        
+        # Hand off to the notifier thread while monitoring runs; otherwise
+        # there is no thread to drain the queue, so deliver inline
+        if self._notifier_thread is not None:
+            self._notify_queue.put(alert)
+        else:
+            self._dispatch_alerts([alert])
+    
+    def _prune_recent_alert_keys(self):
+        """Forget alert keys whose dedup window has expired."""
+        cutoff = time.monotonic() - _ALERT_DEDUP_WINDOW
+        with self._alerts_lock:
+            self._recent_alert_keys = {
+                key: notified_at
+                for key, notified_at in self._recent_alert_keys.items()
+                if notified_at >= cutoff
+            }
+    
+    def _dispatch_alerts(self, alerts: List[Alert]):
+        """
+        Deliver alerts, as a single batch message when there are several.
+        
+        Args:
+            alerts: Alerts to deliver
+        """
+        if len(alerts) == 1:
+            self._send_notification(alerts[0])
+        elif alerts:
+            self._send_batch_notification(alerts)
+    
+    def _send_batch_notification(self, alerts: List[Alert]):
+        """
+        Send several alerts through configured channels at once.
         
-        # Send notifications
-        self._send_notification(alert)
+        Log and console channels receive one summary message for the whole
+        batch; custom callbacks still receive each alert.
+        
+        Args:
+            alerts: Alerts to send
+        """
+        for channel in self.notification_channels:
+            try:
+                if channel == NotificationChannel.LOG:
+                    self._send_batch_log_notification(alerts)
+                elif channel == NotificationChannel.CONSOLE:
+                    self._send_batch_console_notification(alerts)
+                elif channel in self._notification_callbacks:
+                    callback = self._notification_callbacks[channel]
+                    for alert in alerts:
+                        callback(alert)
+                
+            except Exception as e:
+                logger.error(f"Error sending notification via {channel.value}: {e}")
+    
+    def _send_batch_log_notification(self, alerts: List[Alert]):
+        """Send one log record summarising a batch of alerts."""
+        log_level = max(
+            _SEV_TO_LOGLEVEL.get(alert.severity, logging.WARNING)
+            for alert in alerts
+        )
+        if not logger.isEnabledFor(log_level):
+            return
         
-        logger.warning(f"Alert created: [{severity.value}] {alert_type.value} - {message}")
+        summary = "; ".join(
+            f"[{alert.severity.name}] {alert.alert_type.name}: {alert.message}"
+            for alert in alerts
+        )
+        logger.log(
+            log_level,
+            f"ALERTS ({len(alerts)}) {summary}",
+            extra={'alert_details': [alert.details for alert in alerts]}
+        )
+    
+    def _send_batch_console_notification(self, alerts: List[Alert]):
+        """Send one console message listing a batch of alerts."""
+        lines = [f"\nALERTS ({len(alerts)})"]
+        for alert in alerts:
+            lines.append(
+                f"  - [{alert.severity.name}] {alert.alert_type.name} "
+                f"{alert.timestamp.strftime('%H:%M:%S')}: {alert.message}"
+            )
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
     
     def _send_notification(self, alert: Alert):
         """
@@ -467,35 +959,27 @@ class MonitoringService:
     
     def _send_log_notification(self, alert: Alert):
         """Send notification to log file."""
-        log_level = {
-            AlertSeverity.LOW: logging.INFO,
-            AlertSeverity.MEDIUM: logging.WARNING,
-            AlertSeverity.HIGH: logging.ERROR,
-            AlertSeverity.CRITICAL: logging.CRITICAL
-        }.get(alert.severity, logging.WARNING)
+        log_level = _SEV_TO_LOGLEVEL.get(alert.severity, logging.WARNING)
+        if not logger.isEnabledFor(log_level):
+            return
         
         logger.log(
             log_level,
-            f"ALERT [{alert.severity.value}] {alert.alert_type.value}: {alert.message}",
+            "ALERT [%s] %s: %s",
+            alert.severity.name, alert.alert_type.name, alert.message,
             extra={'alert_details': alert.details}
         )
     
     def _send_console_notification(self, alert: Alert):
         """Send notification to console."""
-        severity_colors = {
-            AlertSeverity.LOW: "",
-            AlertSeverity.MEDIUM: "⚠️ ",
-            AlertSeverity.HIGH: "🔴 ",
-            AlertSeverity.CRITICAL: "🚨 "
-        }
-        
-        prefix = severity_colors.get(alert.severity, "")
-        print(f"\n{prefix}ALERT [{alert.severity.value}] {alert.alert_type.value}")
-        print(f"  {alert.message}")
-        print(f"  Time: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        if alert.details:
-            print(f"  Details: {alert.details}")
-        print()
+        prefix = _SEV_PREFIX.get(alert.severity, "")
+        sys.stdout.write("".join([
+            f"\n{prefix}ALERT [{alert.severity.name}] {alert.alert_type.name}\n",
+            f"  {alert.message}\n",
+            f"  Time: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"  Details: {alert.details}\n" if alert.details else "",
+            "\n",
+        ]))
 
     
     def register_notification_callback(
@@ -517,7 +1001,9 @@ class MonitoringService:
         """Record API call latency."""
         self._api_latencies.append(latency_ms)
         
-        if latency_ms > self.alert_thresholds['max_api_latency_ms']:
+        if (latency_ms > self.alert_thresholds['max_api_latency_ms']
+                and self._admit_sample_alert(
+                    AlertType.PERFORMANCE_DEGRADATION, AlertSeverity.MEDIUM)):
             self._create_alert(
                 AlertType.PERFORMANCE_DEGRADATION,
                 AlertSeverity.MEDIUM,
@@ -525,6 +1011,29 @@ class MonitoringService:
                 {'latency_ms': latency_ms}
             )
     
+    def _admit_sample_alert(self, alert_type: AlertType, severity: AlertSeverity) -> bool:
+        """
+        Rate-limit alerts raised from individual samples.
+        
+        An alert is admitted if no alert of its type was admitted within
+        alert_min_interval seconds, or if it is more severe than that one.
+        
+        Args:
+            alert_type: Type of the alert about to be created
+            severity: Its severity
+            
+        Returns:
+            True if the alert should be created
+        """
+        now = time.monotonic()
+        last = self._last_alert_by_type.get(alert_type)
+        if last is not None and now - last[0] < self.alert_min_interval and severity <= last[1]:
+            self._suppressed_alert_count += 1
+            return False
+        
+        self._last_alert_by_type[alert_type] = (now, severity)
+        return True
+    
     def record_data_feed_latency(self, latency_ms: float):
         """Record data feed latency."""
         self._data_feed_latencies.append(latency_ms)
@@ -535,7 +1044,7 @@ class MonitoringService:
     
     def _record_error(self, component: str, error_message: str):
         """Record an error occurrence."""
-        self._error_count += 1
+        self._error_count = next(self._error_counter)
         
         # Create error alert for critical components
         if component in ['api', 'strategy', 'risk_manager']:
@@ -548,7 +1057,7 @@ class MonitoringService:
     
     def record_warning(self):
         """Record a warning occurrence."""
-        self._warning_count += 1
+        self._warning_count = next(self._warning_counter)
 
     
     def get_current_performance(self) -> Optional[PerformanceSnapshot]:
@@ -575,15 +1084,7 @@ class MonitoringService:
         Returns:
             List of PerformanceSnapshot objects
         """
-        snapshots = list(self._performance_snapshots)
-        
-        if start_time:
-            snapshots = [s for s in snapshots if s.timestamp >= start_time]
-        
-        if end_time:
-            snapshots = [s for s in snapshots if s.timestamp <= end_time]
-        
-        return snapshots
+        return _slice_by_time(self._performance_snapshots, start_time, end_time)
     
     def get_system_health(self) -> Optional[SystemHealthMetrics]:
         """
@@ -609,15 +1110,7 @@ class MonitoringService:
         Returns:
             List of SystemHealthMetrics objects
         """
-        metrics = list(self._health_metrics)
-        
-        if start_time:
-            metrics = [m for m in metrics if m.timestamp >= start_time]
-        
-        if end_time:
-            metrics = [m for m in metrics if m.timestamp <= end_time]
-        
-        return metrics
+        return _slice_by_time(self._health_metrics, start_time, end_time)
 
     
     def get_active_alerts(
@@ -633,12 +1126,13 @@ class MonitoringService:
         Returns:
             List of active Alert objects
         """
-        alerts = [a for a in self._alerts if not a.acknowledged]
+        if severity is not None:
+            return [
+                a for a in self._alerts
+                if a.severity == severity and not a.acknowledged
+            ]
         
-        if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-        
-        return alerts
+        return list(itertools.filterfalse(_is_acknowledged, self._alerts))
     
     def get_alert_history(
         self,
@@ -657,15 +1151,9 @@ class MonitoringService:
         Returns:
             List of Alert objects
         """
-        alerts = list(self._alert_history)
-        
-        if start_time:
-            alerts = [a for a in alerts if a.timestamp >= start_time]
+        alerts = _slice_by_time(self._alert_history, start_time, end_time)
         
-        if end_time:
-            alerts = [a for a in alerts if a.timestamp <= end_time]
-        
-        if alert_type:
+        if alert_type is not None:
             alerts = [a for a in alerts if a.alert_type == alert_type]
         
         return alerts
@@ -678,17 +1166,21 @@ class MonitoringService:
             alert: Alert to acknowledge
         """
         alert.acknowledged = True
-        logger.info(f"Alert acknowledged: {alert.alert_type.value}")
+        self._report_cache = None
+        logger.info(f"Alert acknowledged: {alert.alert_type.name}")
     
     def acknowledge_all_alerts(self):
         """Acknowledge all active alerts."""
-        for alert in self._alerts:
+        alerts = self._alerts
+        for alert in alerts:
             alert.acknowledged = True
-        logger.info(f"All {len(self._alerts)} alerts acknowledged")
+        self._report_cache = None
+        logger.info(f"All {len(alerts)} alerts acknowledged")
     
     def clear_acknowledged_alerts(self):
         """Remove acknowledged alerts from active list."""
-        self._alerts = [a for a in self._alerts if not a.acknowledged]
+        with self._alerts_lock:
+            self._alerts = tuple(itertools.filterfalse(_is_acknowledged, self._alerts))
         logger.info("Acknowledged alerts cleared")
 
     
@@ -696,14 +1188,32 @@ class MonitoringService:
         """
         Generate comprehensive monitoring report.
         
+        A report is reused for a short time while the latest snapshot, health
+        metrics and active alerts are unchanged, so frequent polling does not
+        rebuild it on every call. Each caller gets a fresh top-level dict; the
+        nested section dicts are shared with the cache and must be treated as
+        read-only.
+        
         Returns:
             Dictionary containing monitoring report
         """
         current_perf = self.get_current_performance()
         current_health = self.get_system_health()
-        active_alerts = self.get_active_alerts()
+        alerts = self._alerts
+        key = (current_perf, current_health, alerts)
+        
+        cached = self._report_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < _REPORT_TTL:
+            cached_perf, cached_health, cached_alerts = cached[0]
+            if (cached_perf is current_perf and cached_health is current_health
+                    and cached_alerts is alerts):
+                return dict(cached[2])
         
-        return {
+        active_alerts = list(itertools.filterfalse(_is_acknowledged, alerts))
+        severity_counts = Counter(a.severity for a in active_alerts)
+        
+        report = {
             'timestamp': datetime.now(),
             'performance': {
                 'portfolio_value': current_perf.portfolio_value if current_perf else 0.0,
@@ -723,19 +1233,16 @@ class MonitoringService:
             },
             'alerts': {
                 'active_count': len(active_alerts),
-                'critical_count': len([a for a in active_alerts if a.severity == AlertSeverity.CRITICAL]),
-                'high_count': len([a for a in active_alerts if a.severity == AlertSeverity.HIGH]),
-                'medium_count': len([a for a in active_alerts if a.severity == AlertSeverity.MEDIUM]),
-                'low_count': len([a for a in active_alerts if a.severity == AlertSeverity.LOW]),
+                'critical_count': severity_counts[AlertSeverity.CRITICAL],
+                'high_count': severity_counts[AlertSeverity.HIGH],
+                'medium_count': severity_counts[AlertSeverity.MEDIUM],
+                'low_count': severity_counts[AlertSeverity.LOW],
                 'recent_alerts': [
-                    {
-                        'type': a.alert_type.value,
-                        'severity': a.severity.value,
-                        'message': a.message,
-                        'timestamp': a.timestamp.isoformat()
-                    }
-                    for a in active_alerts[:10]
+                    a.to_summary() for a in itertools.islice(active_alerts, 10)
                 ]
             },
-            'thresholds': self.alert_thresholds
+            'thresholds': dict(self.alert_thresholds)
         }
+        
+        self._report_cache = (key, now, report)
+        return dict(report)
@@ -2,15 +2,19 @@
 Order management system for handling order lifecycle, queue processing, and execution tracking.
 """
 
+import heapq
+import itertools
 import logging
+import random
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
-from queue import Queue, Empty
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+from queue import SimpleQueue, Empty
 
 from kite_auto_trading.models.base import (
     Order,
@@ -18,11 +22,24 @@ from kite_auto_trading.models.base import (
     OrderType,
     TransactionType,
     OrderExecutor,
+    ACTIVE_ORDER_STATUSES,
+    TERMINAL_ORDER_STATUSES,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Most recent status updates kept per order; older entries are dropped
+STATUS_HISTORY_LIMIT = 256
+
+# Slots per StripedCounter
+COUNTER_STRIPES = 16
+
+# Status-change messages for monitoring updates, built once per status
+_MONITOR_STATUS_MESSAGES = {
+    status: f"Status changed to {status.value} via monitoring" for status in OrderStatus
+}
+
 
 class OrderValidationError(Exception):
     """Exception raised when order validation fails."""
@@ -34,7 +51,7 @@ class OrderExecutionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderUpdate:
     """Represents an order status update."""
     order_id: str
@@ -46,7 +63,7 @@ class OrderUpdate:
     exchange_order_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     """Represents a partial or complete fill of an order."""
     order_id: str
@@ -91,7 +108,7 @@ class PositionUpdate:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRecord:
     """Internal record for tracking order lifecycle."""
     order: Order
@@ -99,7 +116,9 @@ class OrderRecord:
     updated_at: Optional[datetime] = None
     filled_quantity: int = 0
     average_price: float = 0.0
-    status_history: List[OrderUpdate] = field(default_factory=list)
+    status_history: Deque[OrderUpdate] = field(
+        default_factory=lambda: deque(maxlen=STATUS_HISTORY_LIMIT)
+    )
     fills: List[Fill] = field(default_factory=list)
     retry_count: int = 0
     error_message: str = ""
@@ -109,6 +128,75 @@ class OrderRecord:
     total_commission: float = 0.0
 
 
+class StripedCounter:
+    """
+    Counter split into a fixed set of lock-striped slots.
+    
+    Each thread adds into the slot picked by its native thread id, so
+    concurrent increments mostly take different locks. The slot count is
+    fixed, so short-lived worker threads leave nothing behind. Reading sums
+    the slots.
+    """
+    
+    __slots__ = ('_slots', '_locks', '_zero')
+    
+    def __init__(self, zero: float = 0, stripes: int = COUNTER_STRIPES):
+        self._slots: List[float] = [zero] * stripes
+        self._locks = tuple(threading.Lock() for _ in range(stripes))
+        self._zero = zero
+    
+    def add(self, amount: float = 1) -> None:
+        """Add amount to the calling thread's slot."""
+        index = threading.get_native_id() % len(self._slots)
+        with self._locks[index]:
+            self._slots[index] += amount
+    
+    @property
+    def value(self) -> float:
+        """Current total across all slots."""
+        return sum(self._slots, self._zero)
+
+
+def _require_price(order: Order) -> None:
+    """Raise unless the order carries a positive limit price."""
+    if order.price is None or order.price <= 0:
+        raise OrderValidationError(
+            f"Valid price is required for {order.order_type.value} orders"
+        )
+
+
+def _require_trigger_price(order: Order) -> None:
+    """Raise unless the order carries a positive trigger price."""
+    if order.trigger_price is None or order.trigger_price <= 0:
+        raise OrderValidationError(
+            f"Valid trigger price is required for {order.order_type.value} orders"
+        )
+
+
+def _validate_sl_order(order: Order) -> None:
+    """Validate a stop-loss limit order's prices and their relationship."""
+    _require_price(order)
+    _require_trigger_price(order)
+    if order.transaction_type is TransactionType.BUY:
+        if order.trigger_price <= order.price:
+            raise OrderValidationError(
+                "For BUY SL orders, trigger price must be greater than limit price"
+            )
+    elif order.trigger_price >= order.price:
+        raise OrderValidationError(
+            "For SELL SL orders, trigger price must be less than limit price"
+        )
+
+
+# Order-type specific checks, resolved once per order by a single lookup.
+# MARKET orders need no price checks and have no entry.
+_ORDER_TYPE_VALIDATORS: Dict[OrderType, Callable[[Order], None]] = {
+    OrderType.LIMIT: _require_price,
+    OrderType.SL: _validate_sl_order,
+    OrderType.SL_M: _require_trigger_price,
+}
+
+
 class OrderManager:
     """
     Manages order lifecycle including validation, submission, tracking, and modifications.
@@ -142,41 +230,54 @@ class OrderManager:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
-        # Order tracking
+        # Order tracking. Entries are only ever added, under self._lock, and
+        # records are updated in place, so getters read without the lock.
         self._orders: Dict[str, OrderRecord] = {}
-        self._order_queue: Queue = Queue()
+        # SimpleQueue is implemented in C without the Condition objects and
+        # task accounting of queue.Queue, so enqueueing never contends on a
+        # Python-level lock. None is a wake-up marker, never an order ID.
+        self._order_queue: SimpleQueue = SimpleQueue()
         self._pending_orders: Set[str] = set()
+        # Order IDs indexed by current status, so status queries and counts
+        # are O(matching orders) instead of a scan over every record.
+        self._by_status: Dict[OrderStatus, Set[str]] = {status: set() for status in OrderStatus}
+        self._order_sequence = itertools.count(1)  # keeps generated IDs unique
         
         # Thread safety
         self._lock = threading.RLock()
         
         # Queue processing
         self._queue_processor_thread: Optional[threading.Thread] = None
+        # Failed orders waiting for their backoff deadline: (monotonic time, order ID)
+        self._retry_heap: List[Tuple[float, str]] = []
+        self._retry_lock = threading.Lock()
         self._stop_processing = threading.Event()
         self._enable_queue_processing = enable_queue_processing
         
-        # Callbacks
-        self._order_callbacks: List[Callable[[OrderUpdate], None]] = []
-        self._fill_callbacks: List[Callable[[Fill], None]] = []
-        self._execution_callbacks: List[Callable[[ExecutionReport], None]] = []
-        self._position_callbacks: List[Callable[[PositionUpdate], None]] = []
+        # Callbacks. Registration swaps in a new tuple (copy-on-write), so
+        # dispatch iterates a stable snapshot without taking the lock.
+        self._order_callbacks: Tuple[Callable[[OrderUpdate], None], ...] = ()
+        self._fill_callbacks: Tuple[Callable[[Fill], None], ...] = ()
+        self._execution_callbacks: Tuple[Callable[[ExecutionReport], None], ...] = ()
+        self._position_callbacks: Tuple[Callable[[PositionUpdate], None], ...] = ()
         
         # Execution monitoring
         self._monitoring_thread: Optional[threading.Thread] = None
         self._monitoring_enabled = False
         self._monitoring_interval = 1.0  # seconds
+        self._monitoring_wakeup = threading.Event()  # set to end the poll wait early
         self._position_tracker: Dict[str, PositionUpdate] = {}
         
-        # Statistics
-        self._stats = {
-            'total_submitted': 0,
-            'total_completed': 0,
-            'total_cancelled': 0,
-            'total_rejected': 0,
-            'total_failed': 0,
-            'total_fills': 0,
-            'total_volume': 0.0,
-            'total_commission': 0.0,
+        # Statistics, as lock-free counters summed when read
+        self._stats: Dict[str, StripedCounter] = {
+            'total_submitted': StripedCounter(),
+            'total_completed': StripedCounter(),
+            'total_cancelled': StripedCounter(),
+            'total_rejected': StripedCounter(),
+            'total_failed': StripedCounter(),
+            'total_fills': StripedCounter(),
+            'total_volume': StripedCounter(0.0),
+            'total_commission': StripedCounter(0.0),
         }
         
         if self._enable_queue_processing:
@@ -206,6 +307,7 @@ class OrderManager:
             return
         
         self._stop_processing.set()
+        self._order_queue.put(None)  # wake the processor if it is waiting
         self._queue_processor_thread.join(timeout=5.0)
         logger.info("Order queue processing stopped")
     
@@ -228,23 +330,7 @@ class OrderManager:
             if validate:
                 self._validate_order(order)
             
-            # Generate internal order ID if not present
-            if not order.order_id:
-                order.order_id = self._generate_order_id()
-            
-            # Create order record
-            record = OrderRecord(
-                order=order,
-                submitted_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            
-            # Store order record
-            self._orders[order.order_id] = record
-            self._pending_orders.add(order.order_id)
-            
-            # Add to queue for processing
-            self._order_queue.put(order.order_id)
+            self._store_order(order, datetime.now())
             
             logger.info(
                 f"Order submitted: {order.order_id} - "
@@ -253,6 +339,70 @@ class OrderManager:
             
             return order.order_id
     
+    def submit_orders(self, orders: List[Order], validate: bool = True) -> List[str]:
+        """
+        Submit several orders for execution in one batch.
+        
+        All orders are validated before any is stored, so a validation
+        failure submits none of them. The orders are then recorded and
+        queued under a single lock acquisition.
+        
+        Args:
+            orders: Order objects to submit
+            validate: Whether to validate orders before submission
+            
+        Returns:
+            Internal order IDs, in the same order as the orders
+            
+        Raises:
+            OrderValidationError: If any order fails validation
+        """
+        if validate:
+            for order in orders:
+                self._validate_order(order)
+        
+        now = datetime.now()
+        with self._lock:
+            order_ids = [self._store_order(order, now) for order in orders]
+        
+        logger.info(f"Submitted {len(order_ids)} orders")
+        return order_ids
+    
+    def _store_order(self, order: Order, now: datetime) -> str:
+        """
+        Record an order and queue it for execution. Caller must hold the lock.
+        
+        Args:
+            order: Order to store
+            now: Submission timestamp
+            
+        Returns:
+            Internal order ID
+        """
+        # Generate internal order ID if not present
+        if not order.order_id:
+            order.order_id = self._generate_order_id(now)
+        
+        # Create order record
+        record = OrderRecord(
+            order=order,
+            submitted_at=now,
+            updated_at=now
+        )
+        
+        # Store order record
+        previous = self._orders.get(order.order_id)
+        if previous is not None:
+            self._by_status[previous.order.status].discard(order.order_id)
+        self._orders[order.order_id] = record
+        self._by_status[order.status].add(order.order_id)
+        self._pending_orders.add(order.order_id)
+        
+        # Add to queue for processing
+        self._order_queue.put(order.order_id)
+        
+        return order.order_id
+    
     def _validate_order(self, order: Order) -> None:
         """
         Validate order parameters.
@@ -274,30 +424,9 @@ class OrderManager:
             raise OrderValidationError("Quantity must be positive")
         
         # Validate order type specific requirements
-        if order.order_type in [OrderType.LIMIT, OrderType.SL]:
-            if order.price is None or order.price <= 0:
-                raise OrderValidationError(
-                    f"Valid price is required for {order.order_type.value} orders"
-                )
-        
-        if order.order_type in [OrderType.SL, OrderType.SL_M]:
-            if order.trigger_price is None or order.trigger_price <= 0:
-                raise OrderValidationError(
-                    f"Valid trigger price is required for {order.order_type.value} orders"
-                )
-        
-        # Validate price relationships for stop-loss orders
-        if order.order_type == OrderType.SL:
-            if order.transaction_type == TransactionType.BUY:
-                if order.trigger_price <= order.price:
-                    raise OrderValidationError(
-                        "For BUY SL orders, trigger price must be greater than limit price"
-                    )
-            else:  # SELL
-                if order.trigger_price >= order.price:
-                    raise OrderValidationError(
-                        "For SELL SL orders, trigger price must be less than limit price"
-                    )
+        validator = _ORDER_TYPE_VALIDATORS.get(order.order_type)
+        if validator is not None:
+            validator(order)
     
     def _process_queue(self) -> None:
         """Process orders from the queue (runs in separate thread)."""
@@ -305,14 +434,19 @@ class OrderManager:
         
         while not self._stop_processing.is_set():
             try:
+                # Requeue retries whose backoff has expired, then wait no
+                # longer than the next retry deadline
+                next_retry = self._release_due_retries(time.monotonic())
+                timeout = 1.0 if next_retry is None else min(next_retry, 1.0)
+                
                 # Get order from queue with timeout
-                order_id = self._order_queue.get(timeout=1.0)
+                order_id = self._order_queue.get(timeout=timeout)
+                if order_id is None:
+                    continue
                 
                 # Process the order
                 self._execute_order(order_id)
                 
-                self._order_queue.task_done()
-                
             except Empty:
                 # No orders in queue, continue waiting
                 continue
@@ -321,6 +455,36 @@ class OrderManager:
         
         logger.info("Order queue processor stopped")
     
+    def _schedule_retry(self, order_id: str, attempt: int) -> None:
+        """
+        Schedule a failed order for re-execution with exponential backoff.
+        
+        Args:
+            order_id: Internal order ID to retry
+            attempt: Number of failed attempts so far (1 for the first failure)
+        """
+        delay = self.retry_delay * (2 ** (attempt - 1))
+        # Equal jitter keeps at least half the backoff while spreading retries
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        with self._retry_lock:
+            heapq.heappush(self._retry_heap, (time.monotonic() + delay, order_id))
+    
+    def _release_due_retries(self, now: float) -> Optional[float]:
+        """
+        Move retries whose deadline has passed onto the order queue.
+        
+        Args:
+            now: Current time.monotonic() value
+            
+        Returns:
+            Seconds until the next pending retry, or None if none are waiting
+        """
+        with self._retry_lock:
+            heap = self._retry_heap
+            while heap and heap[0][0] <= now:
+                self._order_queue.put(heapq.heappop(heap)[1])
+            return heap[0][0] - now if heap else None
+    
     def _execute_order(self, order_id: str) -> None:
         """
         Execute an order through the executor.
@@ -351,7 +515,7 @@ class OrderManager:
             with self._lock:
                 record.order.order_id = exchange_order_id
                 self._pending_orders.discard(order_id)
-                self._stats['total_submitted'] += 1
+            self._stats['total_submitted'].add()
             
             # Create update with exchange order ID
             update = OrderUpdate(
@@ -380,8 +544,7 @@ class OrderManager:
                     f"Retrying order {order_id} "
                     f"(attempt {record.retry_count + 1}/{self.max_retries})"
                 )
-                time.sleep(self.retry_delay)
-                self._order_queue.put(order_id)
+                self._schedule_retry(order_id, record.retry_count)
             else:
                 # Max retries exceeded, mark as rejected
                 self._update_order_status(
@@ -392,7 +555,7 @@ class OrderManager:
                 
                 with self._lock:
                     self._pending_orders.discard(order_id)
-                    self._stats['total_rejected'] += 1
+                self._stats['total_rejected'].add()
     
     def modify_order(
         self,
@@ -424,7 +587,7 @@ class OrderManager:
             order = record.order
             
             # Check if order can be modified
-            if order.status in [OrderStatus.COMPLETE, OrderStatus.CANCELLED, OrderStatus.REJECTED]:
+            if order.status in TERMINAL_ORDER_STATUSES:
                 logger.warning(f"Cannot modify order in {order.status.value} status")
                 return False
             
@@ -505,7 +668,7 @@ class OrderManager:
             order = record.order
             
             # Check if order can be cancelled
-            if order.status in [OrderStatus.COMPLETE, OrderStatus.CANCELLED, OrderStatus.REJECTED]:
+            if order.status in TERMINAL_ORDER_STATUSES:
                 logger.warning(f"Cannot cancel order in {order.status.value} status")
                 return False
         
@@ -528,7 +691,7 @@ class OrderManager:
                 
                 with self._lock:
                     self._pending_orders.discard(order_id)
-                    self._stats['total_cancelled'] += 1
+                self._stats['total_cancelled'].add()
                 
                 logger.info(f"Order cancelled successfully: {order_id}")
             else:
@@ -540,6 +703,34 @@ class OrderManager:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
     
+    def cancel_orders(self, order_ids: List[str], max_workers: int = 16) -> Dict[str, bool]:
+        """
+        Cancel several orders concurrently.
+        
+        The exchange has no bulk-cancel endpoint, so the cancellations are
+        issued in parallel and the total time is about one round trip
+        rather than one per order.
+        
+        Args:
+            order_ids: Order IDs to cancel
+            max_workers: Maximum number of concurrent cancellations
+            
+        Returns:
+            Dictionary mapping each order ID to whether it was cancelled
+        """
+        if not order_ids:
+            return {}
+        
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(order_ids)),
+            thread_name_prefix="OrderCancel"
+        ) as pool:
+            results = dict(zip(order_ids, pool.map(self.cancel_order, order_ids)))
+        
+        cancelled = sum(results.values())
+        logger.info(f"Cancelled {cancelled}/{len(order_ids)} orders")
+        return results
+    
     def get_order_status(self, order_id: str) -> Optional[OrderStatus]:
         """
         Get current status of an order.
@@ -550,10 +741,8 @@ class OrderManager:
         Returns:
             OrderStatus if order exists, None otherwise
         """
-        with self._lock:
-            if order_id not in self._orders:
-                return None
-            return self._orders[order_id].order.status
+        record = self._orders.get(order_id)
+        return record.order.status if record is not None else None
     
     def get_order(self, order_id: str) -> Optional[Order]:
         """
@@ -565,10 +754,8 @@ class OrderManager:
         Returns:
             Order object if exists, None otherwise
         """
-        with self._lock:
-            if order_id not in self._orders:
-                return None
-            return self._orders[order_id].order
+        record = self._orders.get(order_id)
+        return record.order if record is not None else None
     
     def get_order_record(self, order_id: str) -> Optional[OrderRecord]:
         """
@@ -580,27 +767,25 @@ class OrderManager:
         Returns:
             OrderRecord if exists, None otherwise
         """
-        with self._lock:
-            if order_id not in self._orders:
-                return None
-            return self._orders[order_id]
+        return self._orders.get(order_id)
     
     def get_all_orders(self, status_filter: Optional[OrderStatus] = None) -> List[Order]:
         """
         Get all orders, optionally filtered by status.
         
+        Reads a snapshot of the order table without taking the lock, so
+        the result is eventually consistent with concurrent submissions.
+        
         Args:
             status_filter: Optional status to filter by
             
         Returns:
             List of Order objects
         """
-        with self._lock:
-            orders = []
-            for record in self._orders.values():
-                if status_filter is None or record.order.status == status_filter:
-                    orders.append(record.order)
-            return orders
+        if status_filter is None:
+            return [record.order for record in tuple(self._orders.values())]
+        orders = self._orders
+        return [orders[order_id].order for order_id in tuple(self._by_status[status_filter])]
     
     def get_pending_orders(self) -> List[Order]:
         """
@@ -620,6 +805,24 @@ class OrderManager:
         """
         return self.get_all_orders(OrderStatus.OPEN)
     
+    def pending_count(self) -> int:
+        """
+        Get the number of pending orders without building a list.
+        
+        Returns:
+            Number of orders in PENDING status
+        """
+        return len(self._by_status[OrderStatus.PENDING])
+    
+    def open_count(self) -> int:
+        """
+        Get the number of open orders without building a list.
+        
+        Returns:
+            Number of orders in OPEN status
+        """
+        return len(self._by_status[OrderStatus.OPEN])
+    
     def update_order_from_exchange(self, update: OrderUpdate) -> None:
         """
         Update order status from exchange updates.
@@ -635,7 +838,7 @@ class OrderManager:
             record = self._orders[update.order_id]
             
             # Update order status
-            record.order.status = update.status
+            self._set_order_status(update.order_id, record, update.status)
             record.filled_quantity = update.filled_quantity
             record.average_price = update.average_price
             record.updated_at = update.timestamp
@@ -645,22 +848,23 @@ class OrderManager:
             
             # Update statistics
             if update.status == OrderStatus.COMPLETE:
-                self._stats['total_completed'] += 1
+                self._stats['total_completed'].add()
                 self._pending_orders.discard(update.order_id)
             elif update.status == OrderStatus.CANCELLED:
-                self._stats['total_cancelled'] += 1
+                self._stats['total_cancelled'].add()
                 self._pending_orders.discard(update.order_id)
             elif update.status == OrderStatus.REJECTED:
-                self._stats['total_rejected'] += 1
+                self._stats['total_rejected'].add()
                 self._pending_orders.discard(update.order_id)
             
             # Notify callbacks
             self._notify_callbacks(update)
             
-            logger.debug(
-                f"Order updated: {update.order_id} -> {update.status.value} "
-                f"(filled: {update.filled_quantity}/{record.order.quantity})"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Order updated: {update.order_id} -> {update.status.value} "
+                    f"(filled: {update.filled_quantity}/{record.order.quantity})"
+                )
     
     def register_callback(self, callback: Callable[[OrderUpdate], None]) -> None:
         """
@@ -670,7 +874,7 @@ class OrderManager:
             callback: Function to call on order updates
         """
         with self._lock:
-            self._order_callbacks.append(callback)
+            self._order_callbacks = self._order_callbacks + (callback,)
         logger.info(f"Registered order callback: {callback.__name__}")
     
     def register_fill_callback(self, callback: Callable[[Fill], None]) -> None:
@@ -681,7 +885,7 @@ class OrderManager:
             callback: Function to call on fill updates
         """
         with self._lock:
-            self._fill_callbacks.append(callback)
+            self._fill_callbacks = self._fill_callbacks + (callback,)
         logger.info(f"Registered fill callback: {callback.__name__}")
     
     def register_execution_callback(self, callback: Callable[[ExecutionReport], None]) -> None:
@@ -692,7 +896,7 @@ class OrderManager:
             callback: Function to call on execution reports
         """
         with self._lock:
-            self._execution_callbacks.append(callback)
+            self._execution_callbacks = self._execution_callbacks + (callback,)
         logger.info(f"Registered execution callback: {callback.__name__}")
     
     def register_position_callback(self, callback: Callable[[PositionUpdate], None]) -> None:
@@ -703,7 +907,7 @@ class OrderManager:
             callback: Function to call on position updates
         """
         with self._lock:
-            self._position_callbacks.append(callback)
+            self._position_callbacks = self._position_callbacks + (callback,)
         logger.info(f"Registered position callback: {callback.__name__}")
     
     def start_execution_monitoring(self) -> None:
@@ -713,6 +917,7 @@ class OrderManager:
             return
         
         self._monitoring_enabled = True
+        self._monitoring_wakeup.clear()
         self._monitoring_thread = threading.Thread(
             target=self._monitor_executions,
             daemon=True,
@@ -728,6 +933,7 @@ class OrderManager:
             return
         
         self._monitoring_enabled = False
+        self._monitoring_wakeup.set()
         self._monitoring_thread.join(timeout=5.0)
         logger.info("Execution monitoring stopped")
     
@@ -737,20 +943,24 @@ class OrderManager:
         
         while self._monitoring_enabled:
             try:
+                # One clock read per poll, shared by every order checked below
+                now = datetime.now()
+                
                 # Get all orders that need monitoring (OPEN and PENDING)
-                monitored_orders = []
-                with self._lock:
-                    for order_id, record in self._orders.items():
-                        if record.order.status in [OrderStatus.OPEN, OrderStatus.PENDING]:
-                            exchange_id = record.exchange_order_id or self._get_exchange_order_id(order_id)
-                            if exchange_id:
-                                monitored_orders.append((order_id, exchange_id, record.order.status))
+                monitored_orders = self._collect_monitored_orders()
+                
+                # Fetch every monitored status in one executor call
+                statuses = self._get_statuses_from_executor(
+                    [exchange_id for _, exchange_id, _ in monitored_orders]
+                )
                 
                 # Check status and fills for each monitored order
                 for order_id, exchange_order_id, current_status in monitored_orders:
                     try:
                         # Get latest order details from executor
-                        order_details = self._get_order_details_from_executor(exchange_order_id)
+                        order_details = self._get_order_details_from_executor(
+                            exchange_order_id, now, statuses.get(exchange_order_id)
+                        )
                         
                         if order_details:
                             # Process status updates
@@ -771,17 +981,61 @@ class OrderManager:
                 # Perform position reconciliation
                 self._reconcile_positions()
                 
-                # Sleep before next check
-                time.sleep(self._monitoring_interval)
+                # Wait before next check; stop_execution_monitoring wakes us
+                self._monitoring_wakeup.wait(self._monitoring_interval)
                 
             except Exception as e:
                 logger.error(f"Error in execution monitor: {e}", exc_info=True)
-                time.sleep(self._monitoring_interval)
+                self._monitoring_wakeup.wait(self._monitoring_interval)
         
         logger.info("Execution monitor stopped")
     
-    def _get_order_details_from_executor(self, exchange_order_id: str) -> Optional[Dict[str, Any]]:
-        """Get comprehensive order details from executor."""
+    def _collect_monitored_orders(self) -> List[Tuple[str, str, OrderStatus]]:
+        """
+        List active orders that have reached the exchange.
+        
+        Walks only the PENDING/OPEN entries of the status index, so terminal
+        orders accumulated over a session add nothing to each poll.
+        
+        Returns:
+            (internal order ID, exchange order ID, current status) tuples
+        """
+        monitored_orders = []
+        with self._lock:
+            for status in ACTIVE_ORDER_STATUSES:
+                for order_id in self._by_status[status]:
+                    record = self._orders[order_id]
+                    exchange_id = record.exchange_order_id or self._get_exchange_order_id(order_id)
+                    if exchange_id:
+                        monitored_orders.append((order_id, exchange_id, status))
+        return monitored_orders
+    
+    def _get_statuses_from_executor(self, exchange_order_ids: List[str]) -> Dict[str, OrderStatus]:
+        """
+        Get the status of several exchange orders with one bulk executor call.
+        
+        Args:
+            exchange_order_ids: Exchange order IDs to query
+            
+        Returns:
+            Mapping of exchange order ID to status; empty if the bulk call
+            fails, in which case callers fall back to per-order queries
+        """
+        if not exchange_order_ids:
+            return {}
+        try:
+            return self.executor.get_orders_status(exchange_order_ids)
+        except Exception as e:
+            logger.warning(f"Bulk status query failed, falling back to per-order queries: {e}")
+            return {}
+    
+    def _get_order_details_from_executor(
+        self,
+        exchange_order_id: str,
+        now: Optional[datetime] = None,
+        status: Optional[OrderStatus] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get comprehensive order details from executor, reusing a prefetched status."""
         try:
             # This would typically call executor methods to get:
             # - Current status
@@ -790,7 +1044,8 @@ class OrderManager:
             # - Commission details
             
             # For now, return basic status (this would be enhanced based on actual executor implementation)
-            status = self.executor.get_order_status(exchange_order_id)
+            if status is None:
+                status = self.executor.get_order_status(exchange_order_id)
             
             # Mock additional details that would come from a real executor
             return {
@@ -799,7 +1054,7 @@ class OrderManager:
                 'average_price': 0.0,  # Would be populated by real executor
                 'fills': [],  # Would be populated by real executor
                 'commission': 0.0,  # Would be populated by real executor
-                'last_update_time': datetime.now()
+                'last_update_time': now or datetime.now()
             }
         except Exception as e:
             logger.error(f"Failed to get order details for {exchange_order_id}: {e}")
@@ -814,14 +1069,14 @@ class OrderManager:
             status=new_status,
             filled_quantity=order_details.get('filled_quantity', 0),
             average_price=order_details.get('average_price', 0.0),
-            timestamp=order_details.get('last_update_time', datetime.now()),
-            message=f"Status changed to {new_status.value} via monitoring"
+            timestamp=order_details.get('last_update_time') or datetime.now(),
+            message=_MONITOR_STATUS_MESSAGES[new_status]
         )
         
         self._process_status_update(update)
         
         # Log significant status changes
-        if new_status in [OrderStatus.COMPLETE, OrderStatus.CANCELLED, OrderStatus.REJECTED]:
+        if new_status in TERMINAL_ORDER_STATUSES:
             logger.info(f"Order {order_id} reached terminal status: {new_status.value}")
     
     def _check_and_process_fills(self, order_id: str, order_details: Dict[str, Any]) -> None:
@@ -847,7 +1102,7 @@ class OrderManager:
                     fill_id=f"FILL_{order_id}_{len(record.fills) + 1}",
                     quantity=fill_quantity,
                     price=fill_price,
-                    timestamp=order_details.get('last_update_time', datetime.now()),
+                    timestamp=order_details.get('last_update_time') or datetime.now(),
                     exchange_timestamp=order_details.get('last_update_time'),
                     trade_id=order_details.get('trade_id')
                 )
@@ -870,7 +1125,7 @@ class OrderManager:
             if commission > record.total_commission:
                 additional_commission = commission - record.total_commission
                 record.total_commission = commission
-                self._stats['total_commission'] += additional_commission
+                self._stats['total_commission'].add(additional_commission)
     
     def _mark_for_retry_monitoring(self, order_id: str) -> None:
         """Mark an order for retry monitoring after error."""
@@ -933,17 +1188,17 @@ class OrderManager:
             # Update order status based on fill
             if record.filled_quantity >= record.order.quantity:
                 # Fully filled
-                record.order.status = OrderStatus.COMPLETE
+                self._set_order_status(fill.order_id, record, OrderStatus.COMPLETE)
                 record.completed_at = fill.timestamp
-                self._stats['total_completed'] += 1
+                self._stats['total_completed'].add()
                 self._pending_orders.discard(fill.order_id)
             else:
                 # Partially filled, keep as OPEN
-                record.order.status = OrderStatus.OPEN
+                self._set_order_status(fill.order_id, record, OrderStatus.OPEN)
             
             # Update statistics
-            self._stats['total_fills'] += 1
-            self._stats['total_volume'] += fill.quantity * fill.price
+            self._stats['total_fills'].add()
+            self._stats['total_volume'].add(fill.quantity * fill.price)
             
             record.updated_at = fill.timestamp
         
@@ -1269,9 +1524,10 @@ class OrderManager:
         Returns:
             Dictionary containing statistics
         """
+        stats = {name: counter.value for name, counter in self._stats.items()}
         with self._lock:
             return {
-                **self._stats,
+                **stats,
                 'pending_count': len(self._pending_orders),
                 'total_orders': len(self._orders),
                 'queue_size': self._order_queue.qsize(),
@@ -1510,12 +1766,25 @@ class OrderManager:
         
         with self._lock:
             if order_id in self._orders:
-                self._orders[order_id].order.status = status
+                self._set_order_status(order_id, self._orders[order_id], status)
                 self._orders[order_id].updated_at = update.timestamp
                 self._add_status_update(order_id, update)
         
         self._notify_callbacks(update)
     
+    def _set_order_status(self, order_id: str, record: OrderRecord, status: OrderStatus) -> None:
+        """
+        Set an order's status and keep the per-status index in sync (lock held).
+        
+        ``order_id`` is the internal key in ``self._orders``; ``record.order.order_id``
+        is replaced by the exchange ID once the order is placed.
+        """
+        old_status = record.order.status
+        if old_status != status:
+            self._by_status[old_status].discard(order_id)
+            self._by_status[status].add(order_id)
+            record.order.status = status
+    
     def _add_status_update(self, order_id: str, update: OrderUpdate) -> None:
         """Add status update to order history."""
         with self._lock:
@@ -1532,19 +1801,19 @@ class OrderManager:
             old_status = record.order.status
             
             # Update order status
-            record.order.status = update.status
+            self._set_order_status(update.order_id, record, update.status)
             record.updated_at = update.timestamp
             
             # Update statistics based on status change
             if old_status != update.status:
                 if update.status == OrderStatus.COMPLETE:
-                    self._stats['total_completed'] += 1
+                    self._stats['total_completed'].add()
                     self._pending_orders.discard(update.order_id)
                 elif update.status == OrderStatus.CANCELLED:
-                    self._stats['total_cancelled'] += 1
+                    self._stats['total_cancelled'].add()
                     self._pending_orders.discard(update.order_id)
                 elif update.status == OrderStatus.REJECTED:
-                    self._stats['total_rejected'] += 1
+                    self._stats['total_rejected'].add()
                     self._pending_orders.discard(update.order_id)
             
             # Add to history
@@ -1600,10 +1869,10 @@ class OrderManager:
             # Fallback to order's order_id if it was updated
             return record.order.order_id if record.order.order_id != order_id else None
     
-    def _generate_order_id(self) -> str:
-        """Generate unique internal order ID."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        return f"ORD_{timestamp}"
+    def _generate_order_id(self, now: Optional[datetime] = None) -> str:
+        """Generate unique internal order ID, stamped with ``now`` when given."""
+        timestamp = (now or datetime.now()).strftime("%Y%m%d%H%M%S%f")
+        return f"ORD_{timestamp}_{next(self._order_sequence)}"
     
     def shutdown(self) -> None:
         """Shutdown the order manager gracefully."""
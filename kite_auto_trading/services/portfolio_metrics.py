@@ -596,12 +596,77 @@ class PortfolioMetricsCalculator:
         Returns:
             List of alert dictionaries
         """
-        alerts = []
-        
-        # Check drawdown
         snapshots = self.portfolio.get_snapshots()
+        current_dd_pct = None
         if snapshots:
             _, _, _, current_dd_pct = self._calculate_drawdown_metrics(snapshots)
+        
+        return self._build_risk_alerts(
+            current_dd_pct,
+            max_drawdown_pct,
+            max_leverage,
+            max_concentration_pct,
+            max_daily_loss_pct
+        )
+    
+    def evaluate_and_alert(
+        self,
+        max_drawdown_pct: float = 10.0,
+        max_leverage: float = 2.0,
+        max_concentration_pct: float = 20.0,
+        max_daily_loss_pct: float = 5.0
+    ) -> Tuple[PerformanceMetrics, List[Dict[str, Any]]]:
+        """
+        Calculate performance metrics and check risk alerts in one pass.
+        
+        Equivalent to calling calculate_performance_metrics() and then
+        check_risk_alerts(), but the drawdown computed for the metrics is
+        reused for the drawdown check instead of walking the snapshots again.
+        
+        Args:
+            max_drawdown_pct: Maximum allowed drawdown percentage
+            max_leverage: Maximum allowed leverage
+            max_concentration_pct: Maximum concentration in single instrument
+            max_daily_loss_pct: Maximum daily loss percentage
+            
+        Returns:
+            Tuple of (PerformanceMetrics, list of alert dictionaries)
+        """
+        metrics = self.calculate_performance_metrics()
+        alerts = self._build_risk_alerts(
+            metrics.current_drawdown_pct,
+            max_drawdown_pct,
+            max_leverage,
+            max_concentration_pct,
+            max_daily_loss_pct
+        )
+        return metrics, alerts
+    
+    def _build_risk_alerts(
+        self,
+        current_dd_pct: Optional[float],
+        max_drawdown_pct: float,
+        max_leverage: float,
+        max_concentration_pct: float,
+        max_daily_loss_pct: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate risk alerts given the current drawdown.
+        
+        Args:
+            current_dd_pct: Current drawdown percentage, or None without snapshots
+            max_drawdown_pct: Maximum allowed drawdown percentage
+            max_leverage: Maximum allowed leverage
+            max_concentration_pct: Maximum concentration in single instrument
+            max_daily_loss_pct: Maximum daily loss percentage
+            
+        Returns:
+            List of alert dictionaries
+        """
+        alerts = []
+        
+        # Check drawdown
+        if current_dd_pct is not None:
             if current_dd_pct > max_drawdown_pct:
                 alerts.append({
                     'type': 'DRAWDOWN_BREACH',
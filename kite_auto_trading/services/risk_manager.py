@@ -11,7 +11,7 @@ from typing import Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
 
-from ..models.base import Order, Position, RiskParameters, OrderType, TransactionType
+from ..models.base import Order, Position, RiskParameters, TransactionType, TRIGGER_ORDER_TYPES
 from ..config.models import RiskManagementConfig, PortfolioConfig
 
 
@@ -373,7 +373,7 @@ class RiskManagerService:
         
         position_value = order.quantity * current_price
         
-        if order.order_type in [OrderType.MARKET, OrderType.LIMIT]:
+        if order.order_type not in TRIGGER_ORDER_TYPES:
             # Full margin for market and limit orders
             return position_value
         else:
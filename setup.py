@@ -30,13 +30,11 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Office/Business :: Financial :: Investment",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
         "dev": [
@@ -56,6 +54,13 @@ setup(
         "cache": [
             "redis>=4.3.0",
         ],
+        "fast": [
+            "msgspec>=0.18.0",
+            "orjson>=3.9.0",
+        ],
+        "monitoring": [
+            "psutil>=5.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -3,6 +3,8 @@ Unit tests for configuration management system.
 """
 
 import json
+import logging
+import logging.handlers
 import os
 import tempfile
 import unittest
@@ -15,6 +17,7 @@ from kite_auto_trading.config import (
     TradingConfig, AppConfig, APIConfig, ConfigLoader, ConfigManager,
     ConfigurationError, Environment, LogLevel, load_config
 )
+from kite_auto_trading.config import logging_config
 
 
 class TestConfigModels(unittest.TestCase):
@@ -393,5 +396,54 @@ class TestConfigIntegration(unittest.TestCase):
             os.unlink(config_path)
 
 
+
+class TestLoggingSetup(unittest.TestCase):
+    """Test root logging setup."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root_logger = logging.getLogger()
+        self.saved_handlers = self.root_logger.handlers[:]
+        self.saved_level = self.root_logger.level
+        self.config = {
+            'level': 'INFO',
+            'format': '%(levelname)s %(message)s',
+            'file_path': os.path.join(self.temp_dir, 'app.log'),
+            'console_output': False
+        }
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        logging_config._stop_queue_listener()
+        self.root_logger.handlers[:] = self.saved_handlers
+        self.root_logger.setLevel(self.saved_level)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_background_logging_writes_through_queue(self):
+        """Test that root records are handed to a listener thread."""
+        logging_config.setup_logging(self.config)
+        
+        self.assertEqual(len(self.root_logger.handlers), 1)
+        self.assertIsInstance(self.root_logger.handlers[0], logging.handlers.QueueHandler)
+        
+        logging.getLogger("kite_auto_trading.test").warning("queued %s", "record")
+        logging_config._stop_queue_listener()
+        
+        with open(self.config['file_path'], encoding='utf-8') as f:
+            self.assertIn("WARNING queued record", f.read())
+    
+    def test_foreground_logging_attaches_handlers(self):
+        """Test that background logging can be disabled."""
+        logging_config.setup_logging(dict(self.config, background=False))
+        
+        self.assertEqual(len(self.root_logger.handlers), 1)
+        self.assertIsInstance(
+            self.root_logger.handlers[0], logging.handlers.RotatingFileHandler
+        )
+        self.assertIsNone(logging_config._queue_listener)
+        self.root_logger.handlers[0].close()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -95,6 +95,135 @@ class TestStructuredLogger(unittest.TestCase):
             
             levels = [json.loads(line)["level"] for line in lines]
             self.assertEqual(levels, ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    
+    def test_log_serializes_datetimes(self):
+        """Test that datetime values are written as ISO strings."""
+        event_time = datetime(2024, 1, 1, 9, 15, 30)
+        self.logger.info("Test message", event_time=event_time)
+        
+        log_file = Path(self.test_dir) / "general.log"
+        with open(log_file, 'r') as f:
+            log_data = json.loads(f.readline())
+        
+        self.assertEqual(log_data["event_time"], event_time.isoformat())
+        datetime.fromisoformat(log_data["timestamp"])
+    
+    def test_log_skips_disabled_levels(self):
+        """Test that messages below the logger level are not written."""
+        import logging
+        self.logger.general_logger.setLevel(logging.WARNING)
+        
+        self.logger.info("Info message")
+        self.logger.warning("Warning message")
+        
+        log_file = Path(self.test_dir) / "general.log"
+        with open(log_file, 'r') as f:
+            lines = f.readlines()
+        
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["level"], "WARNING")
+
+
+class TestBackgroundStructuredLogger(unittest.TestCase):
+    """Test structured logger writing through a background listener."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.logger = StructuredLogger("test_background_logger", self.test_dir, background=True)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.logger.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def test_records_written_after_flush(self):
+        """Test that queued records reach the file as JSON."""
+        self.logger.info("Test message", test_key="test_value")
+        self.logger.flush()
+        
+        log_file = Path(self.test_dir) / "general.log"
+        with open(log_file, 'r') as f:
+            log_data = json.loads(f.readline())
+        
+        self.assertEqual(log_data["message"], "Test message")
+        self.assertEqual(log_data["test_key"], "test_value")
+    
+    def test_close_writes_pending_records(self):
+        """Test that closing the logger drains the queue."""
+        for i in range(100):
+            self.logger.info("Message", index=i)
+        self.logger.close()
+        
+        log_file = Path(self.test_dir) / "general.log"
+        with open(log_file, 'r') as f:
+            lines = f.readlines()
+        
+        self.assertEqual(len(lines), 100)
+    
+    def test_record_snapshotted_before_enqueue(self):
+        """Test that changes made after logging don't reach the written record."""
+        performance_logger = PerformanceLogger(self.logger.performance_logger)
+        file_handler = next(
+            handler for handler in self.logger._handlers
+            if handler.baseFilename.endswith("performance.log")
+        )
+        metrics = {"total_pnl": 100.0, "positions": {"SBIN": 10}}
+        
+        # Hold the file handler so the listener cannot write before the mutation
+        file_handler.acquire()
+        try:
+            performance_logger.log_metrics(metrics)
+            metrics["total_pnl"] = -1.0
+            metrics["positions"]["SBIN"] = 0
+        finally:
+            file_handler.release()
+        self.logger.flush()
+        
+        log_file = Path(self.test_dir) / "performance.log"
+        with open(log_file, 'r') as f:
+            log_data = json.loads(f.readline())
+        
+        self.assertEqual(log_data["metrics"], {"total_pnl": 100.0, "positions": {"SBIN": 10}})
+
+
+class TestBufferedStructuredLogger(unittest.TestCase):
+    """Test structured logger with batched file writes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.logger = StructuredLogger(
+            "test_buffered_logger", self.test_dir, buffer_capacity=100, flush_interval=60
+        )
+        self.log_file = Path(self.test_dir) / "general.log"
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.logger.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def _read_lines(self):
+        with open(self.log_file, 'r') as f:
+            return f.readlines()
+    
+    def test_records_buffered_until_flush(self):
+        """Test that records are held back until flushed."""
+        self.logger.info("First")
+        self.logger.info("Second")
+        self.assertEqual(self._read_lines(), [])
+        
+        self.logger.flush()
+        messages = [json.loads(line)["message"] for line in self._read_lines()]
+        self.assertEqual(messages, ["First", "Second"])
+    
+    def test_error_flushes_buffer(self):
+        """Test that an error record writes out the buffer immediately."""
+        self.logger.info("Info message")
+        self.logger.error("Error message")
+        
+        levels = [json.loads(line)["level"] for line in self._read_lines()]
+        self.assertEqual(levels, ["INFO", "ERROR"])
 
 
 class TestJSONFormatter(unittest.TestCase):
@@ -143,6 +272,23 @@ class TestJSONFormatter(unittest.TestCase):
         
         self.assertEqual(log_data["key"], "value")
         self.assertEqual(log_data["number"], 42)
+    
+    def test_format_dict_message(self):
+        """Test that dict messages are serialized without a JSON round-trip."""
+        import logging
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg={"key": "value", "number": 42},
+            args=(),
+            exc_info=None
+        )
+        
+        formatted = self.formatter.format(record)
+        
+        self.assertEqual(json.loads(formatted), {"key": "value", "number": 42})
 
 
 class TestTradeLogger(unittest.TestCase):
@@ -8,7 +8,7 @@ import threading
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
-from kite_auto_trading.main import KiteAutoTradingApp
+from kite_auto_trading.main import KiteAutoTradingApp, _get_parser
 from kite_auto_trading.config.models import (
     TradingConfig, AppConfig, APIConfig, MarketDataConfig,
     RiskManagementConfig, StrategyConfig, PortfolioConfig,
@@ -251,6 +251,30 @@ class TestApplicationLifecycle:
         
         # Verify monitoring and services stopped
         assert app.monitoring_service is not None
+    
+    @patch('kite_auto_trading.main.ConfigLoader')
+    @patch('kite_auto_trading.main.KiteAPIClient')
+    def test_shutdown_cancels_each_pending_order(self, mock_api_client, mock_config_loader, app, mock_config):
+        """Test shutdown cancels every pending order when live."""
+        mock_config_loader.return_value.load_config.return_value = mock_config
+        mock_api_instance = Mock()
+        mock_api_instance.auto_authenticate.return_value = False
+        mock_api_client.return_value = mock_api_instance
+        
+        app.initialize()
+        app.dry_run = False
+        
+        pending = [Mock(order_id=f"order_{i}") for i in range(3)]
+        app.order_manager = Mock()
+        app.order_manager.pending_count.return_value = len(pending)
+        app.order_manager.get_pending_orders.return_value = pending
+        app.order_manager.cancel_orders.return_value = {order.order_id: True for order in pending}
+        
+        app.shutdown()
+        
+        app.order_manager.stop_queue_processing.assert_called_once()
+        app.order_manager.stop_execution_monitoring.assert_called_once()
+        app.order_manager.cancel_orders.assert_called_once_with(["order_0", "order_1", "order_2"])
 
 
 class TestTradingCycle:
@@ -418,5 +442,21 @@ class TestStrategyManagement:
         app.strategy_manager.evaluate_all_strategies.assert_called_once()
 
 
+class TestCommandLine:
+    """Test command line argument parsing."""
+    
+    def test_parser_is_reused(self):
+        """Test the argument parser is built once and shared."""
+        assert _get_parser() is _get_parser()
+    
+    def test_parse_arguments(self):
+        """Test parsing command line arguments."""
+        parsed = _get_parser().parse_args(['--config', 'test.yaml', '--dry-run', '--log-level', 'DEBUG'])
+        
+        assert parsed.config == 'test.yaml'
+        assert parsed.dry_run is True
+        assert parsed.log_level == 'DEBUG'
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
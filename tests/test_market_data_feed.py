@@ -4,8 +4,10 @@ Integration tests for market data feed handler.
 
 import pytest
 import time
+import numpy as np
 from datetime import datetime
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
+from kite_auto_trading.models.market_data import Tick
 from kite_auto_trading.services.market_data_feed import (
     MarketDataFeed,
     ConnectionState,
@@ -82,6 +84,17 @@ class TestMarketDataFeed:
         assert len(feed.get_subscribed_instruments()) == 3
         assert 12345 in feed.get_subscribed_instruments()
     
+    def test_subscribe_duplicate_instruments(self):
+        """Test that repeated subscriptions are stored once."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        feed.connect()
+        feed.subscribe_instruments([12345, 67890])
+        feed.subscribe_instruments([12345, 12345])
+        
+        assert sorted(feed.get_subscribed_instruments()) == [12345, 67890]
+    
     def test_subscribe_without_connection(self):
         """Test that subscription fails without connection."""
         api_client = MockAPIClient()
@@ -122,6 +135,88 @@ class TestMarketDataFeed:
         assert latest['last_price'] == 100.50
         assert 'timestamp' in latest
     
+    def test_process_ticks_shares_timestamp(self):
+        """Test that ticks in one batch share a single timestamp."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        feed.process_ticks([
+            {'instrument_token': 12345, 'last_price': 100.0},
+            {'instrument_token': 67890, 'last_price': 200.0},
+        ])
+        
+        first = feed.get_latest_tick(12345)
+        second = feed.get_latest_tick(67890)
+        assert first['timestamp'] is second['timestamp']
+    
+    def test_batched_tick_callbacks(self):
+        """Test that 'ticks' callbacks receive ticks in batches."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client, batch_size=2, batch_ms=1000.0)
+    
+        batches = []
+        feed.register_callback('ticks', lambda ticks: batches.append(ticks))
+    
+        feed.process_ticks([
+            {'instrument_token': token, 'last_price': 100.0}
+            for token in (1, 2, 3)
+        ])
+    
+        # One full batch of two, then the remainder flushed at message end
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert [tick['instrument_token'] for tick in batches[0]] == [1, 2]
+    
+        feed.process_tick({'instrument_token': 4, 'last_price': 100.0})
+        assert len(batches) == 2
+        feed.flush_ticks()
+        assert batches[-1][0]['instrument_token'] == 4
+    
+    def test_partial_tick_batch_flushed_after_window(self):
+        """Test that a partial batch is delivered without waiting for more ticks."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client, batch_size=64, batch_ms=5.0)
+        
+        batches = []
+        feed.register_callback('ticks', lambda ticks: batches.append(ticks))
+        
+        feed.process_tick({'instrument_token': 1, 'last_price': 100.0})
+        
+        deadline = time.monotonic() + 2
+        while not batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert [len(batch) for batch in batches] == [1]
+        feed.disconnect()
+    
+    def test_tick_batches_delivered_serially_and_in_order(self):
+        """Test that producer and timer flushes never run 'ticks' callbacks concurrently."""
+        import threading
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client, batch_size=3, batch_ms=1.0)
+        
+        active = []
+        max_active = []
+        delivered = []
+        guard = threading.Lock()
+        
+        def slow_callback(ticks):
+            with guard:
+                active.append(1)
+                max_active.append(len(active))
+            time.sleep(0.005)
+            delivered.extend(tick['last_price'] for tick in ticks)
+            with guard:
+                active.pop()
+        
+        feed.register_callback('ticks', slow_callback)
+        for i in range(60):
+            feed.process_tick({'instrument_token': 1, 'last_price': float(i)})
+            time.sleep(0.001)
+        feed.disconnect()
+        
+        assert max(max_active) == 1
+        assert delivered == [float(i) for i in range(60)]
+    
     def test_data_buffering(self):
         """Test data buffer management."""
         api_client = MockAPIClient()
@@ -155,6 +250,159 @@ class TestMarketDataFeed:
         
         recent_ticks = feed.get_buffered_ticks(count=3)
         assert len(recent_ticks) == 3
+        assert [tick['last_price'] for tick in recent_ticks] == [107.0, 108.0, 109.0]
+        
+        assert len(feed.get_buffered_ticks(count=50)) == 10
+    
+    def test_get_latest_arrays(self):
+        """Test columnar access to the latest price of every instrument."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        feed.connect()
+        feed.subscribe_instruments([1, 2])
+        feed.process_ticks([
+            {'instrument_token': 1, 'last_price': 100.0, 'volume': 10},
+            {'instrument_token': 2, 'last_price': 200.0},
+            {'instrument_token': 1, 'last_price': 101.0, 'volume': 15},
+        ])
+        
+        arrays = feed.get_latest_arrays()
+        assert arrays['instrument_token'].tolist() == [1, 2]
+        assert arrays['last_price'].tolist() == [101.0, 200.0]
+        assert arrays['volume'].tolist() == [15, 0]
+        assert arrays['received_ns'][0] == arrays['received_ns'][1] > 0
+        assert arrays['received_ns'][0] <= time.monotonic_ns()
+        
+        feed.unsubscribe_instruments([2])
+        assert np.isnan(feed.get_latest_arrays()['last_price'][1])
+    
+    def test_non_numeric_price_still_reaches_callbacks(self):
+        """Test that a malformed price does not drop the tick."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        received = []
+        feed.register_callback('tick', lambda tick: received.append(tick))
+        
+        feed.process_tick({'instrument_token': 1, 'last_price': 100.0, 'volume': 5})
+        feed.process_tick({'instrument_token': 1, 'last_price': 'abc', 'volume': 7})
+        
+        assert [tick['last_price'] for tick in received] == [100.0, 'abc']
+        arrays = feed.get_latest_arrays()
+        assert np.isnan(arrays['last_price'][0])
+        assert arrays['volume'][0] == 0
+    
+    def test_latest_arrays_grow(self):
+        """Test that the latest-tick arrays grow past their initial size."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        for token in range(1, 201):
+            feed.process_tick({'instrument_token': token, 'last_price': float(token)})
+        
+        arrays = feed.get_latest_arrays()
+        assert len(arrays['instrument_token']) == 200
+        assert arrays['last_price'][-1] == 200.0
+    
+    def test_latest_array_growth_waits_for_lock(self):
+        """Test that growing the arrays is serialized with unsubscribe writes."""
+        import threading
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        for token in range(1, 65):
+            feed.process_tick({'instrument_token': token, 'last_price': float(token)})
+        
+        with feed._lock:
+            producer = threading.Thread(
+                target=feed.process_tick,
+                args=({'instrument_token': 65, 'last_price': 65.0},)
+            )
+            producer.start()
+            producer.join(timeout=0.1)
+            assert producer.is_alive()
+            feed._last_prices[feed._token_index[1]] = np.nan
+        producer.join(timeout=2)
+        
+        arrays = feed.get_latest_arrays()
+        assert np.isnan(arrays['last_price'][0])
+        assert arrays['last_price'][-1] == 65.0
+    
+    def test_concurrent_tick_reads(self):
+        """Test reading buffered ticks while another thread produces them."""
+        import threading
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client, buffer_size=100)
+        
+        def produce():
+            for i in range(5000):
+                feed.process_tick({'instrument_token': 12345, 'last_price': 100.0 + i})
+        
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive():
+            assert len(feed.get_packed_ticks(count=10)) <= 10
+            feed.get_latest_tick(12345)
+        producer.join()
+        
+        assert len(feed.get_packed_ticks()) == 100
+        assert feed.get_latest_tick(12345)['last_price'] == 5099.0
+    
+    def test_packed_tail_read_falls_back_to_locked_read(self):
+        """Test that repeated iterator invalidation falls back to a read under the lock."""
+        from itertools import islice
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        for i in range(5):
+            feed.process_tick({'instrument_token': 12345, 'last_price': 100.0 + i})
+        
+        lock_held = []
+        
+        def invalidated_islice(iterable, count):
+            if not feed._lock.locked():
+                raise RuntimeError("deque mutated during iteration")
+            lock_held.append(True)
+            return islice(iterable, count)
+        
+        with patch(
+            'kite_auto_trading.services.market_data_feed.islice',
+            side_effect=invalidated_islice
+        ) as mock_islice:
+            packed = feed.get_packed_ticks(count=2)
+        
+        assert mock_islice.call_count == 4
+        assert lock_held == [True]
+        assert [tick[2] for tick in packed] == [103.0, 104.0]
+    
+    def test_packed_ticks_non_positive_count_slices(self):
+        """Test that count <= 0 keeps list slice semantics."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        for i in range(5):
+            feed.process_tick({'instrument_token': 12345, 'last_price': 100.0 + i})
+        
+        assert [tick[2] for tick in feed.get_packed_ticks(count=0)] == [
+            100.0, 101.0, 102.0, 103.0, 104.0
+        ]
+        assert [tick[2] for tick in feed.get_packed_ticks(count=-3)] == [103.0, 104.0]
+        assert len(feed.get_buffered_ticks(count=0)) == 5
+    
+    def test_get_packed_ticks(self):
+        """Test that buffered ticks are stored as packed tuples."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        now = datetime.now()
+        feed.process_tick({'instrument_token': 12345, 'last_price': 100.0, 'volume': 10, 'timestamp': now})
+        
+        packed = feed.get_packed_ticks()
+        assert packed == [(12345, now, 100.0, 10, None, None, None, None)]
+        
+        tick = Tick(*packed[0])
+        assert tick.last_price == 100.0
+        assert tick.timestamp == now
     
     def test_clear_buffer(self):
         """Test clearing data buffer."""
@@ -188,6 +436,29 @@ class TestMarketDataFeed:
         assert len(callback_data) == 1
         assert callback_data[0]['last_price'] == 100.50
     
+    def test_register_callback_during_dispatch(self):
+        """Test that a callback registered mid-dispatch runs from the next tick."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client)
+        
+        calls = []
+        
+        def late_callback(tick):
+            calls.append('late')
+        
+        def registering_callback(tick):
+            calls.append('first')
+            if len(calls) == 1:
+                feed.register_callback('tick', late_callback)
+        
+        feed.register_callback('tick', registering_callback)
+        
+        feed.process_tick({'instrument_token': 12345, 'last_price': 100.0})
+        assert calls == ['first']
+        
+        feed.process_tick({'instrument_token': 12345, 'last_price': 101.0})
+        assert calls == ['first', 'first', 'late']
+    
     def test_register_connect_callback(self):
         """Test registering and triggering connect callback."""
         api_client = MockAPIClient()
@@ -203,6 +474,22 @@ class TestMarketDataFeed:
         
         assert len(callback_triggered) == 1
     
+    def test_disconnect_interrupts_reconnect_wait(self):
+        """Test that disconnect stops a reconnect loop without waiting out the interval."""
+        api_client = MockAPIClient()
+        feed = MarketDataFeed(api_client, reconnect_interval=30, max_reconnect_attempts=3)
+        feed.connect = Mock(return_value=False)
+        
+        feed.start_reconnect_thread()
+        time.sleep(0.1)
+        
+        start = time.monotonic()
+        feed.disconnect()
+        
+        assert time.monotonic() - start < 5
+        assert not feed._reconnect_thread.is_alive()
+        assert feed.reconnect_count == 1
+    
     def test_get_stats(self):
         """Test getting feed statistics."""
         api_client = MockAPIClient()
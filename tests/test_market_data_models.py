@@ -3,17 +3,24 @@ Unit tests for market data models and validation utilities.
 """
 
 import pytest
+import numpy as np
 from datetime import datetime
 from kite_auto_trading.models.market_data import (
+    DEPTH_DTYPE,
+    DEPTH_LEVELS,
     Tick,
+    TickBatch,
     OHLC,
     Instrument,
     InstrumentType,
     MarketDepth,
     validate_tick_data,
+    validate_tick_batch,
     validate_ohlc_data,
+    validate_ohlc_array,
     clean_tick_data,
     clean_ohlc_data,
+    decode_ticks,
 )
 
 
@@ -57,6 +64,56 @@ class TestTick:
             )
 
 
+class TestTickBatch:
+    """Test cases for TickBatch columnar storage."""
+    
+    def test_append_and_columns(self):
+        """Test appending ticks fills the column arrays."""
+        batch = TickBatch(capacity=4)
+        batch.append({'instrument_token': 1, 'last_price': 100.0, 'volume': 10})
+        batch.append({'instrument_token': 2, 'last_price': 200.0, 'volume': 20,
+                      'bid_price': 199.5, 'ask_price': 200.5})
+        
+        assert len(batch) == 2
+        assert list(batch.instrument_token) == [1, 2]
+        assert list(batch.last_price) == [100.0, 200.0]
+        assert batch.ask_price[1] == 200.5
+    
+    def test_append_beyond_capacity(self):
+        """Test that appending to a full batch raises error."""
+        batch = TickBatch(capacity=1)
+        batch.append({'instrument_token': 1, 'last_price': 100.0})
+        assert batch.is_full()
+        with pytest.raises(IndexError):
+            batch.append({'instrument_token': 2, 'last_price': 100.0})
+    
+    def test_tick_from_batch(self):
+        """Test building a Tick from a batch row."""
+        timestamp = datetime(2024, 1, 1, 9, 15, 0, 250000)
+        batch = TickBatch(capacity=2)
+        batch.append({'instrument_token': 7, 'last_price': 50.0, 'volume': 5,
+                      'timestamp': timestamp, 'bid_price': 49.9, 'bid_quantity': 100})
+        
+        tick = Tick.from_batch(batch, 0)
+        assert tick.instrument_token == 7
+        assert tick.timestamp == timestamp
+        assert tick.last_price == 50.0
+        assert tick.bid_price == 49.9
+        assert tick.bid_quantity == 100
+        assert tick.ask_price is None
+        assert tick.ask_quantity is None
+    
+    def test_validate_tick_batch(self):
+        """Test vectorized validation of a tick batch."""
+        batch = TickBatch(capacity=3)
+        batch.append({'instrument_token': 1, 'last_price': 100.0, 'volume': 10})
+        batch.append({'instrument_token': 2, 'last_price': 101.0, 'volume': 0})
+        assert validate_tick_batch(batch) is True
+        
+        batch.append({'instrument_token': 3, 'last_price': -1.0, 'volume': 10})
+        assert validate_tick_batch(batch) is False
+
+
 class TestOHLC:
     """Test cases for OHLC data model."""
     
@@ -150,6 +207,40 @@ class TestOHLC:
         assert ohlc.range_size() == 6.0
 
 
+    def test_ohlc_from_arrays(self):
+        """Test building candles from parallel arrays."""
+        timestamps = [datetime(2024, 1, 1, 9, 15), datetime(2024, 1, 1, 9, 16)]
+        candles = OHLC.from_arrays(
+            instrument_token=12345,
+            timestamps=timestamps,
+            open=[100.0, 102.0],
+            high=[103.0, 104.0],
+            low=[99.0, 101.0],
+            close=[102.0, 101.5],
+            volume=[1000, 800],
+            timeframe='minute'
+        )
+        assert len(candles) == 2
+        assert candles[0].is_bullish()
+        assert candles[1].is_bearish()
+        assert candles[1].timestamp == timestamps[1]
+        assert candles[1].volume == 800
+    
+    def test_ohlc_from_arrays_invalid_row(self):
+        """Test that an invalid candle is reported by row."""
+        with pytest.raises(ValueError, match="row 1"):
+            OHLC.from_arrays(
+                instrument_token=12345,
+                timestamps=[datetime.now(), datetime.now()],
+                open=[100.0, 100.0],
+                high=[103.0, 98.0],
+                low=[99.0, 99.0],
+                close=[102.0, 98.5],
+                volume=[1000, 800],
+                timeframe='minute'
+            )
+
+
 class TestInstrument:
     """Test cases for Instrument data model."""
     
@@ -206,6 +297,47 @@ class TestInstrument:
             segment='NSE'
         )
         assert equity.is_derivative() is False
+    
+    def test_instrument_is_expired_at(self):
+        """Test expiry checks against a supplied timestamp."""
+        expiry = datetime(2024, 1, 25, 15, 30)
+        future = Instrument(
+            instrument_token=12345,
+            exchange_token=48,
+            tradingsymbol='NIFTY24JANFUT',
+            name='NIFTY',
+            exchange='NFO',
+            instrument_type=InstrumentType.FUTURES,
+            segment='NFO-FUT',
+            expiry=expiry
+        )
+        
+        assert future.expiry_ts == expiry.timestamp()
+        assert future.is_expired_at(expiry.timestamp() - 1) is False
+        assert future.is_expired_at(expiry.timestamp() + 1) is True
+        assert future.is_expired() is True
+    
+    def test_instrument_strings_interned(self):
+        """Test that identifier strings are interned."""
+        first = Instrument(
+            instrument_token=408065,
+            exchange_token=1594,
+            tradingsymbol="".join(["IN", "FY"]),
+            name='Infosys',
+            exchange='NSE',
+            instrument_type=InstrumentType.EQUITY,
+            segment='NSE'
+        )
+        second = Instrument(
+            instrument_token=408065,
+            exchange_token=1594,
+            tradingsymbol="".join(["IN", "FY"]),
+            name='Infosys',
+            exchange='NSE',
+            instrument_type=InstrumentType.EQUITY,
+            segment='NSE'
+        )
+        assert first.tradingsymbol is second.tradingsymbol
 
 
 class TestMarketDepth:
@@ -243,6 +375,62 @@ class TestMarketDepth:
         
         spread = depth.get_spread()
         assert abs(spread - 0.05) < 0.001
+    
+    def test_market_depth_empty(self):
+        """Test that empty depth has no best levels or spread."""
+        depth = MarketDepth(instrument_token=12345, timestamp=datetime.now())
+        
+        assert depth.get_best_bid() is None
+        assert depth.get_best_ask() is None
+        assert depth.get_spread() is None
+    
+    def test_market_depth_from_kite_depth(self):
+        """Test building depth from a Kite depth payload."""
+        depth = MarketDepth.from_kite_depth(
+            instrument_token=12345,
+            timestamp=datetime.now(),
+            depth={
+                'buy': [{'price': 100.25, 'quantity': 500, 'orders': 5}],
+                'sell': [{'price': 100.30, 'quantity': 400, 'orders': 4}],
+            }
+        )
+        
+        assert depth.bids.shape == (5,)
+        assert depth.get_best_bid()['quantity'] == 500
+        assert depth.get_best_ask()['orders'] == 4
+        assert abs(depth.get_spread() - 0.05) < 0.001
+    
+    def test_market_depth_best_levels_are_dicts(self):
+        """Test that best bid and ask are plain level dictionaries."""
+        depth = MarketDepth(
+            instrument_token=12345,
+            timestamp=datetime.now(),
+            bids=[{'price': 100.25, 'quantity': 500, 'orders': 5}],
+        )
+        
+        best_bid = depth.get_best_bid()
+        assert best_bid == {'price': 100.25, 'quantity': 500, 'orders': 5}
+        assert best_bid.get('orders') == 5
+        assert type(best_bid['quantity']) is int
+    
+    def test_market_depth_casts_structured_arrays(self):
+        """Test that ndarray levels are checked and cast to DEPTH_DTYPE."""
+        levels = np.array(
+            [(100.25, 500, 5)],
+            dtype=[('price', np.float32), ('quantity', np.int32), ('orders', np.int32)]
+        )
+        depth = MarketDepth(instrument_token=12345, timestamp=datetime.now(), bids=levels)
+        
+        assert depth.bids.dtype == DEPTH_DTYPE
+        assert depth.bids.shape == (DEPTH_LEVELS,)
+        assert depth.get_best_bid()['quantity'] == 500
+        
+        with pytest.raises(ValueError, match="orders"):
+            MarketDepth(
+                instrument_token=12345,
+                timestamp=datetime.now(),
+                asks=np.zeros(5, dtype=[('price', np.float64), ('quantity', np.int64)])
+            )
 
 
 class TestValidationFunctions:
@@ -293,6 +481,11 @@ class TestValidationFunctions:
             'volume': 1000
         }
         assert validate_ohlc_data(ohlc_data) is False
+    
+    def test_validate_ohlc_array_length_mismatch(self):
+        """Test array validation fails when lengths differ."""
+        with pytest.raises(ValueError):
+            validate_ohlc_array([100.0], [105.0, 106.0], [99.0], [103.0], [10])
 
 
 class TestCleaningFunctions:
@@ -316,6 +509,35 @@ class TestCleaningFunctions:
         assert cleaned['bid_price'] == 100.25
         assert cleaned['ask_price'] == 100.75
     
+    def test_clean_tick_data_uses_given_now(self):
+        """Test that a missing timestamp is filled from the given now."""
+        now = datetime(2024, 1, 1, 9, 15)
+        
+        cleaned = clean_tick_data({'instrument_token': 12345, 'last_price': 100.0}, now=now)
+        assert cleaned['timestamp'] == now
+        
+        stamped = datetime(2024, 1, 1, 9, 14)
+        cleaned = clean_tick_data(
+            {'instrument_token': 12345, 'last_price': 100.0, 'timestamp': stamped}, now=now
+        )
+        assert cleaned['timestamp'] == stamped
+    
+    def test_decode_ticks(self):
+        """Test decoding a JSON tick payload into Tick objects."""
+        now = datetime(2024, 1, 1, 9, 15)
+        payload = b'[{"instrument_token": 12345, "last_price": 100.5, "volume": 10, "bid_price": 100.0}]'
+        
+        ticks = decode_ticks(payload, now=now)
+        
+        assert ticks == [
+            Tick(instrument_token=12345, timestamp=now, last_price=100.5, volume=10, bid_price=100.0)
+        ]
+    
+    def test_decode_ticks_rejects_invalid_payload(self):
+        """Test that invalid ticks in a payload raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_ticks('[{"last_price": 100.0}]')
+    
     def test_clean_ohlc_data(self):
         """Test cleaning of OHLC data."""
         raw_data = {
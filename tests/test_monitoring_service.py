@@ -2,8 +2,12 @@
 Tests for the monitoring service.
 """
 
+import copy
+import logging
 import pytest
+import threading
 import time
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock, patch
 
@@ -15,6 +19,7 @@ from kite_auto_trading.services.monitoring_service import (
     NotificationChannel,
     SystemHealthMetrics,
     PerformanceSnapshot,
+    RunningMean,
 )
 from kite_auto_trading.services.portfolio_metrics import (
     PortfolioMetricsCalculator,
@@ -67,6 +72,10 @@ def mock_metrics_calculator():
     
     # Mock risk alerts
     calculator.check_risk_alerts.return_value = []
+    calculator.evaluate_and_alert.return_value = (
+        calculator.calculate_performance_metrics.return_value,
+        []
+    )
     
     return calculator
 
@@ -201,6 +210,36 @@ class TestMonitoringService:
         score = monitoring_service._calculate_health_score(100, 100, 100)
         assert score < 100.0
     
+    def test_resource_usage_sampled_with_ttl(self, monitoring_service):
+        """Test that CPU and memory usage are re-read at most once per TTL."""
+        fake_psutil = Mock()
+        process = fake_psutil.Process.return_value
+        process.cpu_percent.return_value = 12.5
+        process.memory_percent.return_value = 3.0
+        
+        with patch('kite_auto_trading.services.monitoring_service.psutil', fake_psutil):
+            monitoring_service._update_system_health()
+            monitoring_service._update_system_health()
+        
+        health = monitoring_service.get_system_health()
+        assert health.cpu_usage == 12.5
+        assert health.memory_usage == 3.0
+        assert process.cpu_percent.call_count == 1
+        assert process.memory_percent.call_count == 1
+    
+    def test_health_score_uses_tail_latency(self, monitoring_service):
+        """Test that a minority of slow API calls lowers the health score."""
+        for _ in range(90):
+            monitoring_service._api_latencies.append(100.0)
+        for _ in range(10):
+            monitoring_service._api_latencies.append(3000.0)
+        
+        monitoring_service._update_system_health()
+        
+        health = monitoring_service.get_system_health()
+        assert health.api_latency_ms == pytest.approx(390.0)
+        assert health.health_score < 100.0
+    
     def test_record_api_latency(self, monitoring_service):
         """Test recording API latency."""
         monitoring_service.record_api_latency(500.0)
@@ -219,6 +258,19 @@ class TestMonitoringService:
         assert alert.alert_type == AlertType.PERFORMANCE_DEGRADATION
         assert alert.severity == AlertSeverity.MEDIUM
     
+    def test_high_api_latency_alerts_rate_limited(self, monitoring_service):
+        """Test that a burst of slow API calls raises a single alert."""
+        for _ in range(50):
+            monitoring_service.record_api_latency(2000.0)
+        
+        assert len(monitoring_service._alerts) == 1
+        assert monitoring_service._suppressed_alert_count == 49
+        assert len(monitoring_service._api_latencies) == 50
+        
+        monitoring_service.alert_min_interval = 0.0
+        monitoring_service.record_api_latency(2000.0)
+        assert len(monitoring_service._alerts) == 2
+    
     def test_record_data_feed_latency(self, monitoring_service):
         """Test recording data feed latency."""
         monitoring_service.record_data_feed_latency(300.0)
@@ -251,6 +303,19 @@ class TestMonitoringService:
         assert alert.details['value'] == 15.0
         assert not alert.acknowledged
     
+    def test_alert_snapshot_unaffected_by_new_alerts(self, monitoring_service):
+        """Test that readers holding the active alert tuple see a stable snapshot."""
+        snapshot = monitoring_service._alerts
+        
+        monitoring_service._create_alert(
+            AlertType.DRAWDOWN_BREACH,
+            AlertSeverity.HIGH,
+            "Test alert"
+        )
+        
+        assert snapshot == ()
+        assert len(monitoring_service._alerts) == 1
+    
     def test_get_active_alerts(self, monitoring_service):
         """Test getting active alerts."""
         # Create multiple alerts
@@ -386,6 +451,26 @@ class TestMonitoringService:
         assert len(drawdown_alerts) == 1
         assert drawdown_alerts[0].alert_type == AlertType.DRAWDOWN_BREACH
     
+    def test_get_alert_history_with_time_window(self, monitoring_service):
+        """Test that start and end bounds select the alerts between them."""
+        for i in range(3):
+            monitoring_service._create_alert(
+                AlertType.DRAWDOWN_BREACH,
+                AlertSeverity.HIGH,
+                f"Alert {i}"
+            )
+            time.sleep(0.01)
+        
+        alerts = monitoring_service.get_alert_history()
+        window = monitoring_service.get_alert_history(
+            start_time=alerts[1].timestamp,
+            end_time=alerts[1].timestamp
+        )
+        assert [a.message for a in window] == ["Alert 1"]
+        
+        later = monitoring_service.get_alert_history(start_time=alerts[1].timestamp)
+        assert [a.message for a in later] == ["Alert 1", "Alert 2"]
+    
     def test_check_alerts_with_risk_breaches(self, monitoring_service, mock_metrics_calculator):
         """Test alert checking with risk breaches."""
         # Mock risk alerts
@@ -407,6 +492,74 @@ class TestMonitoringService:
         assert alert.alert_type == AlertType.DRAWDOWN_BREACH
         assert alert.severity == AlertSeverity.HIGH
     
+    def test_check_alerts_with_unknown_names(self, monitoring_service, mock_metrics_calculator):
+        """Test that unrecognised risk alert names still produce alerts."""
+        mock_metrics_calculator.check_risk_alerts.return_value = [
+            {
+                'type': 'NEW_BREACH',
+                'severity': 'SEVERE',
+                'message': 'Unknown breach',
+                'value': 1.0,
+                'threshold': 0.5
+            }
+        ]
+        
+        monitoring_service._check_alerts()
+        
+        alert = monitoring_service._alerts[0]
+        assert alert.alert_type == AlertType.SYSTEM_ERROR
+        assert alert.severity == AlertSeverity.MEDIUM
+        assert monitoring_service._error_count == 0
+    
+    def test_active_alerts_bounded(self, monitoring_service):
+        """Test that the oldest active alerts are dropped beyond the limit."""
+        with patch('kite_auto_trading.services.monitoring_service._MAX_ACTIVE_ALERTS', 3):
+            for i in range(5):
+                monitoring_service._create_alert(
+                    AlertType.SYSTEM_ERROR,
+                    AlertSeverity.LOW,
+                    f"Alert {i}"
+                )
+        
+        assert [a.message for a in monitoring_service._alerts] == ["Alert 2", "Alert 3", "Alert 4"]
+        assert len(monitoring_service._alert_history) == 5
+    
+    def test_repeated_alert_notified_once(self, monitoring_service):
+        """Test that repeats of an alert within the window are not re-notified."""
+        delivered = []
+        monitoring_service.register_notification_callback(
+            NotificationChannel.EMAIL,
+            delivered.append
+        )
+        monitoring_service.notification_channels.append(NotificationChannel.EMAIL)
+        
+        for _ in range(3):
+            monitoring_service._create_alert(
+                AlertType.DRAWDOWN_BREACH,
+                AlertSeverity.HIGH,
+                "Drawdown breach",
+                {'value': 12.001, 'threshold': 10.0}
+            )
+        monitoring_service._create_alert(
+            AlertType.DRAWDOWN_BREACH,
+            AlertSeverity.HIGH,
+            "Drawdown breach",
+            {'value': 14.0, 'threshold': 10.0}
+        )
+        
+        assert len(monitoring_service._alerts) == 4
+        assert [alert.details['value'] for alert in delivered] == [12.001, 14.0]
+    
+    def test_tick_timestamps_share_now(self, monitoring_service):
+        """Test that one health tick stamps metrics and alerts alike."""
+        monitoring_service.alert_thresholds['min_health_score'] = 101.0
+        now = datetime(2024, 1, 2, 9, 15, 0)
+        
+        monitoring_service._update_system_health(now)
+        
+        assert monitoring_service.get_system_health().timestamp == now
+        assert monitoring_service._alerts[-1].timestamp == now
+    
     def test_notification_channels(self, monitoring_service):
         """Test notification channels."""
         assert NotificationChannel.LOG in monitoring_service.notification_channels
@@ -464,6 +617,71 @@ class TestMonitoringService:
         assert report['system_health']['is_healthy']
         assert report['alerts']['active_count'] == 1
     
+    def test_report_severity_counts(self, monitoring_service):
+        """Test that the report counts active alerts by severity."""
+        for severity in (AlertSeverity.HIGH, AlertSeverity.HIGH, AlertSeverity.LOW):
+            monitoring_service._create_alert(AlertType.SYSTEM_ERROR, severity, "Test alert")
+        
+        alerts = monitoring_service.generate_monitoring_report()['alerts']
+        
+        assert alerts['critical_count'] == 0
+        assert alerts['high_count'] == 2
+        assert alerts['medium_count'] == 0
+        assert alerts['low_count'] == 1
+    
+    def test_report_uses_enum_names(self, monitoring_service):
+        """Test that the report shows alert types and severities by name."""
+        monitoring_service._create_alert(AlertType.API_ERROR, AlertSeverity.CRITICAL, "Test alert")
+        
+        recent = monitoring_service.generate_monitoring_report()['alerts']['recent_alerts'][0]
+        
+        assert recent['type'] == 'API_ERROR'
+        assert recent['severity'] == 'CRITICAL'
+        assert AlertSeverity.CRITICAL > AlertSeverity.LOW
+    
+    def test_report_reused_until_inputs_change(self, monitoring_service):
+        """Test that repeated reports are cached until state changes."""
+        monitoring_service._update_performance_metrics()
+        
+        first = monitoring_service.generate_monitoring_report()
+        second = monitoring_service.generate_monitoring_report()
+        assert second['timestamp'] == first['timestamp']
+        assert second is not first
+        assert second['alerts'] is first['alerts']
+        
+        monitoring_service._create_alert(AlertType.SYSTEM_ERROR, AlertSeverity.LOW, "Test alert")
+        third = monitoring_service.generate_monitoring_report()
+        assert third['alerts']['active_count'] == 1
+        
+        monitoring_service.acknowledge_all_alerts()
+        assert monitoring_service.generate_monitoring_report()['alerts']['active_count'] == 0
+    
+    def test_report_changes_do_not_leak_into_cache(self, monitoring_service):
+        """Test that top-level changes to a returned report leave later reports intact."""
+        monitoring_service._create_alert(AlertType.SYSTEM_ERROR, AlertSeverity.LOW, "Test alert")
+        
+        report = monitoring_service.generate_monitoring_report()
+        report['alerts'] = {}
+        del report['system_health']
+        
+        again = monitoring_service.generate_monitoring_report()
+        assert again is not report
+        assert again['alerts']['active_count'] == 1
+        assert again['system_health']['is_healthy'] is True
+        assert again['thresholds'] is not monitoring_service.alert_thresholds
+    
+    def test_report_cache_keyed_by_snapshot_identity(self, monitoring_service):
+        """Test that a new snapshot object rebuilds the report even if equal."""
+        monitoring_service._update_performance_metrics()
+        first = monitoring_service.generate_monitoring_report()
+        
+        snapshot = monitoring_service.get_current_performance()
+        monitoring_service._performance_snapshots.append(copy.copy(snapshot))
+        
+        second = monitoring_service.generate_monitoring_report()
+        assert second['performance'] is not first['performance']
+        assert second['performance'] == first['performance']
+    
     def test_start_stop_monitoring(self, monitoring_service):
         """Test starting and stopping monitoring."""
         assert not monitoring_service._is_monitoring
@@ -473,6 +691,7 @@ class TestMonitoringService:
         assert monitoring_service._is_monitoring
         assert monitoring_service._monitor_thread is not None
         assert monitoring_service._health_thread is not None
+        assert monitoring_service._health_thread is monitoring_service._monitor_thread
         
         # Give threads time to start
         time.sleep(0.1)
@@ -481,6 +700,91 @@ class TestMonitoringService:
         monitoring_service.stop_monitoring()
         assert not monitoring_service._is_monitoring
     
+    def test_stop_monitoring_interrupts_wait(self, monitoring_service):
+        """Test that stopping does not wait out the update interval."""
+        monitoring_service.metrics_update_interval = 60
+        monitoring_service.health_check_interval = 60
+        monitoring_service.start_monitoring()
+        time.sleep(0.1)
+        
+        started = time.monotonic()
+        monitoring_service.stop_monitoring()
+        
+        assert time.monotonic() - started < 1.0
+        assert not monitoring_service._monitor_thread.is_alive()
+        assert not monitoring_service._health_thread.is_alive()
+    
+    def test_alerts_delivered_by_notifier_while_monitoring(self, monitoring_service):
+        """Test that queued alerts reach callbacks and are batched for the console."""
+        delivered = []
+        monitoring_service.register_notification_callback(
+            NotificationChannel.EMAIL,
+            delivered.append
+        )
+        monitoring_service.notification_channels.append(NotificationChannel.EMAIL)
+        
+        monitoring_service.start_monitoring()
+        for i in range(5):
+            monitoring_service._create_alert(
+                AlertType.SYSTEM_ERROR,
+                AlertSeverity.LOW,
+                f"Alert {i}"
+            )
+        monitoring_service.stop_monitoring()
+        
+        assert [alert.message for alert in delivered] == [f"Alert {i}" for i in range(5)]
+        assert monitoring_service._notifier_thread is None
+    
+    def test_console_notification_format(self, monitoring_service, capsys):
+        """Test the console message for a single alert."""
+        alert = Alert(
+            alert_type=AlertType.DRAWDOWN_BREACH,
+            severity=AlertSeverity.CRITICAL,
+            message="Drawdown breach",
+            timestamp=datetime(2024, 1, 2, 9, 15, 0),
+            details={'value': 12.0}
+        )
+        
+        monitoring_service._send_console_notification(alert)
+        
+        assert capsys.readouterr().out == (
+            "\n🚨 ALERT [CRITICAL] DRAWDOWN_BREACH\n"
+            "  Drawdown breach\n"
+            "  Time: 2024-01-02 09:15:00\n"
+            "  Details: {'value': 12.0}\n"
+            "\n"
+        )
+    
+    def test_alert_logged_once(self, monitoring_service, caplog):
+        """Test that an alert produces a single log record."""
+        monitoring_service.notification_channels = [NotificationChannel.LOG]
+        
+        with caplog.at_level(logging.INFO, logger='kite_auto_trading.services.monitoring_service'):
+            monitoring_service._create_alert(AlertType.API_ERROR, AlertSeverity.HIGH, "API down")
+        
+        records = [r for r in caplog.records if 'API down' in r.getMessage()]
+        assert len(records) == 1
+        assert records[0].getMessage() == "ALERT [HIGH] API_ERROR: API down"
+        assert records[0].levelno == logging.ERROR
+    
+    def test_batch_notification_prints_once(self, monitoring_service, capsys):
+        """Test that a batch of alerts produces one console message."""
+        alerts = [
+            Alert(
+                alert_type=AlertType.SYSTEM_ERROR,
+                severity=AlertSeverity.HIGH,
+                message=f"Alert {i}",
+                timestamp=datetime.now()
+            )
+            for i in range(3)
+        ]
+        
+        monitoring_service._dispatch_alerts(alerts)
+        
+        output = capsys.readouterr().out
+        assert output.count("ALERTS (3)") == 1
+        assert all(f"Alert {i}" in output for i in range(3))
+    
     def test_monitoring_loop_updates_metrics(self, monitoring_service):
         """Test that monitoring loop updates metrics."""
         # Start monitoring
@@ -540,6 +844,68 @@ class TestMonitoringService:
         monitoring_service.record_warning()
         
         assert monitoring_service._warning_count == initial_count + 1
+    
+    def test_record_error_from_threads(self, monitoring_service):
+        """Test that concurrent error recording keeps an exact count."""
+        def record():
+            for _ in range(1000):
+                monitoring_service._record_error("test_component", "Test error")
+        
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert next(monitoring_service._error_counter) == 4001
+
+
+class TestRunningMean:
+    """Test RunningMean window."""
+    
+    def test_mean_of_window(self):
+        """Test that the mean covers only the most recent samples."""
+        window = RunningMean(maxlen=3)
+        assert window.mean() == 0.0
+        
+        for value in (1.0, 2.0, 3.0, 10.0):
+            window.append(value)
+        
+        assert len(window) == 3
+        assert list(window) == [2.0, 3.0, 10.0]
+        assert window.mean() == pytest.approx(5.0)
+    
+    def test_percentile(self):
+        """Test the tail percentile of the window."""
+        window = RunningMean(maxlen=100)
+        assert window.percentile(95) == 0.0
+        
+        for value in range(1, 101):
+            window.append(float(value))
+        
+        assert window.percentile(95) == 95.0
+        assert window.percentile(50) == 50.0
+        assert window.percentile(99.5) == 100.0
+        assert window.percentile(100) == 100.0
+        assert window.percentile(0) == 1.0
+    
+    def test_percentile_nearest_rank_small_window(self):
+        """Test nearest-rank percentiles on a window of two samples."""
+        window = RunningMean(maxlen=10)
+        window.append(30.0)
+        window.append(10.0)
+        
+        assert window.percentile(50) == 10.0
+        assert window.percentile(51) == 30.0
+        assert window.percentile(95) == 30.0
+    
+    def test_mean_stays_exact_over_many_samples(self):
+        """Test that long runs do not accumulate drift."""
+        window = RunningMean(maxlen=10)
+        for i in range(10000):
+            window.append(0.1 * (i % 7))
+        
+        assert window.mean() == pytest.approx(sum(window) / len(window), abs=1e-12)
 
 
 class TestAlertDataStructure:
@@ -560,6 +926,27 @@ class TestAlertDataStructure:
         assert alert.message == "Test alert"
         assert not alert.acknowledged
         assert alert.details['value'] == 15.0
+    
+    def test_alert_summary(self):
+        """Test the alert summary used by reports."""
+        alert = Alert(
+            alert_type=AlertType.DRAWDOWN_BREACH,
+            severity=AlertSeverity.HIGH,
+            message="Test alert",
+            timestamp=datetime(2024, 1, 2, 9, 15, 0)
+        )
+        
+        summary = alert.to_summary()
+        
+        assert summary == {
+            'type': 'DRAWDOWN_BREACH',
+            'severity': 'HIGH',
+            'message': 'Test alert',
+            'timestamp': '2024-01-02T09:15:00'
+        }
+        
+        summary['message'] = "Edited"
+        assert alert.to_summary()['message'] == "Test alert"
 
 
 class TestSystemHealthMetrics:
@@ -584,6 +971,26 @@ class TestSystemHealthMetrics:
         assert metrics.cpu_usage == 50.0
         assert metrics.is_healthy
         assert metrics.health_score == 95.0
+    
+    def test_health_metrics_immutable(self):
+        """Test that recorded health metrics cannot be modified."""
+        metrics = SystemHealthMetrics(
+            timestamp=datetime.now(),
+            cpu_usage=50.0,
+            memory_usage=60.0,
+            api_latency_ms=100.0,
+            data_feed_latency_ms=50.0,
+            order_processing_latency_ms=75.0,
+            active_connections=2,
+            error_count=0,
+            warning_count=1,
+            is_healthy=True,
+            health_score=95.0
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            metrics.health_score = 10.0
+        assert not hasattr(metrics, '__dict__')
 
 
 class TestPerformanceSnapshot:
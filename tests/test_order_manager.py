@@ -3,7 +3,9 @@ Unit tests for OrderManager - order lifecycle management.
 """
 
 import pytest
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from unittest.mock import Mock, MagicMock, patch
 
@@ -13,6 +15,9 @@ from kite_auto_trading.services.order_manager import (
     OrderRecord,
     OrderValidationError,
     OrderExecutionError,
+    StripedCounter,
+    COUNTER_STRIPES,
+    STATUS_HISTORY_LIMIT,
 )
 from kite_auto_trading.models.base import (
     Order,
@@ -20,6 +25,8 @@ from kite_auto_trading.models.base import (
     OrderType,
     TransactionType,
     OrderExecutor,
+    PRICED_ORDER_TYPES,
+    TRIGGER_ORDER_TYPES,
 )
 
 
@@ -101,6 +108,33 @@ class TestOrderValidation:
         # Should not raise exception
         order_manager._validate_order(sample_order)
     
+    @pytest.mark.parametrize("order_type", list(OrderType))
+    def test_order_type_checks_match_price_requirements(self, order_manager, order_type):
+        """Test that each order type enforces exactly its price requirements."""
+        def build(price, trigger_price):
+            return Order(
+                instrument="SBIN",
+                transaction_type=TransactionType.BUY,
+                quantity=1,
+                order_type=order_type,
+                price=price,
+                trigger_price=trigger_price
+            )
+        
+        order_manager._validate_order(build(100.0, 101.0))
+        
+        if order_type in PRICED_ORDER_TYPES:
+            with pytest.raises(OrderValidationError, match="Valid price"):
+                order_manager._validate_order(build(None, 101.0))
+        else:
+            order_manager._validate_order(build(None, 101.0))
+        
+        if order_type in TRIGGER_ORDER_TYPES:
+            with pytest.raises(OrderValidationError, match="Valid trigger price"):
+                order_manager._validate_order(build(100.0, None))
+        else:
+            order_manager._validate_order(build(100.0, None))
+    
     def test_valid_limit_order(self, order_manager):
         """Test validation of valid limit order."""
         order = Order(
@@ -201,6 +235,34 @@ class TestOrderValidation:
 class TestOrderSubmission:
     """Test order submission and tracking."""
     
+    def test_order_record_has_no_instance_dict(self, order_manager, sample_order):
+        """Test that order records use slots."""
+        order_id = order_manager.submit_order(sample_order)
+        
+        record = order_manager._orders[order_id]
+        
+        assert not hasattr(record, '__dict__')
+        assert len(record.status_history) == 0
+    
+    def test_getters_do_not_take_lock(self, order_manager, sample_order):
+        """Test that read-only getters work while the lock is held elsewhere."""
+        order_id = order_manager.submit_order(sample_order)
+        results = []
+        
+        with order_manager._lock:
+            reader = threading.Thread(target=lambda: results.extend([
+                order_manager.get_order(order_id),
+                order_manager.get_order_status(order_id),
+                order_manager.get_all_orders(OrderStatus.PENDING),
+            ]))
+            reader.start()
+            reader.join(timeout=2)
+        
+        assert not reader.is_alive()
+        assert results[0] is sample_order
+        assert results[1] == OrderStatus.PENDING
+        assert results[2] == [sample_order]
+    
     def test_submit_order_success(self, order_manager, mock_executor, sample_order):
         """Test successful order submission."""
         order_id = order_manager.submit_order(sample_order)
@@ -210,6 +272,48 @@ class TestOrderSubmission:
         assert order_id in order_manager._orders
         assert order_id in order_manager._pending_orders
     
+    def test_order_id_uses_submission_timestamp(self, order_manager, sample_order):
+        """Test that the generated ID is stamped with the recorded submit time."""
+        order_id = order_manager.submit_order(sample_order)
+        
+        record = order_manager.get_order_record(order_id)
+        
+        assert record.submitted_at == record.updated_at
+        assert order_id.startswith(f"ORD_{record.submitted_at.strftime('%Y%m%d%H%M%S%f')}_")
+    
+    def test_submit_orders_batch(self, order_manager):
+        """Test submitting several orders at once."""
+        orders = [
+            Order(
+                instrument="SBIN",
+                transaction_type=TransactionType.BUY,
+                quantity=10 + i,
+                order_type=OrderType.MARKET
+            )
+            for i in range(5)
+        ]
+        
+        order_ids = order_manager.submit_orders(orders)
+        
+        assert order_ids == [order.order_id for order in orders]
+        assert len(set(order_ids)) == 5
+        assert set(order_ids) <= order_manager._pending_orders
+        assert order_manager._order_queue.qsize() == 5
+    
+    def test_submit_orders_validates_all_first(self, order_manager, sample_order):
+        """Test that one invalid order prevents the whole batch."""
+        invalid_order = Order(
+            instrument="",
+            transaction_type=TransactionType.BUY,
+            quantity=10,
+            order_type=OrderType.MARKET
+        )
+        
+        with pytest.raises(OrderValidationError):
+            order_manager.submit_orders([sample_order, invalid_order])
+        
+        assert order_manager._orders == {}
+    
     def test_submit_order_generates_id(self, order_manager, sample_order):
         """Test that order ID is generated if not provided."""
         assert sample_order.order_id is None
@@ -281,6 +385,38 @@ class TestOrderSubmission:
         # Check order was placed
         assert len(mock_executor.placed_orders) == 1
     
+    def test_failed_execution_schedules_retry_without_blocking(self, order_manager, mock_executor, sample_order):
+        """Test that a failed attempt is parked on the retry heap, not slept on."""
+        order_manager.retry_delay = 30.0
+        order_id = order_manager.submit_order(sample_order)
+        order_manager._order_queue.get_nowait()
+        mock_executor.should_fail = True
+        
+        started = time.monotonic()
+        order_manager._execute_order(order_id)
+        
+        assert time.monotonic() - started < 1.0
+        assert order_manager._order_queue.empty()
+        deadline, queued_id = order_manager._retry_heap[0]
+        assert queued_id == order_id
+        assert 15.0 <= deadline - started <= 30.5
+        
+        assert order_manager._release_due_retries(deadline) is None
+        assert order_manager._order_queue.get_nowait() == order_id
+    
+    def test_retry_backoff_grows_exponentially(self, order_manager):
+        """Test that each further attempt waits at least twice as long."""
+        order_manager.retry_delay = 1.0
+        
+        with patch('kite_auto_trading.services.order_manager.random.uniform', side_effect=lambda a, b: b):
+            with patch('kite_auto_trading.services.order_manager.time.monotonic', return_value=100.0):
+                order_manager._schedule_retry("A", 1)
+                order_manager._schedule_retry("B", 3)
+        
+        assert sorted(order_manager._retry_heap) == [(101.0, "A"), (104.0, "B")]
+        assert order_manager._release_due_retries(102.0) == pytest.approx(2.0)
+        assert order_manager._order_queue.get_nowait() == "A"
+    
     def test_execute_order_max_retries_exceeded(self, order_manager, mock_executor, sample_order):
         """Test order rejection after max retries."""
         order_id = order_manager.submit_order(sample_order)
@@ -443,6 +579,25 @@ class TestOrderCancellation:
         # Try to cancel
         success = order_manager.cancel_order(order_id)
         assert success is False
+    
+    def test_cancel_orders_batch(self, order_manager, mock_executor):
+        """Test cancelling several orders in one call."""
+        order_ids = []
+        for instrument in ["SBIN", "INFY", "TCS"]:
+            order_id = order_manager.submit_order(Order(
+                instrument=instrument,
+                transaction_type=TransactionType.BUY,
+                quantity=10,
+                order_type=OrderType.MARKET
+            ))
+            order_manager._execute_order(order_id)
+            order_ids.append(order_id)
+        
+        results = order_manager.cancel_orders(order_ids + ["INVALID_ID"])
+        
+        assert results == {order_ids[0]: True, order_ids[1]: True, order_ids[2]: True, "INVALID_ID": False}
+        assert len(mock_executor.cancelled_orders) == 3
+        assert order_manager.cancel_orders([]) == {}
 
 
 class TestOrderTracking:
@@ -472,7 +627,19 @@ class TestOrderTracking:
         assert record is not None
         assert record.order.instrument == "SBIN"
         assert record.submitted_at is not None
-        assert isinstance(record.status_history, list)
+        assert isinstance(record.status_history, deque)
+    
+    def test_status_history_is_bounded(self, order_manager, sample_order):
+        """Test that only the most recent status updates are retained."""
+        order_id = order_manager.submit_order(sample_order)
+        
+        for i in range(STATUS_HISTORY_LIMIT + 10):
+            order_manager._update_order_status(order_id, OrderStatus.OPEN, f"update {i}")
+        
+        history = order_manager.get_order_record(order_id).status_history
+        assert len(history) == STATUS_HISTORY_LIMIT
+        assert history[0].message == "update 10"
+        assert history[-1].message == f"update {STATUS_HISTORY_LIMIT + 9}"
     
     def test_get_all_orders(self, order_manager):
         """Test getting all orders."""
@@ -535,6 +702,44 @@ class TestOrderTracking:
         open_orders = order_manager.get_open_orders()
         assert len(open_orders) == 1
         assert open_orders[0].status == OrderStatus.OPEN
+    
+    def test_pending_and_open_counts(self, order_manager, sample_order):
+        """Test that status counters track order transitions."""
+        order_id = order_manager.submit_order(sample_order)
+        assert order_manager.pending_count() == 1
+        assert order_manager.open_count() == 0
+        
+        order_manager._update_order_status(order_id, OrderStatus.OPEN)
+        assert order_manager.pending_count() == 0
+        assert order_manager.open_count() == 1
+        
+        order_manager._update_order_status(order_id, OrderStatus.COMPLETE)
+        assert order_manager.pending_count() == 0
+        assert order_manager.open_count() == 0
+    
+    def test_status_index_follows_transitions(self, order_manager, sample_order):
+        """Test that the status index moves order IDs between statuses."""
+        order_id = order_manager.submit_order(sample_order)
+        assert order_manager._by_status[OrderStatus.PENDING] == {order_id}
+        
+        order_manager._update_order_status(order_id, OrderStatus.OPEN)
+        
+        assert order_manager._by_status[OrderStatus.PENDING] == set()
+        assert order_manager._by_status[OrderStatus.OPEN] == {order_id}
+        assert order_manager.get_pending_orders() == []
+        assert order_manager.get_open_orders() == [sample_order]
+    
+    def test_status_index_uses_internal_id_after_placement(self, order_manager, sample_order):
+        """Test that the status index stays keyed by internal ID once placed."""
+        order_id = order_manager.submit_order(sample_order)
+        order_manager._execute_order(order_id)
+        assert sample_order.order_id != order_id
+        
+        order_manager._update_order_status(order_id, OrderStatus.COMPLETE)
+        
+        assert order_manager._by_status[OrderStatus.OPEN] == set()
+        assert order_manager._by_status[OrderStatus.COMPLETE] == {order_id}
+        assert order_manager.get_all_orders(OrderStatus.COMPLETE) == [sample_order]
 
 
 class TestOrderUpdates:
@@ -590,11 +795,135 @@ class TestOrderUpdates:
         assert len(callback_called) > 0
         assert callback_called[-1].order_id == order_id
         assert callback_called[-1].status == OrderStatus.COMPLETE
+    
+    def test_callback_registered_during_dispatch_waits_for_next_update(self, order_manager, sample_order):
+        """Test that dispatch iterates a snapshot of the registered callbacks."""
+        late_updates = []
+        
+        def registering_callback(update: OrderUpdate):
+            order_manager.register_callback(late_updates.append)
+        
+        order_manager.register_callback(registering_callback)
+        order_id = order_manager.submit_order(sample_order)
+        
+        order_manager._update_order_status(order_id, OrderStatus.OPEN)
+        assert late_updates == []
+        assert isinstance(order_manager._order_callbacks, tuple)
+        
+        order_manager._update_order_status(order_id, OrderStatus.COMPLETE)
+        assert late_updates[0].status == OrderStatus.COMPLETE
+    
+    def test_monitor_collects_only_active_placed_orders(self, order_manager, sample_order):
+        """Test that monitoring skips terminal and not-yet-placed orders."""
+        placed_id = order_manager.submit_order(sample_order)
+        order_manager._execute_order(placed_id)
+        done_id = order_manager.submit_order(Order(
+            instrument="INFY",
+            transaction_type=TransactionType.BUY,
+            quantity=5,
+            order_type=OrderType.MARKET
+        ))
+        order_manager._execute_order(done_id)
+        order_manager._update_order_status(done_id, OrderStatus.COMPLETE)
+        order_manager.submit_order(Order(
+            instrument="TCS",
+            transaction_type=TransactionType.SELL,
+            quantity=1,
+            order_type=OrderType.MARKET
+        ))
+        
+        monitored = order_manager._collect_monitored_orders()
+        
+        assert monitored == [(placed_id, sample_order.order_id, OrderStatus.OPEN)]
+    
+    def test_monitoring_status_change_reuses_message(self, order_manager, sample_order):
+        """Test that monitoring status updates share a precomputed message."""
+        order_id = order_manager.submit_order(sample_order)
+        
+        for _ in range(2):
+            order_manager._handle_status_change(order_id, {'status': OrderStatus.OPEN})
+        
+        first, second = order_manager.get_order_record(order_id).status_history
+        assert first.message == "Status changed to OPEN via monitoring"
+        assert first.message is second.message
+    
+    def test_bulk_status_query_used_for_details(self, order_manager, mock_executor):
+        """Test that monitoring statuses come from one bulk executor call."""
+        mock_executor.get_orders_status = Mock(return_value={
+            "EXC_1": OrderStatus.COMPLETE,
+            "EXC_2": OrderStatus.OPEN,
+        })
+        mock_executor.get_order_status = Mock(side_effect=AssertionError("per-order call"))
+        
+        statuses = order_manager._get_statuses_from_executor(["EXC_1", "EXC_2"])
+        details = order_manager._get_order_details_from_executor("EXC_1", status=statuses.get("EXC_1"))
+        
+        mock_executor.get_orders_status.assert_called_once_with(["EXC_1", "EXC_2"])
+        assert details['status'] == OrderStatus.COMPLETE
+    
+    def test_bulk_status_query_failure_falls_back(self, order_manager, mock_executor):
+        """Test that a failing bulk call falls back to per-order queries."""
+        mock_executor.get_orders_status = Mock(side_effect=Exception("bulk unavailable"))
+        
+        statuses = order_manager._get_statuses_from_executor(["EXC_1"])
+        details = order_manager._get_order_details_from_executor("EXC_1", status=statuses.get("EXC_1"))
+        
+        assert statuses == {}
+        assert details['status'] == OrderStatus.OPEN
+    
+    def test_default_bulk_status_uses_single_queries(self, mock_executor):
+        """Test the OrderExecutor default bulk status implementation."""
+        assert mock_executor.get_orders_status(["EXC_1", "EXC_2"]) == {
+            "EXC_1": OrderStatus.OPEN,
+            "EXC_2": OrderStatus.OPEN,
+        }
+    
+    def test_default_bulk_status_skips_failing_orders(self, mock_executor):
+        """Test that one failing order does not abort the default bulk query."""
+        def get_order_status(order_id):
+            if order_id == "EXC_BAD":
+                raise Exception("Unknown order")
+            return OrderStatus.COMPLETE
+        
+        mock_executor.get_order_status = get_order_status
+        
+        assert mock_executor.get_orders_status(["EXC_1", "EXC_BAD", "EXC_2"]) == {
+            "EXC_1": OrderStatus.COMPLETE,
+            "EXC_2": OrderStatus.COMPLETE,
+        }
 
 
 class TestStatistics:
     """Test order statistics."""
     
+    def test_striped_counter_concurrent_adds(self):
+        """Test that concurrent increments from many threads are all counted."""
+        counter = StripedCounter()
+        
+        def add_many():
+            for _ in range(1000):
+                counter.add()
+        
+        threads = [threading.Thread(target=add_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert counter.value == 8000
+    
+    def test_striped_counter_storage_bounded_by_stripes(self):
+        """Test that short-lived threads do not leave slots behind."""
+        counter = StripedCounter()
+        
+        for _ in range(50):
+            thread = threading.Thread(target=counter.add)
+            thread.start()
+            thread.join()
+        
+        assert counter.value == 50
+        assert len(counter._slots) == COUNTER_STRIPES
+    
     def test_initial_statistics(self, order_manager):
         """Test initial statistics are zero."""
         stats = order_manager.get_statistics()
@@ -669,6 +998,34 @@ class TestQueueProcessing:
         
         manager.shutdown()
     
+    def test_stop_queue_processing_wakes_idle_processor(self, mock_executor):
+        """Test that stopping an idle processor does not wait for the poll timeout."""
+        manager = OrderManager(
+            executor=mock_executor,
+            enable_queue_processing=True
+        )
+        time.sleep(0.1)
+        
+        started = time.monotonic()
+        manager.stop_queue_processing()
+        
+        assert time.monotonic() - started < 0.5
+        assert not manager._queue_processor_thread.is_alive()
+        
+        manager.shutdown()
+    
+    def test_stop_execution_monitoring_wakes_idle_monitor(self, order_manager):
+        """Test that stopping the monitor does not wait out the poll interval."""
+        order_manager._monitoring_interval = 30.0
+        order_manager.start_execution_monitoring()
+        time.sleep(0.1)
+        
+        started = time.monotonic()
+        order_manager.stop_execution_monitoring()
+        
+        assert time.monotonic() - started < 0.5
+        assert not order_manager._monitoring_thread.is_alive()
+    
     def test_queue_processing_executes_orders(self, mock_executor):
         """Test queue processor executes orders automatically."""
         manager = OrderManager(
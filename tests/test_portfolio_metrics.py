@@ -373,6 +373,33 @@ class TestPortfolioMetricsCalculator:
         concentration_alerts = [a for a in alerts if a['type'] == 'CONCENTRATION_BREACH']
         assert len(concentration_alerts) > 0
     
+    def test_evaluate_and_alert_matches_separate_calls(self):
+        """Test that the combined evaluation matches the separate calls."""
+        portfolio = PortfolioManager(initial_capital=100000.0, commission_rate=0.0)
+        calculator = PortfolioMetricsCalculator(portfolio)
+        
+        portfolio.create_snapshot()
+        buy_trade = {
+            'instrument': 'RELIANCE',
+            'transaction_type': TransactionType.BUY,
+            'quantity': 200,
+            'price': 500.0,
+            'timestamp': datetime.now(),
+            'order_id': 'ORDER1',
+            'commission': 0.0,
+            'tax': 0.0,
+        }
+        portfolio.update_position(buy_trade)
+        portfolio.update_market_price('RELIANCE', 425.0)
+        portfolio.create_snapshot()
+        
+        metrics, alerts = calculator.evaluate_and_alert(max_drawdown_pct=10.0)
+        
+        assert metrics == calculator.calculate_performance_metrics()
+        separate = calculator.check_risk_alerts(max_drawdown_pct=10.0)
+        assert [a['type'] for a in alerts] == [a['type'] for a in separate]
+        assert [a['value'] for a in alerts] == [a['value'] for a in separate]
+    
     def test_volatility_calculation(self):
         """Test volatility calculation."""
         portfolio = PortfolioManager(initial_capital=100000.0, commission_rate=0.0)
@@ -272,6 +272,45 @@ class TestAdministrativeInterface:
         assert components['order_manager'] is True
         assert components['strategy_manager'] is True
     
+    def test_get_application_status_cached(self, initialized_app):
+        """Test that application status is cached until invalidated."""
+        app = initialized_app
+        app._status_cache_ttl = 60.0
+        
+        with patch.object(app, 'get_strategy_status', wraps=app.get_strategy_status) as mock_status:
+            app.get_application_status()
+            app.get_application_status()
+            assert mock_status.call_count == 1
+            
+            app._invalidate_status_cache()
+            app.get_application_status()
+            assert mock_status.call_count == 2
+    
+    def test_application_status_tracks_running_changes(self, initialized_app):
+        """Test that a cached status is dropped when running changes."""
+        app = initialized_app
+        app._status_cache_ttl = 60.0
+        
+        app.trigger_emergency_stop("Test")
+        assert app.get_application_status()['running'] is False
+        
+        app.clear_emergency_stop()
+        assert app.get_application_status()['running'] is True
+    
+    def test_application_status_returns_fresh_dict(self, initialized_app):
+        """Test that top-level changes by a caller do not reach the cache."""
+        app = initialized_app
+        app._status_cache_ttl = 60.0
+        
+        status = app.get_application_status()
+        status['running'] = 'modified'
+        del status['components']
+        
+        cached = app.get_application_status()
+        assert cached is not status
+        assert cached['running'] == app.running
+        assert cached['components']['api_client'] is True
+    
     def test_get_performance_report(self, initialized_app):
         """Test getting performance report."""
         app = initialized_app
@@ -239,6 +239,21 @@ class TestTradingSignal:
         assert signal_dict['instrument'] == "INFY"
         assert signal_dict['price'] == 1500.0
         assert signal_dict['signal_type'] == SignalType.ENTRY_LONG.value
+    
+    def test_signal_is_immutable(self):
+        """Test that signals are frozen and slotted."""
+        signal = TradingSignal(
+            signal_type=SignalType.ENTRY_LONG,
+            instrument="INFY",
+            timestamp=datetime.now(),
+            price=1500.0,
+            strength=SignalStrength.STRONG,
+            strategy_name="TestStrategy"
+        )
+        
+        assert not hasattr(signal, '__dict__')
+        with pytest.raises(AttributeError):
+            signal.price = 1600.0
 
 
 class TestStrategyBase: